@@ -5,7 +5,9 @@
 #include "dof-transformations.h"
 #include "math.h"
 #include "mdspan.hpp"
+#include "parallel.h"
 #include "polyset.h"
+#include "profiling.h"
 #include <algorithm>
 #include <array>
 #include <concepts>
@@ -341,11 +343,6 @@ std::pair<std::vector<T>, std::array<std::size_t, 2>> compute_transformation(
   for (int i = 0; i < entity; ++i)
     dofstart += M[tdim][i].extent(0);
 
-  std::size_t total_ndofs = 0;
-  for (int d = 0; d <= 3; ++d)
-    for (std::size_t i = 0; i < M[d].size(); ++i)
-      total_ndofs += M[d][i].extent(0);
-
   // Map the points to reverse the edge, then tabulate at those points
   mdarray_t<T, 2> mapped_pts(pts.extents());
   for (std::size_t p = 0; p < mapped_pts.extent(0); ++p)
@@ -360,57 +357,50 @@ std::pair<std::vector<T>, std::array<std::size_t, 2>> compute_transformation(
       cell_type, ptype, degree, 0,
       mdspan_t<const T, 2>(mapped_pts.data(), mapped_pts.extents()));
   assert(polyset_shape[0] == 1);
-  mdspan_t<const T, 2> polyset_vals(polyset_vals_b.data(), polyset_shape[1],
-                                    polyset_shape[2]);
+  assert(polyset_shape[1] == static_cast<std::size_t>(psize));
 
-  mdarray_t<T, 3> tabulated_data(npts, total_ndofs, vs);
+  // Tabulate the basis functions of the DOFs of the entity, with shape
+  // (ndofs, vs, npts), using a matrix product for each value component
+  std::vector<T> tabulated_data(ndofs * vs * npts);
   for (std::size_t j = 0; j < vs; ++j)
   {
-    mdarray_t<T, 2> result(polyset_vals.extent(1), coeffs.extent(0));
-    for (std::size_t k0 = 0; k0 < coeffs.extent(0); ++k0)
-      for (std::size_t k1 = 0; k1 < polyset_vals.extent(1); ++k1)
-        for (std::size_t k2 = 0; k2 < polyset_vals.extent(0); ++k2)
-          result(k1, k0) += coeffs(k0, k2 + psize * j) * polyset_vals(k2, k1);
-
-    for (std::size_t k0 = 0; k0 < result.extent(0); ++k0)
-      for (std::size_t k1 = 0; k1 < result.extent(1); ++k1)
-        tabulated_data(k0, k1, j) = result(k0, k1);
+    math::impl::gemm_blas<T>(false, false, ndofs, npts, psize, 1,
+                             coeffs.data_handle() + dofstart * coeffs.extent(1)
+                                 + j * psize,
+                             coeffs.extent(1), polyset_vals_b.data(), npts, 0,
+                             tabulated_data.data() + j * npts, vs * npts);
   }
 
-  // Pull back
-  mdarray_t<T, 3> pulled_data(tabulated_data.extents());
-  {
-    mdarray_t<T, 2> temp_data(pulled_data.extent(1), pulled_data.extent(2));
-    for (std::size_t i = 0; i < npts; ++i)
-    {
-      mdspan_t<const T, 2> tab(
-          tabulated_data.data()
-              + i * tabulated_data.extent(1) * tabulated_data.extent(2),
-          tabulated_data.extent(1), tabulated_data.extent(2));
-
-      pull_back(map_type, mdspan_t<T, 2>(temp_data.data(), temp_data.extents()),
-                tab, J, detJ, K);
+  // The pull back is linear in the values, and is the same at every
+  // point, so it is computed once by pulling back the unit vectors.
+  // Row j of pb is the pull back of unit vector j.
+  std::vector<T> identity(vs * vs, 0), pb(vs * vs);
+  for (std::size_t i = 0; i < vs; ++i)
+    identity[i * vs + i] = 1;
+  pull_back(map_type, mdspan_t<T, 2>(pb.data(), vs, vs),
+            mdspan_t<const T, 2>(identity.data(), vs, vs), J, detJ, K);
 
-      for (std::size_t k0 = 0; k0 < temp_data.extent(0); ++k0)
-        for (std::size_t k1 = 0; k1 < temp_data.extent(1); ++k1)
-          pulled_data(i, k0, k1) = temp_data(k0, k1);
-    }
-  }
+  // Combine the pull back with the interpolation matrix (summed over
+  // derivatives): W(k0, j, k2) = sum_{i,d} pb(j, i) imat(k0, i, k2, d)
+  std::vector<T> Wb(ndofs * vs * npts, 0);
+  mdspan_t<T, 3> W(Wb.data(), ndofs, vs, npts);
+  for (std::size_t k0 = 0; k0 < ndofs; ++k0)
+    for (std::size_t i = 0; i < vs; ++i)
+      for (std::size_t k2 = 0; k2 < npts; ++k2)
+      {
+        T m = 0;
+        for (std::size_t d = 0; d < imat.extent(3); ++d)
+          m += imat(k0, i, k2, d);
+        for (std::size_t j = 0; j < vs; ++j)
+          W(k0, j, k2) += pb[j * vs + i] * m;
+      }
 
-  // Interpolate to calculate coefficients
+  // Interpolate to calculate coefficients: transform = tabulated_data W^T
   std::vector<T> transformb(ndofs * ndofs);
   mdspan_t<T, 2> transform(transformb.data(), ndofs, ndofs);
-  for (std::size_t d = 0; d < imat.extent(3); ++d)
-  {
-    for (std::size_t i = 0; i < vs; ++i)
-    {
-      for (std::size_t k0 = 0; k0 < transform.extent(1); ++k0)
-        for (std::size_t k1 = 0; k1 < transform.extent(0); ++k1)
-          for (std::size_t k2 = 0; k2 < imat.extent(2); ++k2)
-            transform(k1, k0)
-                += imat(k0, i, k2, d) * pulled_data(k2, k1 + dofstart, i);
-    }
-  }
+  math::impl::gemm_blas<T>(false, true, ndofs, ndofs, vs * npts, 1,
+                           tabulated_data.data(), vs * npts, Wb.data(),
+                           vs * npts, 0, transformb.data(), ndofs);
 
   return {std::move(transformb), {transform.extent(0), transform.extent(1)}};
 }
@@ -433,9 +423,38 @@ doftransforms::compute_entity_transformations(
         coeffs,
     int degree, std::size_t vs, maps::type map_type, polyset::type ptype)
 {
+  profiling::timer timer("doftransforms::compute_entity_transformations");
+  const mapinfo_t<T> mapinfo = get_mapinfo<T>(cell_type);
+
+  // The transformations of each type of sub-entity are independent, so
+  // are computed as concurrent tasks
+  std::vector<std::function<void()>> tasks;
+  std::vector<std::vector<std::vector<T>>> transforms;
+  transforms.reserve(mapinfo.size());
+  for (auto& [entity_type, emap_data] : mapinfo)
+  {
+    const int tdim = cell::topological_dimension(entity_type);
+    const int entity = find_first_subentity(cell_type, entity_type);
+    const std::size_t e = transforms.size();
+    transforms.emplace_back(emap_data.size());
+    for (std::size_t i = 0; i < emap_data.size(); ++i)
+    {
+      tasks.push_back(
+          [&, tdim, entity, e, i, data = &emap_data[i]]()
+          {
+            auto& [mapfn, J, detJ, K] = *data;
+            transforms[e][i] = compute_transformation(
+                                   cell_type, x, M, coeffs, J, detJ, K, mapfn,
+                                   degree, tdim, entity, vs, map_type, ptype)
+                                   .first;
+          });
+    }
+  }
+  parallel::run_tasks(tasks);
+
   std::map<cell::type, std::pair<std::vector<T>, std::array<std::size_t, 3>>>
       out;
-  const mapinfo_t<T> mapinfo = get_mapinfo<T>(cell_type);
+  std::size_t e = 0;
   for (auto& [entity_type, emap_data] : mapinfo)
   {
     const int tdim = cell::topological_dimension(entity_type);
@@ -444,13 +463,8 @@ doftransforms::compute_entity_transformations(
 
     std::vector<T> transform;
     transform.reserve(emap_data.size() * ndofs * ndofs);
-    for (auto& [mapfn, J, detJ, K] : emap_data)
-    {
-      auto [t2b, _]
-          = compute_transformation(cell_type, x, M, coeffs, J, detJ, K, mapfn,
-                                   degree, tdim, entity, vs, map_type, ptype);
+    for (auto& t2b : transforms[e++])
       transform.insert(transform.end(), t2b.begin(), t2b.end());
-    }
 
     out.try_emplace(entity_type,
                     std::pair(std::move(transform),
@@ -7,10 +7,12 @@
 #include "element-families.h"
 #include "maps.h"
 #include "math.h"
+#include "parallel.h"
 #include "polyset.h"
 #include "quadrature.h"
 #include "sobolev-spaces.h"
 #include <cmath>
+#include <functional>
 
 using namespace basix;
 
@@ -60,6 +62,10 @@ FiniteElement<T> basix::element::create_hhj(cell::type celltype, int degree,
     M[0].emplace_back(0, tdim * tdim, 0, 1);
   }
 
+  // The entities are independent, so their moments are created as
+  // concurrent tasks
+  std::vector<std::function<void()>> tasks;
+
   // Loop over edge and higher dimension entities
   for (std::size_t d = 1; d < topology.size(); ++d)
   {
@@ -74,93 +80,107 @@ FiniteElement<T> basix::element::create_hhj(cell::type celltype, int degree,
     else
     {
 
-      // Loop over entities of dimension dim
+      // The moments on each entity are created by a separate task
+      x[d].resize(topology[d].size());
+      M[d].resize(topology[d].size());
       for (std::size_t e = 0; e < topology[d].size(); ++e)
       {
-        // Entity coordinates
-        const auto [entity_x_buffer, eshape]
-            = cell::sub_entity_geometry<T>(celltype, d, e);
-        std::span<const T> x0(entity_x_buffer.data(), eshape[1]);
-        impl::mdspan_t<const T, 2> entity_x(entity_x_buffer.data(), eshape);
-
-        // Tabulate points in lattice
-        cell::type ct = cell::sub_entity_type(celltype, d, e);
-
-        const std::size_t ndofs
-            = polyset::dim(ct, polyset::type::standard, degree + 1 - d);
-        const auto [ptsbuffer, wts] = quadrature::make_quadrature<T>(
-            quadrature::type::Default, ct, polyset::type::standard,
-            degree + (degree + 1 - d));
-        impl::mdspan_t<const T, 2> pts(ptsbuffer.data(), wts.size(),
-                                       ptsbuffer.size() / wts.size());
-
-        FiniteElement<T> moment_space = create_lagrange<T>(
-            ct, degree + 1 - d, element::lagrange_variant::legendre, true);
-        const auto [phib, phishape] = moment_space.tabulate(0, pts);
-        impl::mdspan_t<const T, 4> moment_values(phib.data(), phishape);
-
-        auto& _x = x[d].emplace_back(pts.extent(0), tdim);
-
-        // Copy points
-        for (std::size_t p = 0; p < pts.extent(0); ++p)
-        {
-          for (std::size_t k = 0; k < _x.extent(1); ++k)
-            _x(p, k) = x0[k];
-
-          for (std::size_t k0 = 0; k0 < entity_x.extent(0) - 1; ++k0)
-            for (std::size_t k1 = 0; k1 < _x.extent(1); ++k1)
-              _x(p, k1) += (entity_x(k0 + 1, k1) - x0[k1]) * pts(p, k0);
-        }
-
-        // Store up outer(t, t) for all tangents
-        const std::vector<int>& vert_ids = topology[d][e];
-        const std::size_t ntangents = d * (d + 1) / 2;
-        impl::mdarray_t<T, 3> vvt(ntangents, geometry.extent(1),
-                                  geometry.extent(1));
-        std::vector<T> edge_t(geometry.extent(1));
-        int c = 0;
-        for (std::size_t s = 0; s < d; ++s)
-        {
-          for (std::size_t r = s + 1; r < d + 1; ++r)
-          {
-            if (geometry.extent(1) != 2)
-              throw std::runtime_error("Not implemented");
-            edge_t[0] = geometry(vert_ids[s], 1) - geometry(vert_ids[r], 1);
-            edge_t[1] = geometry(vert_ids[r], 0) - geometry(vert_ids[s], 0);
-
-            // outer product v.v^T
-            const auto [result, shape] = math::outer(edge_t, edge_t);
-            for (std::size_t k0 = 0; k0 < shape[0]; ++k0)
-              for (std::size_t k1 = 0; k1 < shape[1]; ++k1)
-                vvt(c, k0, k1) = result[k0 * shape[1] + k1];
-            ++c;
-          }
-        }
-
-        auto& _M = M[d].emplace_back(ndofs * ntangents, tdim * tdim,
-                                     pts.extent(0), 1);
-        for (int n = 0; n < moment_space.dim(); ++n)
-        {
-          for (std::size_t j = 0; j < ntangents; ++j)
-          {
-            std::vector<T> vvt_flat;
-            for (std::size_t k0 = 0; k0 < vvt.extent(1); ++k0)
-              for (std::size_t k1 = 0; k1 < vvt.extent(2); ++k1)
-                vvt_flat.push_back(vvt(j, k0, k1));
-            for (std::size_t q = 0; q < pts.extent(0); ++q)
+        tasks.push_back(
+            [&, d, e]()
             {
-              for (std::size_t i = 0; i < tdim * tdim; ++i)
+              // Entity coordinates
+              const auto [entity_x_buffer, eshape]
+                  = cell::sub_entity_geometry<T>(celltype, d, e);
+              std::span<const T> x0(entity_x_buffer.data(), eshape[1]);
+              impl::mdspan_t<const T, 2> entity_x(entity_x_buffer.data(),
+                                                  eshape);
+
+              // Tabulate points in lattice
+              cell::type ct = cell::sub_entity_type(celltype, d, e);
+
+              const std::size_t ndofs
+                  = polyset::dim(ct, polyset::type::standard, degree + 1 - d);
+              const auto [ptsbuffer, wts] = quadrature::make_quadrature<T>(
+                  quadrature::type::Default, ct, polyset::type::standard,
+                  degree + (degree + 1 - d));
+              impl::mdspan_t<const T, 2> pts(ptsbuffer.data(), wts.size(),
+                                             ptsbuffer.size() / wts.size());
+
+              FiniteElement<T> moment_space = create_lagrange<T>(
+                  ct, degree + 1 - d, element::lagrange_variant::legendre,
+                  true);
+              const auto [phib, phishape] = moment_space.tabulate(0, pts);
+              impl::mdspan_t<const T, 4> moment_values(phib.data(), phishape);
+
+              x[d][e] = impl::mdarray_t<T, 2>(pts.extent(0), tdim);
+              auto& _x = x[d][e];
+
+              // Copy points
+              for (std::size_t p = 0; p < pts.extent(0); ++p)
+              {
+                for (std::size_t k = 0; k < _x.extent(1); ++k)
+                  _x(p, k) = x0[k];
+
+                for (std::size_t k0 = 0; k0 < entity_x.extent(0) - 1; ++k0)
+                  for (std::size_t k1 = 0; k1 < _x.extent(1); ++k1)
+                    _x(p, k1) += (entity_x(k0 + 1, k1) - x0[k1]) * pts(p, k0);
+              }
+
+              // Store up outer(t, t) for all tangents
+              const std::vector<int>& vert_ids = topology[d][e];
+              const std::size_t ntangents = d * (d + 1) / 2;
+              impl::mdarray_t<T, 3> vvt(ntangents, geometry.extent(1),
+                                        geometry.extent(1));
+              std::vector<T> edge_t(geometry.extent(1));
+              int c = 0;
+              for (std::size_t s = 0; s < d; ++s)
               {
-                _M(n * ntangents + j, i, q, 0)
-                    = vvt_flat[i] * wts[q] * moment_values(0, q, n, 0);
+                for (std::size_t r = s + 1; r < d + 1; ++r)
+                {
+                  if (geometry.extent(1) != 2)
+                    throw std::runtime_error("Not implemented");
+                  edge_t[0]
+                      = geometry(vert_ids[s], 1) - geometry(vert_ids[r], 1);
+                  edge_t[1]
+                      = geometry(vert_ids[r], 0) - geometry(vert_ids[s], 0);
+
+                  // outer product v.v^T
+                  const auto [result, shape] = math::outer(edge_t, edge_t);
+                  for (std::size_t k0 = 0; k0 < shape[0]; ++k0)
+                    for (std::size_t k1 = 0; k1 < shape[1]; ++k1)
+                      vvt(c, k0, k1) = result[k0 * shape[1] + k1];
+                  ++c;
+                }
               }
-            }
-          }
-        }
+
+              M[d][e] = impl::mdarray_t<T, 4>(ndofs * ntangents, tdim * tdim,
+                                              pts.extent(0), 1);
+              auto& _M = M[d][e];
+              for (int n = 0; n < moment_space.dim(); ++n)
+              {
+                for (std::size_t j = 0; j < ntangents; ++j)
+                {
+                  std::vector<T> vvt_flat;
+                  for (std::size_t k0 = 0; k0 < vvt.extent(1); ++k0)
+                    for (std::size_t k1 = 0; k1 < vvt.extent(2); ++k1)
+                      vvt_flat.push_back(vvt(j, k0, k1));
+                  for (std::size_t q = 0; q < pts.extent(0); ++q)
+                  {
+                    for (std::size_t i = 0; i < tdim * tdim; ++i)
+                    {
+                      _M(n * ntangents + j, i, q, 0)
+                          = vvt_flat[i] * wts[q] * moment_values(0, q, n, 0);
+                    }
+                  }
+                }
+              }
+            });
       }
     }
   }
 
+  parallel::run_tasks(tasks);
+
   std::array<std::vector<impl::mdspan_t<const T, 2>>, 4> xview
       = impl::to_mdspan(x);
   std::array<std::vector<impl::mdspan_t<const T, 4>>, 4> Mview
@@ -10,11 +10,13 @@
 #include "math.h"
 #include "mdspan.hpp"
 #include "moments.h"
+#include "parallel.h"
 #include "polyset.h"
 #include "quadrature.h"
 #include "sobolev-spaces.h"
 #include <array>
 #include <concepts>
+#include <functional>
 #include <vector>
 
 using namespace basix;
@@ -175,6 +177,9 @@ FiniteElement<T> element::create_nedelec(cell::type celltype, int degree,
   if (degree < 1)
     throw std::runtime_error("Degree must be at least 1");
 
+  if (celltype != cell::type::triangle and celltype != cell::type::tetrahedron)
+    throw std::runtime_error("Invalid celltype in Nedelec");
+
   const std::size_t tdim = cell::topological_dimension(celltype);
 
   std::array<std::vector<impl::mdarray_t<T, 2>>, 4> x;
@@ -186,89 +191,115 @@ FiniteElement<T> element::create_nedelec(cell::type celltype, int degree,
     M[0] = std::vector(num_ent, impl::mdarray_t<T, 4>(0, tdim, 0, 1));
   }
 
+  // The polynomial space and the moments on each type of sub-entity are
+  // independent, so are created as concurrent tasks
+  std::vector<std::function<void()>> tasks;
+
   std::vector<T> wcoeffs;
   std::array<std::size_t, 2> wshape;
-  switch (celltype)
-  {
-  case cell::type::triangle:
-  {
-    impl::mdarray_t<T, 2> w = create_nedelec_2d_space<T>(degree);
-    wshape = {w.extent(0), w.extent(1)};
-    wcoeffs.resize(wshape[0] * wshape[1]);
-    std::copy_n(w.data(), w.size(), wcoeffs.data());
-    break;
-  }
-  case cell::type::tetrahedron:
-  {
-    impl::mdarray_t<T, 2> w = create_nedelec_3d_space<T>(degree);
-    wshape = {w.extent(0), w.extent(1)};
-    wcoeffs.resize(wshape[0] * wshape[1]);
-    std::copy_n(w.data(), w.size(), wcoeffs.data());
-    break;
-  }
-  default:
-    throw std::runtime_error("Invalid celltype in Nedelec");
-  }
+  tasks.push_back(
+      [&]()
+      {
+        switch (celltype)
+        {
+        case cell::type::triangle:
+        {
+          impl::mdarray_t<T, 2> w = create_nedelec_2d_space<T>(degree);
+          wshape = {w.extent(0), w.extent(1)};
+          wcoeffs.resize(wshape[0] * wshape[1]);
+          std::copy_n(w.data(), w.size(), wcoeffs.data());
+          break;
+        }
+        case cell::type::tetrahedron:
+        {
+          impl::mdarray_t<T, 2> w = create_nedelec_3d_space<T>(degree);
+          wshape = {w.extent(0), w.extent(1)};
+          wcoeffs.resize(wshape[0] * wshape[1]);
+          std::copy_n(w.data(), w.size(), wcoeffs.data());
+          break;
+        }
+        default:
+          throw std::runtime_error("Invalid celltype in Nedelec");
+        }
+      });
 
   // Integral representation for the boundary (edge) dofs
-  {
-    FiniteElement edge_space = element::create_lagrange<T>(
-        cell::type::interval, degree - 1, lvariant, true);
-    auto [_x, xshape, _M, Mshape] = moments::make_tangent_integral_moments<T>(
-        edge_space, celltype, polyset::type::standard, tdim, 2 * degree - 1);
-    assert(_x.size() == _M.size());
-    for (std::size_t i = 0; i < _x.size(); ++i)
-    {
-      x[1].emplace_back(_x[i], xshape[0], xshape[1]);
-      M[1].emplace_back(_M[i], Mshape[0], Mshape[1], Mshape[2], Mshape[3]);
-    }
-  }
+  tasks.push_back(
+      [&]()
+      {
+        FiniteElement edge_space = element::create_lagrange<T>(
+            cell::type::interval, degree - 1, lvariant, true);
+        auto [_x, xshape, _M, Mshape]
+            = moments::make_tangent_integral_moments<T>(edge_space, celltype,
+                                                        polyset::type::standard,
+                                                        tdim, 2 * degree - 1);
+        assert(_x.size() == _M.size());
+        for (std::size_t i = 0; i < _x.size(); ++i)
+        {
+          x[1].emplace_back(_x[i], xshape[0], xshape[1]);
+          M[1].emplace_back(_M[i], Mshape[0], Mshape[1], Mshape[2], Mshape[3]);
+        }
+      });
 
   // Face dofs
-  if (degree > 1)
-  {
-    FiniteElement face_space = element::create_lagrange<T>(
-        cell::type::triangle, degree - 2, lvariant, true);
-    auto [_x, xshape, _M, Mshape] = moments::make_integral_moments<T>(
-        face_space, celltype, polyset::type::standard, tdim, 2 * degree - 2);
-    assert(_x.size() == _M.size());
-    for (std::size_t i = 0; i < _x.size(); ++i)
-    {
-      x[2].emplace_back(_x[i], xshape[0], xshape[1]);
-      M[2].emplace_back(_M[i], Mshape[0], Mshape[1], Mshape[2], Mshape[3]);
-    }
-  }
-  else
-  {
-    const std::size_t num_ent = cell::num_sub_entities(celltype, 2);
-    x[2] = std::vector(num_ent, impl::mdarray_t<T, 2>(0, tdim));
-    M[2] = std::vector(num_ent, impl::mdarray_t<T, 4>(0, tdim, 0, 1));
-  }
+  tasks.push_back(
+      [&]()
+      {
+        if (degree > 1)
+        {
+          FiniteElement face_space = element::create_lagrange<T>(
+              cell::type::triangle, degree - 2, lvariant, true);
+          auto [_x, xshape, _M, Mshape] = moments::make_integral_moments<T>(
+              face_space, celltype, polyset::type::standard, tdim,
+              2 * degree - 2);
+          assert(_x.size() == _M.size());
+          for (std::size_t i = 0; i < _x.size(); ++i)
+          {
+            x[2].emplace_back(_x[i], xshape[0], xshape[1]);
+            M[2].emplace_back(_M[i], Mshape[0], Mshape[1], Mshape[2],
+                              Mshape[3]);
+          }
+        }
+        else
+        {
+          const std::size_t num_ent = cell::num_sub_entities(celltype, 2);
+          x[2] = std::vector(num_ent, impl::mdarray_t<T, 2>(0, tdim));
+          M[2] = std::vector(num_ent, impl::mdarray_t<T, 4>(0, tdim, 0, 1));
+        }
+      });
 
   // Volume dofs
   if (tdim == 3)
   {
-    if (degree > 2 and tdim == 3)
-    {
-      auto [_x, xshape, _M, Mshape] = moments::make_integral_moments<T>(
-          element::create_lagrange<T>(cell::type::tetrahedron, degree - 3,
-                                      lvariant, true),
-          cell::type::tetrahedron, polyset::type::standard, 3, 2 * degree - 3);
-      assert(_x.size() == _M.size());
-      for (std::size_t i = 0; i < _x.size(); ++i)
-      {
-        x[3].emplace_back(_x[i], xshape[0], xshape[1]);
-        M[3].emplace_back(_M[i], Mshape[0], Mshape[1], Mshape[2], Mshape[3]);
-      }
-    }
-    else
-    {
-      const std::size_t num_ent = cell::num_sub_entities(celltype, 3);
-      x[3] = std::vector(num_ent, impl::mdarray_t<T, 2>(0, tdim));
-      M[3] = std::vector(num_ent, impl::mdarray_t<T, 4>(0, tdim, 0, 1));
-    }
+    tasks.push_back(
+        [&]()
+        {
+          if (degree > 2)
+          {
+            auto [_x, xshape, _M, Mshape] = moments::make_integral_moments<T>(
+                element::create_lagrange<T>(cell::type::tetrahedron, degree - 3,
+                                            lvariant, true),
+                cell::type::tetrahedron, polyset::type::standard, 3,
+                2 * degree - 3);
+            assert(_x.size() == _M.size());
+            for (std::size_t i = 0; i < _x.size(); ++i)
+            {
+              x[3].emplace_back(_x[i], xshape[0], xshape[1]);
+              M[3].emplace_back(_M[i], Mshape[0], Mshape[1], Mshape[2],
+                                Mshape[3]);
+            }
+          }
+          else
+          {
+            const std::size_t num_ent = cell::num_sub_entities(celltype, 3);
+            x[3] = std::vector(num_ent, impl::mdarray_t<T, 2>(0, tdim));
+            M[3] = std::vector(num_ent, impl::mdarray_t<T, 4>(0, tdim, 0, 1));
+          }
+        });
   }
 
+  parallel::run_tasks(tasks);
+
   std::array<std::vector<mdspan_t<const T, 2>>, 4> xview = impl::to_mdspan(x);
   std::array<std::vector<mdspan_t<const T, 4>>, 4> Mview = impl::to_mdspan(M);
   std::array<std::vector<std::vector<T>>, 4> xbuffer;
@@ -314,65 +345,86 @@ FiniteElement<T> element::create_nedelec2(cell::type celltype, int degree,
     M[0] = std::vector(num_ent, impl::mdarray_t<T, 4>(0, tdim, 0, 1));
   }
 
-  // Integral representation for the edge dofs
+  // The moments on each type of sub-entity are independent, so are
+  // created as concurrent tasks
+  std::vector<std::function<void()>> tasks;
 
-  {
-    FiniteElement edge_space = element::create_lagrange<T>(
-        cell::type::interval, degree, lvariant, true);
-    auto [_x, xshape, _M, Mshape] = moments::make_tangent_integral_moments<T>(
-        edge_space, celltype, polyset::type::standard, tdim, 2 * degree);
-    assert(_x.size() == _M.size());
-    for (std::size_t i = 0; i < _x.size(); ++i)
-    {
-      x[1].emplace_back(_x[i], xshape[0], xshape[1]);
-      M[1].emplace_back(_M[i], Mshape[0], Mshape[1], Mshape[2], Mshape[3]);
-    }
-  }
-
-  if (degree > 1)
-  {
-    // Integral moments on faces
-    FiniteElement face_space = element::create_rt<T>(
-        cell::type::triangle, degree - 1, lvariant, true);
-    auto [_x, xshape, _M, Mshape] = moments::make_dot_integral_moments<T>(
-        face_space, celltype, polyset::type::standard, tdim, 2 * degree - 1);
-    assert(_x.size() == _M.size());
-    for (std::size_t i = 0; i < _x.size(); ++i)
-    {
-      x[2].emplace_back(_x[i], xshape[0], xshape[1]);
-      M[2].emplace_back(_M[i], Mshape[0], Mshape[1], Mshape[2], Mshape[3]);
-    }
-  }
-  else
-  {
-    const std::size_t num_ent = cell::num_sub_entities(celltype, 2);
-    x[2] = std::vector(num_ent, impl::mdarray_t<T, 2>(0, tdim));
-    M[2] = std::vector(num_ent, impl::mdarray_t<T, 4>(0, tdim, 0, 1));
-  }
+  // Integral representation for the edge dofs
+  tasks.push_back(
+      [&]()
+      {
+        FiniteElement edge_space = element::create_lagrange<T>(
+            cell::type::interval, degree, lvariant, true);
+        auto [_x, xshape, _M, Mshape]
+            = moments::make_tangent_integral_moments<T>(edge_space, celltype,
+                                                        polyset::type::standard,
+                                                        tdim, 2 * degree);
+        assert(_x.size() == _M.size());
+        for (std::size_t i = 0; i < _x.size(); ++i)
+        {
+          x[1].emplace_back(_x[i], xshape[0], xshape[1]);
+          M[1].emplace_back(_M[i], Mshape[0], Mshape[1], Mshape[2], Mshape[3]);
+        }
+      });
+
+  // Integral moments on faces
+  tasks.push_back(
+      [&]()
+      {
+        if (degree > 1)
+        {
+          FiniteElement face_space = element::create_rt<T>(
+              cell::type::triangle, degree - 1, lvariant, true);
+          auto [_x, xshape, _M, Mshape] = moments::make_dot_integral_moments<T>(
+              face_space, celltype, polyset::type::standard, tdim,
+              2 * degree - 1);
+          assert(_x.size() == _M.size());
+          for (std::size_t i = 0; i < _x.size(); ++i)
+          {
+            x[2].emplace_back(_x[i], xshape[0], xshape[1]);
+            M[2].emplace_back(_M[i], Mshape[0], Mshape[1], Mshape[2],
+                              Mshape[3]);
+          }
+        }
+        else
+        {
+          const std::size_t num_ent = cell::num_sub_entities(celltype, 2);
+          x[2] = std::vector(num_ent, impl::mdarray_t<T, 2>(0, tdim));
+          M[2] = std::vector(num_ent, impl::mdarray_t<T, 4>(0, tdim, 0, 1));
+        }
+      });
 
   if (tdim == 3)
   {
-    if (degree > 2)
-    {
-      auto [_x, xshape, _M, Mshape] = moments::make_dot_integral_moments<T>(
-          element::create_rt<T>(cell::type::tetrahedron, degree - 2, lvariant,
-                                true),
-          celltype, polyset::type::standard, tdim, 2 * degree - 2);
-      assert(_x.size() == _M.size());
-      for (std::size_t i = 0; i < _x.size(); ++i)
-      {
-        x[3].emplace_back(_x[i], xshape[0], xshape[1]);
-        M[3].emplace_back(_M[i], Mshape[0], Mshape[1], Mshape[2], Mshape[3]);
-      }
-    }
-    else
-    {
-      const std::size_t num_ent = cell::num_sub_entities(celltype, 3);
-      x[3] = std::vector(num_ent, impl::mdarray_t<T, 2>(0, tdim));
-      M[3] = std::vector(num_ent, impl::mdarray_t<T, 4>(0, tdim, 0, 1));
-    }
+    tasks.push_back(
+        [&]()
+        {
+          if (degree > 2)
+          {
+            auto [_x, xshape, _M, Mshape]
+                = moments::make_dot_integral_moments<T>(
+                    element::create_rt<T>(cell::type::tetrahedron, degree - 2,
+                                          lvariant, true),
+                    celltype, polyset::type::standard, tdim, 2 * degree - 2);
+            assert(_x.size() == _M.size());
+            for (std::size_t i = 0; i < _x.size(); ++i)
+            {
+              x[3].emplace_back(_x[i], xshape[0], xshape[1]);
+              M[3].emplace_back(_M[i], Mshape[0], Mshape[1], Mshape[2],
+                                Mshape[3]);
+            }
+          }
+          else
+          {
+            const std::size_t num_ent = cell::num_sub_entities(celltype, 3);
+            x[3] = std::vector(num_ent, impl::mdarray_t<T, 2>(0, tdim));
+            M[3] = std::vector(num_ent, impl::mdarray_t<T, 4>(0, tdim, 0, 1));
+          }
+        });
   }
 
+  parallel::run_tasks(tasks);
+
   std::array<std::vector<mdspan_t<const T, 2>>, 4> xview = impl::to_mdspan(x);
   std::array<std::vector<mdspan_t<const T, 4>>, 4> Mview = impl::to_mdspan(M);
   std::array<std::vector<std::vector<T>>, 4> xbuffer;
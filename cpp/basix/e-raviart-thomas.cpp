@@ -8,10 +8,12 @@
 #include "maps.h"
 #include "math.h"
 #include "moments.h"
+#include "parallel.h"
 #include "polyset.h"
 #include "quadrature.h"
 #include "sobolev-spaces.h"
 #include <cmath>
+#include <functional>
 #include <vector>
 
 using namespace basix;
@@ -45,44 +47,6 @@ FiniteElement<T> basix::element::create_rt(cell::type celltype, int degree,
   const std::size_t ns
       = polyset::dim(facettype, polyset::type::standard, degree - 1);
 
-  // Evaluate the expansion polynomials at the quadrature points
-  const auto [_pts, wts] = quadrature::make_quadrature<T>(
-      quadrature::type::Default, celltype, polyset::type::standard, 2 * degree);
-  impl::mdspan_t<const T, 2> pts(_pts.data(), wts.size(),
-                                 _pts.size() / wts.size());
-  const auto [_phi, shape]
-      = polyset::tabulate(celltype, polyset::type::standard, degree, 0, pts);
-  impl::mdspan_t<const T, 3> phi(_phi.data(), shape);
-
-  // The number of order (degree) polynomials
-  const std::size_t psize = phi.extent(1);
-
-  // Create coefficients for order (degree-1) vector polynomials
-  impl::mdarray_t<T, 2> B(nv * tdim + ns, psize * tdim);
-  for (std::size_t i = 0; i < tdim; ++i)
-    for (std::size_t j = 0; j < nv; ++j)
-      B(nv * i + j, psize * i + j) = 1.0;
-
-  // Create coefficients for additional polynomials in Raviart-Thomas
-  // polynomial basis
-  for (std::size_t i = 0; i < ns; ++i)
-  {
-    for (std::size_t k = nv; k < psize; ++k)
-    {
-      for (std::size_t j = 0; j < tdim; ++j)
-      {
-        B(nv * tdim + i, k + psize * j) = 0.0;
-        for (std::size_t k1 = 0; k1 < wts.size(); ++k1)
-        {
-          B(nv * tdim + i, k + psize * j)
-              += wts[k1] * phi(0, ns0 + i, k1) * pts(k1, j) * phi(0, k, k1);
-        }
-      }
-    }
-  }
-
-  math::orthogonalise<T>(B, nv * tdim);
-
   std::array<std::vector<impl::mdarray_t<T, 2>>, 4> x;
   std::array<std::vector<impl::mdarray_t<T, 4>>, 4> M;
   for (std::size_t i = 0; i < tdim - 1; ++i)
@@ -92,42 +56,99 @@ FiniteElement<T> basix::element::create_rt(cell::type celltype, int degree,
     M[i] = std::vector(num_ent, impl::mdarray_t<T, 4>(0, tdim, 0, 1));
   }
 
+  // The polynomial space and the moments on the facets and interior
+  // are independent, so are created as concurrent tasks
+  std::vector<std::function<void()>> tasks;
+
+  impl::mdarray_t<T, 2> B;
+  tasks.push_back(
+      [&]()
+      {
+        // Evaluate the expansion polynomials at the quadrature points
+        const auto [_pts, wts] = quadrature::make_quadrature<T>(
+            quadrature::type::Default, celltype, polyset::type::standard,
+            2 * degree);
+        impl::mdspan_t<const T, 2> pts(_pts.data(), wts.size(),
+                                       _pts.size() / wts.size());
+        const auto [_phi, shape] = polyset::tabulate(
+            celltype, polyset::type::standard, degree, 0, pts);
+        impl::mdspan_t<const T, 3> phi(_phi.data(), shape);
+
+        // The number of order (degree) polynomials
+        const std::size_t psize = phi.extent(1);
+
+        // Create coefficients for order (degree-1) vector polynomials
+        B = impl::mdarray_t<T, 2>(nv * tdim + ns, psize * tdim);
+        for (std::size_t i = 0; i < tdim; ++i)
+          for (std::size_t j = 0; j < nv; ++j)
+            B(nv * i + j, psize * i + j) = 1.0;
+
+        // Create coefficients for additional polynomials in Raviart-Thomas
+        // polynomial basis
+        for (std::size_t i = 0; i < ns; ++i)
+        {
+          for (std::size_t k = nv; k < psize; ++k)
+          {
+            for (std::size_t j = 0; j < tdim; ++j)
+            {
+              B(nv * tdim + i, k + psize * j) = 0.0;
+              for (std::size_t k1 = 0; k1 < wts.size(); ++k1)
+              {
+                B(nv * tdim + i, k + psize * j) += wts[k1] * phi(0, ns0 + i, k1)
+                                                   * pts(k1, j) * phi(0, k, k1);
+              }
+            }
+          }
+        }
+
+        math::orthogonalise<T>(B, nv * tdim);
+      });
+
   // Add integral moments on facets
-  {
-    const FiniteElement facet_moment_space
-        = element::create_lagrange<T>(facettype, degree - 1, lvariant, true);
-    auto [_x, xshape, _M, Mshape] = moments::make_normal_integral_moments<T>(
-        facet_moment_space, celltype, polyset::type::standard, tdim,
-        2 * degree - 1);
-    assert(_x.size() == _M.size());
-    for (std::size_t i = 0; i < _x.size(); ++i)
-    {
-      x[tdim - 1].emplace_back(_x[i], xshape[0], xshape[1]);
-      M[tdim - 1].emplace_back(_M[i], Mshape[0], Mshape[1], Mshape[2],
-                               Mshape[3]);
-    }
-  }
+  tasks.push_back(
+      [&]()
+      {
+        const FiniteElement facet_moment_space = element::create_lagrange<T>(
+            facettype, degree - 1, lvariant, true);
+        auto [_x, xshape, _M, Mshape]
+            = moments::make_normal_integral_moments<T>(
+                facet_moment_space, celltype, polyset::type::standard, tdim,
+                2 * degree - 1);
+        assert(_x.size() == _M.size());
+        for (std::size_t i = 0; i < _x.size(); ++i)
+        {
+          x[tdim - 1].emplace_back(_x[i], xshape[0], xshape[1]);
+          M[tdim - 1].emplace_back(_M[i], Mshape[0], Mshape[1], Mshape[2],
+                                   Mshape[3]);
+        }
+      });
 
   // Add integral moments on interior
-  if (degree > 1)
-  {
-    // Interior integral moment
-    auto [_x, xshape, _M, Mshape] = moments::make_integral_moments<T>(
-        element::create_lagrange<T>(celltype, degree - 2, lvariant, true),
-        celltype, polyset::type::standard, tdim, 2 * degree - 2);
-    assert(_x.size() == _M.size());
-    for (std::size_t i = 0; i < _x.size(); ++i)
-    {
-      x[tdim].emplace_back(_x[i], xshape[0], xshape[1]);
-      M[tdim].emplace_back(_M[i], Mshape[0], Mshape[1], Mshape[2], Mshape[3]);
-    }
-  }
-  else
-  {
-    const std::size_t num_ent = cell::num_sub_entities(celltype, tdim);
-    x[tdim] = std::vector(num_ent, impl::mdarray_t<T, 2>(0, tdim));
-    M[tdim] = std::vector(num_ent, impl::mdarray_t<T, 4>(0, tdim, 0, 1));
-  }
+  tasks.push_back(
+      [&]()
+      {
+        if (degree > 1)
+        {
+          auto [_x, xshape, _M, Mshape] = moments::make_integral_moments<T>(
+              element::create_lagrange<T>(celltype, degree - 2, lvariant, true),
+              celltype, polyset::type::standard, tdim, 2 * degree - 2);
+          assert(_x.size() == _M.size());
+          for (std::size_t i = 0; i < _x.size(); ++i)
+          {
+            x[tdim].emplace_back(_x[i], xshape[0], xshape[1]);
+            M[tdim].emplace_back(_M[i], Mshape[0], Mshape[1], Mshape[2],
+                                 Mshape[3]);
+          }
+        }
+        else
+        {
+          const std::size_t num_ent = cell::num_sub_entities(celltype, tdim);
+          x[tdim] = std::vector(num_ent, impl::mdarray_t<T, 2>(0, tdim));
+          M[tdim] = std::vector(num_ent, impl::mdarray_t<T, 4>(0, tdim, 0, 1));
+        }
+      });
+
+  parallel::run_tasks(tasks);
 
   std::array<std::vector<mdspan_t<const T, 2>>, 4> xview = impl::to_mdspan(x);
   std::array<std::vector<mdspan_t<const T, 4>>, 4> Mview = impl::to_mdspan(M);
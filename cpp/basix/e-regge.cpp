@@ -7,10 +7,12 @@
 #include "element-families.h"
 #include "maps.h"
 #include "math.h"
+#include "parallel.h"
 #include "polyset.h"
 #include "quadrature.h"
 #include "sobolev-spaces.h"
 #include <cmath>
+#include <functional>
 
 using namespace basix;
 namespace stdex
@@ -62,6 +64,10 @@ FiniteElement<T> element::create_regge(cell::type celltype, int degree,
     M[0] = std::vector(num_ent, impl::mdarray_t<T, 4>(0, tdim * tdim, 0, 1));
   }
 
+  // The entities are independent, so their moments are created as
+  // concurrent tasks
+  std::vector<std::function<void()>> tasks;
+
   // Loop over edge and higher dimension entities
   for (std::size_t d = 1; d < topology.size(); ++d)
   {
@@ -76,94 +82,107 @@ FiniteElement<T> element::create_regge(cell::type celltype, int degree,
     else
     {
 
-      // Loop over entities of dimension dim
+      // The moments on each entity are created by a separate task
+      x[d].resize(topology[d].size());
+      M[d].resize(topology[d].size());
       for (std::size_t e = 0; e < topology[d].size(); ++e)
       {
-        // Entity coordinates
-        const auto [ebuffer, eshape]
-            = cell::sub_entity_geometry<T>(celltype, d, e);
-        impl::mdspan_t<const T, 2> entity_x(ebuffer.data(), eshape);
-
-        // Tabulate points in lattice
-        cell::type ct = cell::sub_entity_type(celltype, d, e);
-
-        const std::size_t ndofs
-            = polyset::dim(ct, polyset::type::standard, degree + 1 - d);
-        const auto [_pts, wts] = quadrature::make_quadrature<T>(
-            quadrature::type::Default, ct, polyset::type::standard,
-            degree + (degree + 1 - d));
-        impl::mdspan_t<const T, 2> pts(_pts.data(), wts.size(),
-                                       _pts.size() / wts.size());
-
-        FiniteElement moment_space = create_lagrange<T>(
-            ct, degree + 1 - d, element::lagrange_variant::legendre, true);
-        const auto [phib, phishape] = moment_space.tabulate(0, pts);
-        impl::mdspan_t<const T, 4> moment_values(phib.data(), phishape);
-
-        auto& _x = x[d].emplace_back(pts.extent(0), tdim);
-
-        // Copy points
-        for (std::size_t p = 0; p < pts.extent(0); ++p)
-        {
-          for (std::size_t j = 0; j < entity_x.extent(1); ++j)
-            _x(p, j) = entity_x(0, j);
-
-          for (std::size_t i = 0; i < entity_x.extent(0) - 1; ++i)
-            for (std::size_t j = 0; j < entity_x.extent(1); ++j)
-              _x(p, j) += (entity_x(i + 1, j) - entity_x(0, j)) * pts(p, i);
-        }
-
-        // Store up outer(t, t) for all tangents
-        const std::vector<int>& vert_ids = topology[d][e];
-        const std::size_t ntangents = d * (d + 1) / 2;
-        stdex::mdarray<T,
-                       MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 3>>
-            vvt(ntangents, geometry.extent(1), geometry.extent(1));
-        std::vector<T> edge(geometry.extent(1));
-
-        int c = 0;
-        for (std::size_t s = 0; s < d; ++s)
-        {
-          for (std::size_t r = s + 1; r < d + 1; ++r)
-          {
-            for (std::size_t p = 0; p < geometry.extent(1); ++p)
-              edge[p] = geometry(vert_ids[r], p) - geometry(vert_ids[s], p);
-
-            // outer product v.v^T
-            auto [buffer, shape] = math::outer(edge, edge);
-            impl::mdspan_t<const T, 2> result(buffer.data(), shape);
-            for (std::size_t i = 0; i < vvt.extent(1); ++i)
-              for (std::size_t j = 0; j < vvt.extent(2); ++j)
-                vvt(c, i, j) = result(i, j);
-
-            ++c;
-          }
-        }
-
-        auto& _M = M[d].emplace_back(ndofs * ntangents, tdim * tdim,
-                                     pts.extent(0), 1);
-        for (int n = 0; n < moment_space.dim(); ++n)
-        {
-          for (std::size_t j = 0; j < ntangents; ++j)
-          {
-            std::vector<T> vvt_flat;
-            for (std::size_t i = 0; i < vvt.extent(1); ++i)
-              for (std::size_t k = 0; k < vvt.extent(2); ++k)
-                vvt_flat.push_back(vvt(j, i, k));
-            for (std::size_t q = 0; q < pts.extent(0); ++q)
+        tasks.push_back(
+            [&, d, e]()
             {
-              for (std::size_t i = 0; i < tdim * tdim; ++i)
+              // Entity coordinates
+              const auto [ebuffer, eshape]
+                  = cell::sub_entity_geometry<T>(celltype, d, e);
+              impl::mdspan_t<const T, 2> entity_x(ebuffer.data(), eshape);
+
+              // Tabulate points in lattice
+              cell::type ct = cell::sub_entity_type(celltype, d, e);
+
+              const std::size_t ndofs
+                  = polyset::dim(ct, polyset::type::standard, degree + 1 - d);
+              const auto [_pts, wts] = quadrature::make_quadrature<T>(
+                  quadrature::type::Default, ct, polyset::type::standard,
+                  degree + (degree + 1 - d));
+              impl::mdspan_t<const T, 2> pts(_pts.data(), wts.size(),
+                                             _pts.size() / wts.size());
+
+              FiniteElement moment_space = create_lagrange<T>(
+                  ct, degree + 1 - d, element::lagrange_variant::legendre,
+                  true);
+              const auto [phib, phishape] = moment_space.tabulate(0, pts);
+              impl::mdspan_t<const T, 4> moment_values(phib.data(), phishape);
+
+              x[d][e] = impl::mdarray_t<T, 2>(pts.extent(0), tdim);
+              auto& _x = x[d][e];
+
+              // Copy points
+              for (std::size_t p = 0; p < pts.extent(0); ++p)
+              {
+                for (std::size_t j = 0; j < entity_x.extent(1); ++j)
+                  _x(p, j) = entity_x(0, j);
+
+                for (std::size_t i = 0; i < entity_x.extent(0) - 1; ++i)
+                  for (std::size_t j = 0; j < entity_x.extent(1); ++j)
+                    _x(p, j)
+                        += (entity_x(i + 1, j) - entity_x(0, j)) * pts(p, i);
+              }
+
+              // Store up outer(t, t) for all tangents
+              const std::vector<int>& vert_ids = topology[d][e];
+              const std::size_t ntangents = d * (d + 1) / 2;
+              stdex::mdarray<
+                  T, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 3>>
+                  vvt(ntangents, geometry.extent(1), geometry.extent(1));
+              std::vector<T> edge(geometry.extent(1));
+
+              int c = 0;
+              for (std::size_t s = 0; s < d; ++s)
               {
-                _M(n * ntangents + j, i, q, 0)
-                    = vvt_flat[i] * wts[q] * moment_values(0, q, n, 0);
+                for (std::size_t r = s + 1; r < d + 1; ++r)
+                {
+                  for (std::size_t p = 0; p < geometry.extent(1); ++p)
+                    edge[p]
+                        = geometry(vert_ids[r], p) - geometry(vert_ids[s], p);
+
+                  // outer product v.v^T
+                  auto [buffer, shape] = math::outer(edge, edge);
+                  impl::mdspan_t<const T, 2> result(buffer.data(), shape);
+                  for (std::size_t i = 0; i < vvt.extent(1); ++i)
+                    for (std::size_t j = 0; j < vvt.extent(2); ++j)
+                      vvt(c, i, j) = result(i, j);
+
+                  ++c;
+                }
               }
-            }
-          }
-        }
+
+              M[d][e] = impl::mdarray_t<T, 4>(ndofs * ntangents, tdim * tdim,
+                                              pts.extent(0), 1);
+              auto& _M = M[d][e];
+              for (int n = 0; n < moment_space.dim(); ++n)
+              {
+                for (std::size_t j = 0; j < ntangents; ++j)
+                {
+                  std::vector<T> vvt_flat;
+                  for (std::size_t i = 0; i < vvt.extent(1); ++i)
+                    for (std::size_t k = 0; k < vvt.extent(2); ++k)
+                      vvt_flat.push_back(vvt(j, i, k));
+                  for (std::size_t q = 0; q < pts.extent(0); ++q)
+                  {
+                    for (std::size_t i = 0; i < tdim * tdim; ++i)
+                    {
+                      _M(n * ntangents + j, i, q, 0)
+                          = vvt_flat[i] * wts[q] * moment_values(0, q, n, 0);
+                    }
+                  }
+                }
+              }
+            });
       }
     }
   }
 
+  parallel::run_tasks(tasks);
+
   // Regge has (d+1) dofs on each edge, 3d(d+1)/2 on each face and
   // d(d-1)(d+1) on the interior in 3D
 
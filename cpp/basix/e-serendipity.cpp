@@ -10,11 +10,13 @@
 #include "math.h"
 #include "mdspan.hpp"
 #include "moments.h"
+#include "parallel.h"
 #include "polynomials.h"
 #include "polyset.h"
 #include "quadrature.h"
 #include "sobolev-spaces.h"
 #include <concepts>
+#include <functional>
 
 using namespace basix;
 
@@ -1001,96 +1003,123 @@ FiniteElement<T> element::create_serendipity(cell::type celltype, int degree,
     _M(0, 0, 0, 0) = 1.0;
   }
 
-  if (degree >= 2)
-  {
-    FiniteElement moment_space = element::create_lagrange<T>(
-        cell::type::interval, degree - 2, lvariant, true);
-    auto [_x, xshape, _M, Mshape] = moments::make_integral_moments<T>(
-        moment_space, celltype, polyset::type::standard, 1, 2 * degree - 2);
-    assert(_x.size() == _M.size());
-    for (std::size_t i = 0; i < _x.size(); ++i)
-    {
-      x[1].emplace_back(_x[i], xshape[0], xshape[1]);
-      M[1].emplace_back(_M[i], Mshape[0], Mshape[1], Mshape[2], Mshape[3]);
-    }
-  }
-  else
-  {
-    const std::size_t num_ent = cell::num_sub_entities(celltype, 1);
-    x[1] = std::vector(num_ent, impl::mdarray_t<T, 2>(0, tdim));
-    M[1] = std::vector(num_ent, impl::mdarray_t<T, 4>(0, 1, 0, 1));
-  }
+  // The polynomial space and the moments on each type of sub-entity
+  // are independent, so are created as concurrent tasks
+  std::vector<std::function<void()>> tasks;
+
+  tasks.push_back(
+      [&]()
+      {
+        if (degree >= 2)
+        {
+          FiniteElement moment_space = element::create_lagrange<T>(
+              cell::type::interval, degree - 2, lvariant, true);
+          auto [_x, xshape, _M, Mshape] = moments::make_integral_moments<T>(
+              moment_space, celltype, polyset::type::standard, 1,
+              2 * degree - 2);
+          assert(_x.size() == _M.size());
+          for (std::size_t i = 0; i < _x.size(); ++i)
+          {
+            x[1].emplace_back(_x[i], xshape[0], xshape[1]);
+            M[1].emplace_back(_M[i], Mshape[0], Mshape[1], Mshape[2],
+                              Mshape[3]);
+          }
+        }
+        else
+        {
+          const std::size_t num_ent = cell::num_sub_entities(celltype, 1);
+          x[1] = std::vector(num_ent, impl::mdarray_t<T, 2>(0, tdim));
+          M[1] = std::vector(num_ent, impl::mdarray_t<T, 4>(0, 1, 0, 1));
+        }
+      });
 
   if (tdim >= 2)
   {
-    if (degree >= 4)
-    {
-      FiniteElement moment_space = element::create_dpc<T>(
-          cell::type::quadrilateral, degree - 4, dvariant, true);
-      auto [_x, xshape, _M, Mshape] = moments::make_integral_moments<T>(
-          moment_space, celltype, polyset::type::standard, 1, 2 * degree - 4);
-      assert(_x.size() == _M.size());
-      for (std::size_t i = 0; i < _x.size(); ++i)
-      {
-        x[2].emplace_back(_x[i], xshape[0], xshape[1]);
-        M[2].emplace_back(_M[i], Mshape[0], Mshape[1], Mshape[2], Mshape[3]);
-      }
-    }
-    else
-    {
-      const std::size_t num_ent = cell::num_sub_entities(celltype, 2);
-      x[2] = std::vector(num_ent, impl::mdarray_t<T, 2>(0, tdim));
-      M[2] = std::vector(num_ent, impl::mdarray_t<T, 4>(0, 1, 0, 1));
-    }
+    tasks.push_back(
+        [&]()
+        {
+          if (degree >= 4)
+          {
+            FiniteElement moment_space = element::create_dpc<T>(
+                cell::type::quadrilateral, degree - 4, dvariant, true);
+            auto [_x, xshape, _M, Mshape] = moments::make_integral_moments<T>(
+                moment_space, celltype, polyset::type::standard, 1,
+                2 * degree - 4);
+            assert(_x.size() == _M.size());
+            for (std::size_t i = 0; i < _x.size(); ++i)
+            {
+              x[2].emplace_back(_x[i], xshape[0], xshape[1]);
+              M[2].emplace_back(_M[i], Mshape[0], Mshape[1], Mshape[2],
+                                Mshape[3]);
+            }
+          }
+          else
+          {
+            const std::size_t num_ent = cell::num_sub_entities(celltype, 2);
+            x[2] = std::vector(num_ent, impl::mdarray_t<T, 2>(0, tdim));
+            M[2] = std::vector(num_ent, impl::mdarray_t<T, 4>(0, 1, 0, 1));
+          }
+        });
   }
 
   if (tdim == 3)
   {
-    if (degree >= 6)
-    {
-      auto [_x, xshape, _M, Mshape] = moments::make_integral_moments<T>(
-          element::create_dpc<T>(cell::type::hexahedron, degree - 6, dvariant,
-                                 true),
-          celltype, polyset::type::standard, 1, 2 * degree - 6);
-      assert(_x.size() == _M.size());
-      for (std::size_t i = 0; i < _x.size(); ++i)
-      {
-        x[3].emplace_back(_x[i], xshape[0], xshape[1]);
-        M[3].emplace_back(_M[i], Mshape[0], Mshape[1], Mshape[2], Mshape[3]);
-      }
-    }
-    else
-    {
-      const std::size_t num_ent = cell::num_sub_entities(celltype, 3);
-      x[3] = std::vector(num_ent, impl::mdarray_t<T, 2>(0, tdim));
-      M[3] = std::vector(num_ent, impl::mdarray_t<T, 4>(0, 1, 0, 1));
-    }
+    tasks.push_back(
+        [&]()
+        {
+          if (degree >= 6)
+          {
+            auto [_x, xshape, _M, Mshape] = moments::make_integral_moments<T>(
+                element::create_dpc<T>(cell::type::hexahedron, degree - 6,
+                                       dvariant, true),
+                celltype, polyset::type::standard, 1, 2 * degree - 6);
+            assert(_x.size() == _M.size());
+            for (std::size_t i = 0; i < _x.size(); ++i)
+            {
+              x[3].emplace_back(_x[i], xshape[0], xshape[1]);
+              M[3].emplace_back(_M[i], Mshape[0], Mshape[1], Mshape[2],
+                                Mshape[3]);
+            }
+          }
+          else
+          {
+            const std::size_t num_ent = cell::num_sub_entities(celltype, 3);
+            x[3] = std::vector(num_ent, impl::mdarray_t<T, 2>(0, tdim));
+            M[3] = std::vector(num_ent, impl::mdarray_t<T, 4>(0, 1, 0, 1));
+          }
+        });
   }
 
   std::vector<T> wbuffer;
   std::array<std::size_t, 2> wshape;
-  if (tdim == 1)
-  {
-    wbuffer = math::eye<T>(degree + 1);
-    wshape = {static_cast<std::size_t>(degree + 1),
-              static_cast<std::size_t>(degree + 1)};
-  }
-  else if (tdim == 2)
-  {
-    auto w = make_serendipity_space_2d<T>(degree);
-    wbuffer.assign(w.data(), w.data() + w.size());
-    wshape = {w.extent(0), w.extent(1)};
-  }
-  else if (tdim == 3)
-  {
-    auto w = make_serendipity_space_3d<T>(degree);
-    wbuffer.assign(w.data(), w.data() + w.size());
-    wshape = {w.extent(0), w.extent(1)};
-  }
-  else
-  {
-    throw std::runtime_error("Unsupported tdim");
-  }
+  tasks.push_back(
+      [&]()
+      {
+        if (tdim == 1)
+        {
+          wbuffer = math::eye<T>(degree + 1);
+          wshape = {static_cast<std::size_t>(degree + 1),
+                    static_cast<std::size_t>(degree + 1)};
+        }
+        else if (tdim == 2)
+        {
+          auto w = make_serendipity_space_2d<T>(degree);
+          wbuffer.assign(w.data(), w.data() + w.size());
+          wshape = {w.extent(0), w.extent(1)};
+        }
+        else if (tdim == 3)
+        {
+          auto w = make_serendipity_space_3d<T>(degree);
+          wbuffer.assign(w.data(), w.data() + w.size());
+          wshape = {w.extent(0), w.extent(1)};
+        }
+        else
+        {
+          throw std::runtime_error("Unsupported tdim");
+        }
+      });
+
+  parallel::run_tasks(tasks);
 
   std::array<std::vector<mdspan_t<const T, 2>>, 4> xview = impl::to_mdspan(x);
   std::array<std::vector<mdspan_t<const T, 4>>, 4> Mview = impl::to_mdspan(M);
@@ -1235,60 +1264,79 @@ FiniteElement<T> element::create_serendipity_div(
     M[i] = std::vector(num_ent, impl::mdarray_t<T, 4>(0, tdim, 0, 1));
   }
 
-  {
-    FiniteElement facet_moment_space
-        = facettype == cell::type::interval
-              ? element::create_lagrange<T>(facettype, degree, lvariant, true)
-              : element::create_dpc<T>(facettype, degree, dvariant, true);
-    auto [_x, xshape, _M, Mshape] = moments::make_normal_integral_moments<T>(
-        facet_moment_space, celltype, polyset::type::standard, tdim,
-        2 * degree + 1);
-    assert(_x.size() == _M.size());
-    for (std::size_t i = 0; i < _x.size(); ++i)
-    {
-      x[tdim - 1].emplace_back(_x[i], xshape[0], xshape[1]);
-      M[tdim - 1].emplace_back(_M[i], Mshape[0], Mshape[1], Mshape[2],
-                               Mshape[3]);
-    }
-  }
+  // The polynomial space and the moments on each type of sub-entity
+  // are independent, so are created as concurrent tasks
+  std::vector<std::function<void()>> tasks;
 
-  if (degree >= 2)
-  {
-    FiniteElement cell_moment_space
-        = element::create_dpc<T>(celltype, degree - 2, dvariant, true);
-    auto [_x, xshape, _M, Mshape] = moments::make_integral_moments<T>(
-        cell_moment_space, celltype, polyset::type::standard, tdim,
-        2 * degree - 1);
-    assert(_x.size() == _M.size());
-    for (std::size_t i = 0; i < _x.size(); ++i)
-    {
-      x[tdim].emplace_back(_x[i], xshape[0], xshape[1]);
-      M[tdim].emplace_back(_M[i], Mshape[0], Mshape[1], Mshape[2], Mshape[3]);
-    }
-  }
-  else
-  {
-    const std::size_t num_ent = cell::num_sub_entities(celltype, tdim);
-    x[tdim] = std::vector(num_ent, impl::mdarray_t<T, 2>(0, tdim));
-    M[tdim] = std::vector(num_ent, impl::mdarray_t<T, 4>(0, tdim, 0, 1));
-  }
+  tasks.push_back(
+      [&]()
+      {
+        FiniteElement facet_moment_space
+            = facettype == cell::type::interval
+                  ? element::create_lagrange<T>(facettype, degree, lvariant,
+                                                true)
+                  : element::create_dpc<T>(facettype, degree, dvariant, true);
+        auto [_x, xshape, _M, Mshape]
+            = moments::make_normal_integral_moments<T>(
+                facet_moment_space, celltype, polyset::type::standard, tdim,
+                2 * degree + 1);
+        assert(_x.size() == _M.size());
+        for (std::size_t i = 0; i < _x.size(); ++i)
+        {
+          x[tdim - 1].emplace_back(_x[i], xshape[0], xshape[1]);
+          M[tdim - 1].emplace_back(_M[i], Mshape[0], Mshape[1], Mshape[2],
+                                   Mshape[3]);
+        }
+      });
+
+  tasks.push_back(
+      [&]()
+      {
+        if (degree >= 2)
+        {
+          FiniteElement cell_moment_space
+              = element::create_dpc<T>(celltype, degree - 2, dvariant, true);
+          auto [_x, xshape, _M, Mshape] = moments::make_integral_moments<T>(
+              cell_moment_space, celltype, polyset::type::standard, tdim,
+              2 * degree - 1);
+          assert(_x.size() == _M.size());
+          for (std::size_t i = 0; i < _x.size(); ++i)
+          {
+            x[tdim].emplace_back(_x[i], xshape[0], xshape[1]);
+            M[tdim].emplace_back(_M[i], Mshape[0], Mshape[1], Mshape[2],
+                                 Mshape[3]);
+          }
+        }
+        else
+        {
+          const std::size_t num_ent = cell::num_sub_entities(celltype, tdim);
+          x[tdim] = std::vector(num_ent, impl::mdarray_t<T, 2>(0, tdim));
+          M[tdim] = std::vector(num_ent, impl::mdarray_t<T, 4>(0, tdim, 0, 1));
+        }
+      });
 
   std::vector<T> wbuffer;
   std::array<std::size_t, 2> wshape;
-  if (tdim == 2)
-  {
-    auto w = make_serendipity_div_space_2d<T>(degree);
-    wbuffer.assign(w.data(), w.data() + w.size());
-    wshape = {w.extent(0), w.extent(1)};
-  }
-  else if (tdim == 3)
-  {
-    auto w = make_serendipity_div_space_3d<T>(degree);
-    wbuffer.assign(w.data(), w.data() + w.size());
-    wshape = {w.extent(0), w.extent(1)};
-  }
-  else
-    throw std::runtime_error("Unsupported tdim");
+  tasks.push_back(
+      [&]()
+      {
+        if (tdim == 2)
+        {
+          auto w = make_serendipity_div_space_2d<T>(degree);
+          wbuffer.assign(w.data(), w.data() + w.size());
+          wshape = {w.extent(0), w.extent(1)};
+        }
+        else if (tdim == 3)
+        {
+          auto w = make_serendipity_div_space_3d<T>(degree);
+          wbuffer.assign(w.data(), w.data() + w.size());
+          wshape = {w.extent(0), w.extent(1)};
+        }
+        else
+          throw std::runtime_error("Unsupported tdim");
+      });
+
+  parallel::run_tasks(tasks);
 
   std::array<std::vector<mdspan_t<const T, 2>>, 4> xview = impl::to_mdspan(x);
   std::array<std::vector<mdspan_t<const T, 4>>, 4> Mview = impl::to_mdspan(M);
@@ -1336,24 +1384,32 @@ FiniteElement<T> element::create_serendipity_curl(
   impl::mdspan_t<const T, 2> Qpts(_Qpts.data(), wts.size(),
                                   _Qpts.size() / wts.size());
 
+  // The polynomial space and the moments on each type of sub-entity
+  // are independent, so are created as concurrent tasks
+  std::vector<std::function<void()>> tasks;
+
   std::vector<T> wbuffer;
   std::array<std::size_t, 2> wshape;
-  if (tdim == 2)
-  {
-    auto w = make_serendipity_curl_space_2d<T>(degree);
-    wbuffer.assign(w.data(), w.data() + w.size());
-    wshape = {w.extent(0), w.extent(1)};
-  }
-  else if (tdim == 3)
-  {
-    auto w = make_serendipity_curl_space_3d<T>(degree);
-    wbuffer.assign(w.data(), w.data() + w.size());
-    wshape = {w.extent(0), w.extent(1)};
-  }
-  else
-  {
-    throw std::runtime_error("Unsupported tdim");
-  }
+  tasks.push_back(
+      [&]()
+      {
+        if (tdim == 2)
+        {
+          auto w = make_serendipity_curl_space_2d<T>(degree);
+          wbuffer.assign(w.data(), w.data() + w.size());
+          wshape = {w.extent(0), w.extent(1)};
+        }
+        else if (tdim == 3)
+        {
+          auto w = make_serendipity_curl_space_3d<T>(degree);
+          wbuffer.assign(w.data(), w.data() + w.size());
+          wshape = {w.extent(0), w.extent(1)};
+        }
+        else
+        {
+          throw std::runtime_error("Unsupported tdim");
+        }
+      });
 
   std::array<std::vector<impl::mdarray_t<T, 2>>, 4> x;
   std::array<std::vector<impl::mdarray_t<T, 4>>, 4> M;
@@ -1363,65 +1419,81 @@ FiniteElement<T> element::create_serendipity_curl(
     M[0] = std::vector(num_ent, impl::mdarray_t<T, 4>(0, tdim, 0, 1));
   }
 
-  {
-    FiniteElement edge_moment_space = element::create_lagrange<T>(
-        cell::type::interval, degree, lvariant, true);
-    auto [_x, xshape, _M, Mshape] = moments::make_tangent_integral_moments<T>(
-        edge_moment_space, celltype, polyset::type::standard, tdim,
-        2 * degree + 1);
-    assert(_x.size() == _M.size());
-    for (std::size_t i = 0; i < _x.size(); ++i)
-    {
-      x[1].emplace_back(_x[i], xshape[0], xshape[1]);
-      M[1].emplace_back(_M[i], Mshape[0], Mshape[1], Mshape[2], Mshape[3]);
-    }
-  }
+  tasks.push_back(
+      [&]()
+      {
+        FiniteElement edge_moment_space = element::create_lagrange<T>(
+            cell::type::interval, degree, lvariant, true);
+        auto [_x, xshape, _M, Mshape]
+            = moments::make_tangent_integral_moments<T>(
+                edge_moment_space, celltype, polyset::type::standard, tdim,
+                2 * degree + 1);
+        assert(_x.size() == _M.size());
+        for (std::size_t i = 0; i < _x.size(); ++i)
+        {
+          x[1].emplace_back(_x[i], xshape[0], xshape[1]);
+          M[1].emplace_back(_M[i], Mshape[0], Mshape[1], Mshape[2], Mshape[3]);
+        }
+      });
 
-  if (degree >= 2)
-  {
-    // Face integral moment
-    FiniteElement moment_space = element::create_dpc<T>(
-        cell::type::quadrilateral, degree - 2, dvariant, true);
-    auto [_x, xshape, _M, Mshape] = moments::make_integral_moments<T>(
-        moment_space, celltype, polyset::type::standard, tdim, 2 * degree - 1);
-    assert(_x.size() == _M.size());
-    for (std::size_t i = 0; i < _x.size(); ++i)
-    {
-      x[2].emplace_back(_x[i], xshape[0], xshape[1]);
-      M[2].emplace_back(_M[i], Mshape[0], Mshape[1], Mshape[2], Mshape[3]);
-    }
-  }
-  else
-  {
-    const std::size_t num_ent = cell::num_sub_entities(celltype, 2);
-    x[2] = std::vector(num_ent, impl::mdarray_t<T, 2>(0, tdim));
-    M[2] = std::vector(num_ent, impl::mdarray_t<T, 4>(0, tdim, 0, 1));
-  }
+  tasks.push_back(
+      [&]()
+      {
+        if (degree >= 2)
+        {
+          // Face integral moment
+          FiniteElement moment_space = element::create_dpc<T>(
+              cell::type::quadrilateral, degree - 2, dvariant, true);
+          auto [_x, xshape, _M, Mshape] = moments::make_integral_moments<T>(
+              moment_space, celltype, polyset::type::standard, tdim,
+              2 * degree - 1);
+          assert(_x.size() == _M.size());
+          for (std::size_t i = 0; i < _x.size(); ++i)
+          {
+            x[2].emplace_back(_x[i], xshape[0], xshape[1]);
+            M[2].emplace_back(_M[i], Mshape[0], Mshape[1], Mshape[2],
+                              Mshape[3]);
+          }
+        }
+        else
+        {
+          const std::size_t num_ent = cell::num_sub_entities(celltype, 2);
+          x[2] = std::vector(num_ent, impl::mdarray_t<T, 2>(0, tdim));
+          M[2] = std::vector(num_ent, impl::mdarray_t<T, 4>(0, tdim, 0, 1));
+        }
+      });
 
   if (tdim == 3)
   {
-    if (degree >= 4)
-    {
-      // Interior integral moment
-      auto [_x, xshape, _M, Mshape] = moments::make_integral_moments<T>(
-          element::create_dpc<T>(cell::type::hexahedron, degree - 4, dvariant,
-                                 true),
-          celltype, polyset::type::standard, tdim, 2 * degree - 3);
-      assert(_x.size() == _M.size());
-      for (std::size_t i = 0; i < _x.size(); ++i)
-      {
-        x[3].emplace_back(_x[i], xshape[0], xshape[1]);
-        M[3].emplace_back(_M[i], Mshape[0], Mshape[1], Mshape[2], Mshape[3]);
-      }
-    }
-    else
-    {
-      const std::size_t num_ent = cell::num_sub_entities(celltype, 3);
-      x[3] = std::vector(num_ent, impl::mdarray_t<T, 2>(0, tdim));
-      M[3] = std::vector(num_ent, impl::mdarray_t<T, 4>(0, tdim, 0, 1));
-    }
+    tasks.push_back(
+        [&]()
+        {
+          if (degree >= 4)
+          {
+            // Interior integral moment
+            auto [_x, xshape, _M, Mshape] = moments::make_integral_moments<T>(
+                element::create_dpc<T>(cell::type::hexahedron, degree - 4,
+                                       dvariant, true),
+                celltype, polyset::type::standard, tdim, 2 * degree - 3);
+            assert(_x.size() == _M.size());
+            for (std::size_t i = 0; i < _x.size(); ++i)
+            {
+              x[3].emplace_back(_x[i], xshape[0], xshape[1]);
+              M[3].emplace_back(_M[i], Mshape[0], Mshape[1], Mshape[2],
+                                Mshape[3]);
+            }
+          }
+          else
+          {
+            const std::size_t num_ent = cell::num_sub_entities(celltype, 3);
+            x[3] = std::vector(num_ent, impl::mdarray_t<T, 2>(0, tdim));
+            M[3] = std::vector(num_ent, impl::mdarray_t<T, 4>(0, tdim, 0, 1));
+          }
+        });
   }
 
+  parallel::run_tasks(tasks);
+
   std::array<std::vector<mdspan_t<const T, 2>>, 4> xview = impl::to_mdspan(x);
   std::array<std::vector<mdspan_t<const T, 4>>, 4> Mview = impl::to_mdspan(M);
   std::array<std::vector<std::vector<T>>, 4> xbuffer;
@@ -0,0 +1,361 @@
+// Copyright (c) 2024 Basix contributors
+// FEniCS Project
+// SPDX-License-Identifier:    MIT
+
+#include "element-cache.h"
+#include "finite-element.h"
+#include <cstdint>
+#include <fstream>
+#include <list>
+#include <map>
+#include <mutex>
+#include <sstream>
+#include <thread>
+#include <tuple>
+#include <utility>
+#include <variant>
+
+#ifndef _WIN32
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+#endif
+
+using namespace basix;
+
+namespace
+{
+//-----------------------------------------------------------------------------
+using cache_key_t = std::tuple<std::size_t, element::family, cell::type, int,
+                               element::lagrange_variant, element::dpc_variant,
+                               bool, std::vector<int>>;
+using cache_value_t
+    = std::variant<std::shared_ptr<const FiniteElement<float>>,
+                   std::shared_ptr<const FiniteElement<double>>>;
+
+/// The cache. Entries are stored in eviction order, with the next
+/// element to be evicted at the back of the list.
+struct cache_t
+{
+  std::mutex mutex;
+  std::list<std::pair<cache_key_t, cache_value_t>> entries;
+  std::map<cache_key_t,
+           std::list<std::pair<cache_key_t, cache_value_t>>::iterator>
+      index;
+  std::size_t capacity = 128;
+  element_cache::policy policy = element_cache::policy::lru;
+  std::size_t hits = 0;
+  std::size_t misses = 0;
+  std::size_t evictions = 0;
+  std::size_t disk_hits = 0;
+  std::filesystem::path directory;
+
+  /// Evict entries until there are at most n entries. The caller must
+  /// hold the mutex.
+  void shrink(std::size_t n)
+  {
+    while (entries.size() > n)
+    {
+      index.erase(entries.back().first);
+      entries.pop_back();
+      ++evictions;
+    }
+  }
+};
+//-----------------------------------------------------------------------------
+cache_t& cache()
+{
+  static cache_t c;
+  return c;
+}
+//-----------------------------------------------------------------------------
+
+/// The name of the file that stores the element with the given key
+std::string file_name(const cache_key_t& key)
+{
+  auto& [size, family, cell, degree, lvariant, dvariant, discontinuous,
+         dof_ordering] = key;
+  std::stringstream s;
+  s << "element-" << size << "-" << static_cast<int>(family) << "-"
+    << static_cast<int>(cell) << "-" << degree << "-"
+    << static_cast<int>(lvariant) << "-" << static_cast<int>(dvariant) << "-"
+    << discontinuous;
+  if (!dof_ordering.empty())
+  {
+    // FNV-1a hash of the dof ordering
+    std::uint64_t hash = 14695981039346656037ull;
+    for (int d : dof_ordering)
+    {
+      hash ^= static_cast<std::uint32_t>(d);
+      hash *= 1099511628211ull;
+    }
+    s << "-" << std::hex << hash;
+  }
+  s << ".basix";
+  return s.str();
+}
+//-----------------------------------------------------------------------------
+
+/// Check that an element read from a file is the element with the
+/// given key. The file name does not identify the element uniquely, as
+/// the dof ordering is hashed and the directory may be shared with
+/// other builds. A variant matches if either variant is unset, as
+/// create_element resolves some unset variants and does not store
+/// variants that the element does not use.
+template <std::floating_point T>
+bool matches(const FiniteElement<T>& e, const cache_key_t& key)
+{
+  auto& [size, family, cell, degree, lvariant, dvariant, discontinuous,
+         dof_ordering] = key;
+  auto variant_matches = [](auto v0, auto v1)
+  {
+    using V = decltype(v0);
+    return v0 == v1 or v0 == V::unset or v1 == V::unset;
+  };
+  return e.family() == family and e.cell_type() == cell and e.degree() == degree
+         and variant_matches(e.lagrange_variant(), lvariant)
+         and variant_matches(e.dpc_variant(), dvariant)
+         and e.discontinuous() == discontinuous
+         and e.dof_ordering() == dof_ordering;
+}
+//-----------------------------------------------------------------------------
+} // namespace
+
+//-----------------------------------------------------------------------------
+template <std::floating_point T>
+std::shared_ptr<const FiniteElement<T>>
+element_cache::get(element::family family, cell::type cell, int degree,
+                   element::lagrange_variant lvariant,
+                   element::dpc_variant dvariant, bool discontinuous,
+                   const std::vector<int>& dof_ordering)
+{
+  cache_key_t key = {sizeof(T), family,   cell,          degree,
+                     lvariant,  dvariant, discontinuous, dof_ordering};
+  cache_t& c = cache();
+  {
+    std::scoped_lock lock(c.mutex);
+    if (auto it = c.index.find(key); it != c.index.end())
+    {
+      ++c.hits;
+      if (c.policy == policy::lru)
+        c.entries.splice(c.entries.begin(), c.entries, it->second);
+      return std::get<std::shared_ptr<const FiniteElement<T>>>(
+          it->second->second);
+    }
+    ++c.misses;
+  }
+
+  // Load or create the element without holding the lock, so that other
+  // threads can use the cache meanwhile
+  std::filesystem::path path = get_directory();
+  if (!path.empty())
+    path /= file_name(key);
+
+  std::shared_ptr<const FiniteElement<T>> e;
+  if (!path.empty() and std::filesystem::exists(path))
+  {
+    try
+    {
+      e = std::make_shared<const FiniteElement<T>>(load<T>(path));
+    }
+    catch (const std::exception&)
+    {
+      // The file is stale (e.g. written by a different version) or
+      // damaged, so it is replaced below
+    }
+    if (e and !matches(*e, key))
+    {
+      // The file contains a different element, so it is replaced below
+      e.reset();
+    }
+    if (e)
+    {
+      std::scoped_lock lock(c.mutex);
+      ++c.disk_hits;
+    }
+  }
+  if (!e)
+  {
+    e = std::make_shared<const FiniteElement<T>>(create_element<T>(
+        family, cell, degree, lvariant, dvariant, discontinuous, dof_ordering));
+    if (!path.empty())
+    {
+      try
+      {
+        save(path, *e);
+      }
+      catch (const std::exception&)
+      {
+        // The on-disk cache is best effort: failing to write to it
+        // does not prevent the element from being used
+      }
+    }
+  }
+
+  std::scoped_lock lock(c.mutex);
+  if (auto it = c.index.find(key); it != c.index.end())
+  {
+    // Another thread created the same element
+    return std::get<std::shared_ptr<const FiniteElement<T>>>(
+        it->second->second);
+  }
+  if (c.capacity > 0)
+  {
+    c.shrink(c.capacity - 1);
+    c.entries.emplace_front(key, e);
+    c.index.emplace(std::move(key), c.entries.begin());
+  }
+
+  return e;
+}
+//-----------------------------------------------------------------------------
+void element_cache::set_directory(const std::filesystem::path& path)
+{
+  if (!path.empty())
+    std::filesystem::create_directories(path);
+  cache_t& c = cache();
+  std::scoped_lock lock(c.mutex);
+  c.directory = path;
+}
+//-----------------------------------------------------------------------------
+std::filesystem::path element_cache::get_directory()
+{
+  cache_t& c = cache();
+  std::scoped_lock lock(c.mutex);
+  return c.directory;
+}
+//-----------------------------------------------------------------------------
+template <std::floating_point T>
+void element_cache::save(const std::filesystem::path& path,
+                         const FiniteElement<T>& element)
+{
+  std::vector<std::byte> data = element.serialize();
+
+  // Write to a file with a unique name, then rename it, so that other
+  // processes never read a partially written file
+  std::stringstream suffix;
+  suffix << ".tmp-" << std::this_thread::get_id();
+#ifndef _WIN32
+  suffix << "-" << getpid();
+#endif
+  std::filesystem::path tmp = path;
+  tmp += suffix.str();
+  try
+  {
+    {
+      std::ofstream file(tmp, std::ios::binary | std::ios::trunc);
+      file.write(reinterpret_cast<const char*>(data.data()), data.size());
+      if (!file)
+        throw std::runtime_error("Could not write element to " + tmp.string());
+    }
+    std::filesystem::rename(tmp, path);
+  }
+  catch (...)
+  {
+    // Do not leave the temporary file behind
+    std::error_code ec;
+    std::filesystem::remove(tmp, ec);
+    throw;
+  }
+}
+//-----------------------------------------------------------------------------
+template <std::floating_point T>
+FiniteElement<T> element_cache::load(const std::filesystem::path& path)
+{
+#ifndef _WIN32
+  int fd = open(path.c_str(), O_RDONLY);
+  if (fd == -1)
+    throw std::runtime_error("Could not open " + path.string());
+  struct stat st;
+  if (fstat(fd, &st) != 0 or st.st_size == 0)
+  {
+    close(fd);
+    throw std::runtime_error("Could not read " + path.string());
+  }
+  const std::size_t size = st.st_size;
+  void* ptr = mmap(nullptr, size, PROT_READ, MAP_PRIVATE, fd, 0);
+  close(fd);
+  if (ptr == MAP_FAILED)
+    throw std::runtime_error("Could not map " + path.string());
+
+  try
+  {
+    FiniteElement<T> e = FiniteElement<T>::deserialize(
+        std::span(static_cast<const std::byte*>(ptr), size));
+    munmap(ptr, size);
+    return e;
+  }
+  catch (...)
+  {
+    munmap(ptr, size);
+    throw;
+  }
+#else
+  std::ifstream file(path, std::ios::binary);
+  if (!file)
+    throw std::runtime_error("Could not open " + path.string());
+  std::vector<char> data((std::istreambuf_iterator<char>(file)),
+                         std::istreambuf_iterator<char>());
+  return FiniteElement<T>::deserialize(std::as_bytes(std::span(data)));
+#endif
+}
+//-----------------------------------------------------------------------------
+void element_cache::set_capacity(std::size_t capacity)
+{
+  cache_t& c = cache();
+  std::scoped_lock lock(c.mutex);
+  c.capacity = capacity;
+  c.shrink(capacity);
+}
+//-----------------------------------------------------------------------------
+void element_cache::set_policy(element_cache::policy p)
+{
+  cache_t& c = cache();
+  std::scoped_lock lock(c.mutex);
+  c.policy = p;
+}
+//-----------------------------------------------------------------------------
+element_cache::policy element_cache::get_policy()
+{
+  cache_t& c = cache();
+  std::scoped_lock lock(c.mutex);
+  return c.policy;
+}
+//-----------------------------------------------------------------------------
+element_cache::statistics element_cache::stats()
+{
+  cache_t& c = cache();
+  std::scoped_lock lock(c.mutex);
+  return {c.hits,           c.misses,   c.evictions,
+          c.entries.size(), c.capacity, c.disk_hits};
+}
+//-----------------------------------------------------------------------------
+void element_cache::clear()
+{
+  cache_t& c = cache();
+  std::scoped_lock lock(c.mutex);
+  c.entries.clear();
+  c.index.clear();
+  c.hits = 0;
+  c.misses = 0;
+  c.evictions = 0;
+  c.disk_hits = 0;
+}
+//-----------------------------------------------------------------------------
+/// @cond
+template std::shared_ptr<const FiniteElement<float>>
+element_cache::get(element::family, cell::type, int, element::lagrange_variant,
+                   element::dpc_variant, bool, const std::vector<int>&);
+template std::shared_ptr<const FiniteElement<double>>
+element_cache::get(element::family, cell::type, int, element::lagrange_variant,
+                   element::dpc_variant, bool, const std::vector<int>&);
+template void element_cache::save(const std::filesystem::path&,
+                                  const FiniteElement<float>&);
+template void element_cache::save(const std::filesystem::path&,
+                                  const FiniteElement<double>&);
+template FiniteElement<float> element_cache::load(const std::filesystem::path&);
+template FiniteElement<double>
+element_cache::load(const std::filesystem::path&);
+/// @endcond
+//-----------------------------------------------------------------------------
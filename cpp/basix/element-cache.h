@@ -0,0 +1,137 @@
+// Copyright (c) 2024 Basix contributors
+// FEniCS Project
+// SPDX-License-Identifier:    MIT
+
+#pragma once
+
+#include "cell.h"
+#include "element-families.h"
+#include <concepts>
+#include <cstddef>
+#include <filesystem>
+#include <memory>
+#include <vector>
+
+namespace basix
+{
+template <std::floating_point T>
+class FiniteElement;
+
+/// @brief Process-wide cache of elements created by `create_element`.
+///
+/// Creating an element involves, amongst other things, inverting the
+/// dual matrix and computing the entity transformations, which is
+/// expensive for high degree elements. The cache stores elements keyed
+/// on the arguments of `create_element` and the scalar type, and
+/// returns shared, immutable elements. The cache is bounded: when it is
+/// full, an element is evicted according to the eviction policy.
+///
+/// Optionally, elements can also be stored in a directory on disk (see
+/// `set_directory`). Elements that are not in memory are then loaded
+/// from the directory if possible, and otherwise created and written to
+/// the directory, so the cost of creating an element is paid only once
+/// across processes.
+///
+/// All functions in this namespace are thread-safe.
+namespace element_cache
+{
+/// Eviction policy
+enum class policy
+{
+  lru = 0,  /*!< Evict the least recently used element */
+  fifo = 1, /*!< Evict the least recently created element */
+};
+
+/// Cache statistics
+struct statistics
+{
+  std::size_t hits;      ///< Number of lookups that found an element
+  std::size_t misses;    ///< Number of lookups not found in memory
+  std::size_t evictions; ///< Number of elements evicted
+  std::size_t size;      ///< Number of elements in the cache
+  std::size_t capacity;  ///< Maximum number of elements in the cache
+  std::size_t disk_hits; ///< Number of misses loaded from disk
+};
+
+/// @brief Get an element from the cache, creating it if it is not in
+/// the cache.
+///
+/// The arguments are the same as for `basix::create_element`.
+///
+/// @param[in] family The element family
+/// @param[in] cell The reference cell type that the element is defined
+/// on
+/// @param[in] degree The degree of the element
+/// @param[in] lvariant The variant of Lagrange to use
+/// @param[in] dvariant The variant of DPC to use
+/// @param[in] discontinuous Indicates whether the element is
+/// discontinuous between cells points of the element.
+/// @param[in] dof_ordering Ordering of dofs for ElementDofLayout
+/// @return A shared finite element
+template <std::floating_point T>
+std::shared_ptr<const FiniteElement<T>>
+get(element::family family, cell::type cell, int degree,
+    element::lagrange_variant lvariant, element::dpc_variant dvariant,
+    bool discontinuous, const std::vector<int>& dof_ordering = {});
+
+/// @brief Set the directory used to store elements on disk.
+///
+/// The directory is created if it does not exist. An empty path
+/// disables the on-disk cache, which is the default.
+///
+/// @param[in] path The directory
+void set_directory(const std::filesystem::path& path);
+
+/// @brief Get the directory used to store elements on disk.
+/// @return The directory. This is empty if the on-disk cache is
+/// disabled.
+std::filesystem::path get_directory();
+
+/// @brief Write an element to a file.
+///
+/// The file holds the data returned by `FiniteElement::serialize`. The
+/// file is written to a temporary file first and then renamed, so
+/// readers never see a partially written file.
+///
+/// @param[in] path The file
+/// @param[in] element The element
+template <std::floating_point T>
+void save(const std::filesystem::path& path, const FiniteElement<T>& element);
+
+/// @brief Read an element from a file written by `save`.
+///
+/// On POSIX systems, the file is memory mapped rather than read into a
+/// buffer. The arrays of the element are copied from the mapping, which
+/// is released before this function returns.
+///
+/// @param[in] path The file
+/// @return The element
+template <std::floating_point T>
+FiniteElement<T> load(const std::filesystem::path& path);
+
+/// @brief Set the maximum number of elements held in the cache.
+///
+/// If the cache holds more elements than the new capacity, elements
+/// are evicted. A capacity of 0 disables caching in memory.
+/// @param[in] capacity The maximum number of elements
+void set_capacity(std::size_t capacity);
+
+/// @brief Set the eviction policy.
+/// @param[in] p The eviction policy
+void set_policy(policy p);
+
+/// @brief Get the eviction policy.
+/// @return The eviction policy
+policy get_policy();
+
+/// @brief Get the cache statistics.
+/// @return The number of hits, misses and evictions since the counters
+/// were last reset, and the current size and capacity
+statistics stats();
+
+/// @brief Remove all elements from the in-memory cache and reset the
+/// counters. Files in the on-disk cache are not removed.
+void clear();
+
+} // namespace element_cache
+} // namespace basix
@@ -16,10 +16,15 @@
 #include "e-regge.h"
 #include "e-serendipity.h"
 #include "math.h"
+#include "parallel.h"
 #include "polyset.h"
+#include "profiling.h"
+#include <algorithm>
 #include <basix/version.h>
 #include <cmath>
 #include <concepts>
+#include <cstring>
+#include <functional>
 #include <limits>
 #include <numeric>
 
@@ -28,15 +33,9 @@
 
 using namespace basix;
 
-namespace stdex
-    = MDSPAN_IMPL_STANDARD_NAMESPACE::MDSPAN_IMPL_PROPOSED_NAMESPACE;
 template <typename T, std::size_t d>
 using mdspan_t = MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
     T, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, d>>;
-template <typename T, std::size_t d>
-using mdarray_t
-    = stdex::mdarray<T,
-                     MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, d>>;
 
 namespace
 {
@@ -47,6 +46,8 @@ constexpr int compute_value_size(maps::type map_type, int dim)
   {
   case maps::type::identity:
     return 1;
+  case maps::type::L2Piola:
+    return 1;
   case maps::type::covariantPiola:
     return dim;
   case maps::type::contravariantPiola:
@@ -60,6 +61,84 @@ constexpr int compute_value_size(maps::type map_type, int dim)
   }
 }
 //-----------------------------------------------------------------------------
+
+/// Apply @p map to each block of values, using the matrices of the
+/// block. @p map is called directly, so the map is inlined in the loop
+/// over blocks.
+template <typename F, typename Map>
+void map_blocks(Map map, mdspan_t<const F, 3> in, mdspan_t<const F, 3> A,
+                std::span<const F> detA, mdspan_t<const F, 3> B,
+                mdspan_t<F, 3> out)
+{
+  using submdspan_t = mdspan_t<F, 2>;
+  using csubmdspan_t = mdspan_t<const F, 2>;
+  for (std::size_t i = 0; i < in.extent(0); ++i)
+  {
+    submdspan_t _out(out.data_handle() + i * out.extent(1) * out.extent(2),
+                     out.extent(1), out.extent(2));
+    csubmdspan_t _in(in.data_handle() + i * in.extent(1) * in.extent(2),
+                     in.extent(1), in.extent(2));
+    csubmdspan_t _A(A.data_handle() + i * A.extent(1) * A.extent(2),
+                    A.extent(1), A.extent(2));
+    csubmdspan_t _B(B.data_handle() + i * B.extent(1) * B.extent(2),
+                    B.extent(1), B.extent(2));
+    map(_out, _in, _A, detA[i], _B);
+  }
+}
+//-----------------------------------------------------------------------------
+
+/// Apply the map of type @p map_type to each block of values. For a
+/// push forward, A is the Jacobian and B its inverse. For a pull back,
+/// A is the inverse of the Jacobian, B the Jacobian and detA the
+/// reciprocal of the Jacobian determinant.
+template <typename F>
+void map_blocks(maps::type map_type, mdspan_t<const F, 3> in,
+                mdspan_t<const F, 3> A, std::span<const F> detA,
+                mdspan_t<const F, 3> B, mdspan_t<F, 3> out)
+{
+  using O = mdspan_t<F, 2>;
+  using P = mdspan_t<const F, 2>;
+  switch (map_type)
+  {
+  case maps::type::identity:
+    map_blocks<F>(
+        [](O& u, const P& U, const P&, F, const P&)
+        {
+          for (std::size_t i = 0; i < U.extent(0); ++i)
+            for (std::size_t j = 0; j < U.extent(1); ++j)
+              u(i, j) = U(i, j);
+        },
+        in, A, detA, B, out);
+    return;
+  case maps::type::L2Piola:
+    map_blocks<F>([](O& u, const P& U, const P& J, F detJ, const P& K)
+                  { maps::l2_piola(u, U, J, detJ, K); }, in, A, detA, B, out);
+    return;
+  case maps::type::covariantPiola:
+    map_blocks<F>([](O& u, const P& U, const P& J, F detJ, const P& K)
+                  { maps::covariant_piola(u, U, J, detJ, K); }, in, A, detA, B,
+                  out);
+    return;
+  case maps::type::contravariantPiola:
+    map_blocks<F>([](O& u, const P& U, const P& J, F detJ, const P& K)
+                  { maps::contravariant_piola(u, U, J, detJ, K); }, in, A, detA,
+                  B, out);
+    return;
+  case maps::type::doubleCovariantPiola:
+    map_blocks<F>([](O& u, const P& U, const P& J, F detJ, const P& K)
+                  { maps::double_covariant_piola(u, U, J, detJ, K); }, in, A,
+                  detA, B, out);
+    return;
+  case maps::type::doubleContravariantPiola:
+    map_blocks<F>([](O& u, const P& U, const P& J, F detJ, const P& K)
+                  { maps::double_contravariant_piola(u, U, J, detJ, K); }, in,
+                  A, detA, B, out);
+    return;
+  default:
+    throw std::runtime_error("Map not implemented");
+  }
+}
+//-----------------------------------------------------------------------------
 constexpr int num_transformations(cell::type cell_type)
 {
   switch (cell_type)
@@ -92,6 +171,7 @@ std::pair<std::vector<T>, std::array<std::size_t, 2>> compute_dual_matrix(
     const std::array<std::vector<impl::mdspan_t<const T, 4>>, 4>& M, int degree,
     int nderivs)
 {
+  profiling::timer timer("compute_dual_matrix");
   std::size_t num_dofs(0), vs(0);
   for (auto& Md : M)
   {
@@ -105,10 +185,14 @@ std::pair<std::vector<T>, std::array<std::size_t, 2>> compute_dual_matrix(
     }
   }
 
-  std::size_t pdim = polyset::dim(cell_type, poly_type, degree);
-  mdarray_t<T, 3> D(vs, pdim, num_dofs);
-  std::fill(D.data(), D.data() + D.size(), 0);
-  std::vector<T> Pb;
+  // The transpose of the dual matrix of the polynomial set, with shape
+  // (num_dofs, vs, pdim). For a dof i on entity e,
+  // Dt(i, j, m) = sum_{k,l} M[e](i, j, k, l) * P(l, m, k), where P is
+  // the polynomial set tabulated at the points of the entity. This is
+  // computed as a product of matrices for each entity and derivative.
+  const std::size_t pdim = polyset::dim(cell_type, poly_type, degree);
+  std::vector<T> Dt(num_dofs * vs * pdim, 0);
+  std::vector<T> Pb, Mb;
 
   // Loop over different dimensions
   std::size_t dof_index = 0;
@@ -117,71 +201,164 @@ std::pair<std::vector<T>, std::array<std::size_t, 2>> compute_dual_matrix(
     // Loop over entities of dimension d
     for (std::size_t e = 0; e < x[d].size(); ++e)
     {
-      // Evaluate polynomial basis at x[d]
-      mdspan_t<const T, 2> x_e = x[d][e];
-      mdspan_t<const T, 3> P;
-      if (x_e.extent(0) > 0)
-      {
-        std::array<std::size_t, 3> shape;
-        std::tie(Pb, shape)
-            = polyset::tabulate(cell_type, poly_type, degree, nderivs, x_e);
-        P = mdspan_t<const T, 3>(Pb.data(), shape);
-      }
-
       // Me: [dof, vs, point, deriv]
       mdspan_t<const T, 4> Me = M[d][e];
+      const std::size_t ndofs = Me.extent(0);
+      const std::size_t npts = Me.extent(2);
+      const std::size_t nderiv = Me.extent(3);
+      if (ndofs == 0 or npts == 0)
+      {
+        dof_index += ndofs;
+        continue;
+      }
 
-      // Compute dual matrix contribution
-      if (Me.extent(3) > 1)
+      // Evaluate polynomial basis at x[d]: [deriv, poly, point]
+      std::array<std::size_t, 3> shape;
+      std::tie(Pb, shape)
+          = polyset::tabulate(cell_type, poly_type, degree, nderivs, x[d][e]);
+      assert(shape[0] >= nderiv and shape[1] == pdim and shape[2] == npts);
+
+      // For a single derivative, Me is a (ndofs * vs, npts) matrix.
+      // Otherwise, reorder Me to [deriv, dof, vs, point] so that it is
+      // a (ndofs * vs, npts) matrix for each derivative.
+      const T* Ml = Me.data_handle();
+      if (nderiv > 1)
       {
-        for (std::size_t l = 0; l < Me.extent(3); ++l)       // Derivative
-          for (std::size_t m = 0; m < P.extent(1); ++m)      // Polynomial term
-            for (std::size_t i = 0; i < Me.extent(0); ++i)   // Dof index
-              for (std::size_t j = 0; j < Me.extent(1); ++j) // Value index
-                for (std::size_t k = 0; k < Me.extent(2); ++k) // Point
-                  D(j, m, dof_index + i) += Me(i, j, k, l) * P(l, m, k);
+        Mb.resize(Me.size());
+        for (std::size_t i = 0; i < ndofs; ++i)
+          for (std::size_t j = 0; j < vs; ++j)
+            for (std::size_t k = 0; k < npts; ++k)
+              for (std::size_t l = 0; l < nderiv; ++l)
+                Mb[((l * ndofs + i) * vs + j) * npts + k] = Me(i, j, k, l);
+        Ml = Mb.data();
       }
-      else
+
+      // Dt[dofs] += M_l P_l^T
+      for (std::size_t l = 0; l < nderiv; ++l)
       {
-        // Flatten and use matrix-matrix multiplication, possibly using
-        // BLAS for larger cases. We can do this straightforwardly when
-        // Me.extent(3) == 1 since we are contracting over one index
-        // only.
-
-        std::vector<T> Pt_b(P.extent(2) * P.extent(1));
-        mdspan_t<T, 2> Pt(Pt_b.data(), P.extent(2), P.extent(1));
-        for (std::size_t i = 0; i < Pt.extent(0); ++i)
-          for (std::size_t j = 0; j < Pt.extent(1); ++j)
-            Pt(i, j) = P(0, j, i);
-
-        std::vector<T> De_b(Me.extent(0) * Me.extent(1) * Pt.extent(1));
-        mdspan_t<T, 2> De(De_b.data(), Me.extent(0) * Me.extent(1),
-                          Pt.extent(1));
-        math::dot(mdspan_t<const T, 2>(Me.data_handle(),
-                                       Me.extent(0) * Me.extent(1),
-                                       Me.extent(2)),
-                  Pt, De);
-
-        // Expand and copy
-        for (std::size_t i = 0; i < Me.extent(0); ++i)
-          for (std::size_t j = 0; j < Me.extent(1); ++j)
-            for (std::size_t k = 0; k < P.extent(1); ++k)
-              D(j, k, dof_index + i) += De(i * Me.extent(1) + j, k);
+        math::impl::gemm_blas<T>(false, true, ndofs * vs, pdim, npts, 1,
+                                 Ml + l * ndofs * vs * npts, npts,
+                                 Pb.data() + l * pdim * npts, npts, 1,
+                                 Dt.data() + dof_index * vs * pdim, pdim);
       }
 
-      dof_index += M[d][e].extent(0);
+      dof_index += ndofs;
     }
   }
 
-  // Flatten D
-  mdspan_t<const T, 2> Df(D.data(), D.extent(0) * D.extent(1), D.extent(2));
-
-  std::array shape = {B.extent(0), Df.extent(1)};
-  std::vector<T> C(shape[0] * shape[1]);
-  math::dot(B, Df, mdspan_t<T, 2>(C.data(), shape));
+  // C = B Dt^T
+  std::array shape = {B.extent(0), num_dofs};
+  std::vector<T> C(shape[0] * shape[1], 0);
+  math::impl::gemm_blas<T>(false, true, shape[0], shape[1], vs * pdim, 1,
+                           B.data_handle(), B.extent(1), Dt.data(), vs * pdim,
+                           0, C.data(), shape[1]);
   return {std::move(C), shape};
 }
 //-----------------------------------------------------------------------------
+/// The base transformations (as indices into the base transformations
+/// of the entity type) that are applied, in order, to an entity with
+/// the orientation given by the bits v of the cell info. For a face,
+/// transformation 0 is a rotation and 1 is a reflection. If post is
+/// true, the reflection is applied after the rotations.
+std::vector<std::size_t> orientation_sequence(cell::type ctype, std::uint32_t v,
+                                              bool post)
+{
+  if (ctype == cell::type::interval)
+    return std::vector<std::size_t>(v, 0);
+
+  std::vector<std::size_t> seq;
+  if (!post and v & 1)
+    seq.push_back(1);
+  seq.insert(seq.end(), v >> 1, 0);
+  if (post and v & 1)
+    seq.push_back(1);
+  return seq;
+}
+//-----------------------------------------------------------------------------
+/// Compose precomputed permutations for each orientation of an entity
+std::vector<std::vector<std::size_t>>
+compose_permutations(cell::type ctype,
+                     const std::vector<std::vector<std::size_t>>& perms,
+                     bool post)
+{
+  const std::uint32_t nstates = ctype == cell::type::interval ? 2 : 8;
+  const std::size_t n = perms.empty() ? 0 : perms.front().size();
+  std::vector<std::vector<std::size_t>> composed;
+  for (std::uint32_t v = 0; v < nstates; ++v)
+  {
+    std::vector<std::size_t>& p = composed.emplace_back(n);
+    std::iota(p.begin(), p.end(), 0);
+    for (std::size_t i : orientation_sequence(ctype, v, post))
+      precompute::pre_apply_permutation(std::span(perms[i]), std::span(p));
+    precompute::prepare_permutation(p);
+  }
+  return composed;
+}
+//-----------------------------------------------------------------------------
+/// Compose precomputed matrices for each orientation of an entity
+template <std::floating_point T>
+std::vector<std::pair<std::vector<std::size_t>,
+                      std::pair<std::vector<T>, std::array<std::size_t, 2>>>>
+compose_matrices(
+    cell::type ctype,
+    const std::vector<
+        std::pair<std::vector<std::size_t>,
+                  std::pair<std::vector<T>, std::array<std::size_t, 2>>>>& mats,
+    bool post)
+{
+  const std::uint32_t nstates = ctype == cell::type::interval ? 2 : 8;
+  const std::size_t n = mats.empty() ? 0 : mats.front().first.size();
+  std::vector<std::pair<std::vector<std::size_t>,
+                        std::pair<std::vector<T>, std::array<std::size_t, 2>>>>
+      composed(nstates);
+  if (n == 0)
+    return composed;
+
+  for (std::uint32_t v = 0; v < nstates; ++v)
+  {
+    // Apply the base transformations to the columns of the identity
+    std::pair<std::vector<T>, std::array<std::size_t, 2>> mat
+        = {std::vector<T>(n * n, 0), {n, n}};
+    for (std::size_t i = 0; i < n; ++i)
+      mat.first[i * n + i] = 1;
+    for (std::size_t i : orientation_sequence(ctype, v, post))
+    {
+      auto& [p, M] = mats[i];
+      precompute::pre_apply_matrix(
+          std::span(p), mdspan_t<const T, 2>(M.first.data(), M.second),
+          std::span(mat.first), 0, n);
+    }
+    std::vector<std::size_t> p = precompute::prepare_matrix(mat);
+    composed[v] = {std::move(p), std::move(mat)};
+  }
+  return composed;
+}
+//-----------------------------------------------------------------------------
+/// Expand precomputed matrices to dense row-major matrices
+template <std::floating_point T>
+std::vector<std::vector<T>> dense_matrices(
+    const std::vector<
+        std::pair<std::vector<std::size_t>,
+                  std::pair<std::vector<T>, std::array<std::size_t, 2>>>>& mats)
+{
+  std::vector<std::vector<T>> dense;
+  for (auto& [p, M] : mats)
+  {
+    // Apply the matrix to the identity, with each row as a block
+    const std::size_t n = p.size();
+    std::vector<T>& D = dense.emplace_back(n * n, 0);
+    for (std::size_t i = 0; i < n; ++i)
+      D[i * n + i] = 1;
+    if (n > 0)
+    {
+      precompute::pre_apply_matrix(
+          std::span(p), mdspan_t<const T, 2>(M.first.data(), M.second),
+          std::span(D), 0, n);
+    }
+  }
+  return dense;
+}
+//-----------------------------------------------------------------------------
 } // namespace
 //-----------------------------------------------------------------------------
 template <std::floating_point T>
@@ -191,6 +368,7 @@ basix::create_element(element::family family, cell::type cell, int degree,
                       element::dpc_variant dvariant, bool discontinuous,
                       std::vector<int> dof_ordering)
 {
+  profiling::timer timer("create_element");
   if (family == element::family::custom)
   {
     throw std::runtime_error("Cannot create a custom element directly. Try "
@@ -557,6 +735,8 @@ FiniteElement<F>::FiniteElement(
       _discontinuous(discontinuous), _tensor_factors(tensor_factors),
       _dof_ordering(dof_ordering)
 {
+  profiling::timer timer("FiniteElement::FiniteElement");
+
   // Check that discontinuous elements only have DOFs on interior
   if (discontinuous)
   {
@@ -726,6 +906,27 @@ FiniteElement<F>::FiniteElement(
     _points = {new_points, _points.second};
   }
 
+  // Store the coefficients split by value component, with the dof
+  // ordering applied, so that tabulation needs no per-component copy.
+  // Column (i * value_size + j) holds the coefficients of component j
+  // of basis function i, which matches the layout of the tabulated
+  // data.
+  {
+    const std::size_t ndofs = _coeffs.second[0];
+    const std::size_t psize = _coeffs.second[1] / value_size;
+    mdspan_t<const F, 2> coeffs(_coeffs.first.data(), _coeffs.second);
+    _coeffs_split
+        = {std::vector<F>(_coeffs.first.size()), {psize, ndofs * value_size}};
+    mdspan_t<F, 2> split(_coeffs_split.first.data(), _coeffs_split.second);
+    for (std::size_t i = 0; i < ndofs; ++i)
+    {
+      const std::size_t col = _dof_ordering.empty() ? i : _dof_ordering[i];
+      for (std::size_t j = 0; j < value_size; ++j)
+        for (std::size_t k = 0; k < psize; ++k)
+          split(k, col * value_size + j) = coeffs(i, k + psize * j);
+    }
+  }
+
   const std::vector<std::vector<std::vector<std::vector<int>>>> connectivity
       = cell::sub_entity_connectivity(cell_type);
   for (std::size_t d = 0; d < _cell_tdim + 1; ++d)
@@ -935,6 +1136,8 @@ FiniteElement<F>::FiniteElement(
         }
       }
     }
+
+    compose_entity_transformations();
   }
 
   // Check if interpolation matrix is the identity
@@ -958,6 +1161,40 @@ FiniteElement<F>::FiniteElement(
 /// @endcond
 //-----------------------------------------------------------------------------
 template <std::floating_point F>
+void FiniteElement<F>::compose_entity_transformations()
+{
+  // The reverse permutations and the transposed and inverse
+  // transformations are applied with the reflection after the rotations
+  for (auto& [ctype, perms] : _eperm)
+    _eperm_states[ctype] = compose_permutations(ctype, perms, false);
+  for (auto& [ctype, perms] : _eperm_rev)
+    _eperm_rev_states[ctype] = compose_permutations(ctype, perms, true);
+
+  // The matrices of each type of sub-entity in each table are composed,
+  // and expanded to dense matrices for the batched transformations, as
+  // concurrent tasks
+  std::vector<std::function<void()>> tasks;
+  auto add_tasks
+      = [&tasks](auto& states, auto& dense, const auto& trans, bool post)
+  {
+    for (auto& [ctype, mats] : trans)
+    {
+      tasks.push_back(
+          [ctype, post, m = &mats, out = &states[ctype], d = &dense[ctype]]()
+          {
+            *out = compose_matrices(ctype, *m, post);
+            *d = dense_matrices(*out);
+          });
+    }
+  };
+  add_tasks(_etrans_states, _etrans_dense, _etrans, false);
+  add_tasks(_etransT_states, _etransT_dense, _etransT, true);
+  add_tasks(_etrans_inv_states, _etrans_inv_dense, _etrans_inv, true);
+  add_tasks(_etrans_invT_states, _etrans_invT_dense, _etrans_invT, false);
+  parallel::run_tasks(tasks);
+}
+//-----------------------------------------------------------------------------
+template <std::floating_point F>
 bool FiniteElement<F>::operator==(const FiniteElement& e) const
 {
   if (this == &e)
@@ -1019,61 +1256,195 @@ FiniteElement<F>::tabulate(int nd, std::span<const F> x,
 }
 //-----------------------------------------------------------------------------
 template <std::floating_point F>
+std::size_t
+FiniteElement<F>::tabulate_workspace_size(int nd, std::size_t num_points) const
+{
+  const std::size_t psize
+      = polyset::dim(_cell_type, _poly_type, _embedded_superdegree);
+  const std::size_t nderivs = polyset::nderivs(_cell_type, nd);
+
+  // Scratch space for the polynomial set, large enough for any
+  // derivative order up to nd
+  std::size_t polyset_work = 0;
+  for (int n = 0; n <= nd; ++n)
+  {
+    polyset_work
+        = std::max(polyset_work, polyset::tabulate_workspace_size<F>(
+                                     _cell_type, _poly_type,
+                                     _embedded_superdegree, n, num_points));
+  }
+  return 2 * nderivs * psize * num_points + polyset_work;
+}
+//-----------------------------------------------------------------------------
+template <std::floating_point F>
 void FiniteElement<F>::tabulate(int nd, impl::mdspan_t<const F, 2> x,
-                                mdspan_t<F, 4> basis_data) const
+                                mdspan_t<F, 4> basis_data,
+                                int num_threads) const
 {
-  if (x.extent(1) != _cell_tdim)
+  std::vector<F> work(tabulate_workspace_size(nd, x.extent(0)));
+  tabulate(nd, x, basis_data, work, num_threads);
+}
+//-----------------------------------------------------------------------------
+template <std::floating_point F>
+void FiniteElement<F>::tabulate(int nd, impl::mdspan_t<const F, 2> x,
+                                mdspan_t<F, 4> basis_data, std::span<F> work,
+                                int num_threads) const
+{
+  tabulate(
+      nd,
+      impl::mdspan_t<const F, 3>(x.data_handle(), 1, x.extent(0), x.extent(1)),
+      mdspan_t<F, 5>(basis_data.data_handle(), 1, basis_data.extent(0),
+                     basis_data.extent(1), basis_data.extent(2),
+                     basis_data.extent(3)),
+      work, num_threads);
+}
+//-----------------------------------------------------------------------------
+template <std::floating_point F>
+void FiniteElement<F>::tabulate(int nd, impl::mdspan_t<const F, 3> x,
+                                mdspan_t<F, 5> basis_data,
+                                int num_threads) const
+{
+  std::vector<F> work(tabulate_workspace_size(nd, x.extent(0) * x.extent(1)));
+  tabulate(nd, x, basis_data, work, num_threads);
+}
+//-----------------------------------------------------------------------------
+template <std::floating_point F>
+void FiniteElement<F>::tabulate(int nd, impl::mdspan_t<const F, 3> x,
+                                mdspan_t<F, 5> basis_data, std::span<F> work,
+                                int num_threads) const
+{
+  profiling::timer timer("FiniteElement::tabulate");
+  if (x.extent(2) != _cell_tdim)
   {
-    throw std::runtime_error("Point dim (" + std::to_string(x.extent(1))
+    throw std::runtime_error("Point dim (" + std::to_string(x.extent(2))
                              + ") does not match element dim ("
                              + std::to_string(_cell_tdim) + ").");
   }
 
+  const std::size_t ncells = x.extent(0);
+  const std::size_t npoints = x.extent(1);
+  const std::array<std::size_t, 4> shape = tabulate_shape(nd, npoints);
+  if (basis_data.extent(0) != ncells or basis_data.extent(1) != shape[0]
+      or basis_data.extent(2) != shape[1] or basis_data.extent(3) != shape[2]
+      or basis_data.extent(4) != shape[3])
+  {
+    throw std::runtime_error("Basis data has the wrong shape.");
+  }
+
+  if (work.size() < tabulate_workspace_size(nd, ncells * npoints))
+    throw std::runtime_error("Workspace is too small.");
+  if (ncells == 0 or npoints == 0)
+    return;
+
+  // Split the points into blocks of at most block_size points: groups
+  // of whole cells if the cells have few points, and otherwise ranges
+  // of the points of one cell. The blocks are independent of the number
+  // of threads, and each block is computed in the same way by any
+  // thread, so the result does not depend on the number of threads.
+  constexpr std::size_t block_size = 2048;
+  const std::size_t cells_per_block
+      = std::max<std::size_t>(1, block_size / npoints);
+  const std::size_t blocks_per_cell = (npoints + block_size - 1) / block_size;
+  const std::size_t points_per_block
+      = (npoints + blocks_per_cell - 1) / blocks_per_cell;
+  const std::size_t nblocks
+      = blocks_per_cell > 1 ? ncells * blocks_per_cell
+                            : (ncells + cells_per_block - 1) / cells_per_block;
+
+  // Each thread uses its own part of the workspace
+  const std::size_t block_work = tabulate_workspace_size(
+      nd, std::min(cells_per_block, ncells) * points_per_block);
+  const std::size_t nthreads = parallel::num_workers(nblocks, num_threads);
+  std::vector<F> thread_work;
+  if (work.size() < nthreads * block_work)
+  {
+    thread_work.resize(nthreads * block_work);
+    work = thread_work;
+  }
+
   const std::size_t psize
       = polyset::dim(_cell_type, _poly_type, _embedded_superdegree);
-  const std::array<std::size_t, 3> bsize
-      = {(std::size_t)polyset::nderivs(_cell_type, nd), psize, x.extent(0)};
-  std::vector<F> basis_b(bsize[0] * bsize[1] * bsize[2]);
-  mdspan_t<F, 3> basis(basis_b.data(), bsize);
-  polyset::tabulate(basis, _cell_type, _poly_type, _embedded_superdegree, nd,
-                    x);
-  const int vs = std::accumulate(_value_shape.begin(), _value_shape.end(), 1,
-                                 std::multiplies{});
-
-  std::vector<F> C_b(_coeffs.second[0] * psize);
-  mdspan_t<F, 2> C(C_b.data(), _coeffs.second[0], psize);
-
-  mdspan_t<const F, 2> coeffs_view(_coeffs.first.data(), _coeffs.second);
-  std::vector<F> result_b(C.extent(0) * bsize[2]);
-  mdspan_t<F, 2> result(result_b.data(), C.extent(0), bsize[2]);
-  for (std::size_t p = 0; p < basis.extent(0); ++p)
+  const std::size_t nderivs = polyset::nderivs(_cell_type, nd);
+  mdspan_t<const F, 2> C(_coeffs_split.first.data(), _coeffs_split.second);
+  auto tabulate_block = [&](std::size_t thread, std::size_t b)
   {
-    mdspan_t<const F, 2> B(basis_b.data() + p * bsize[1] * bsize[2], bsize[1],
-                           bsize[2]);
-    for (int j = 0; j < vs; ++j)
+    // Range of cells [c0, c0 + nc) and points [p0, p0 + np) in the
+    // block
+    std::size_t c0, nc, p0, np;
+    if (blocks_per_cell > 1)
     {
-      for (std::size_t k0 = 0; k0 < coeffs_view.extent(0); ++k0)
-        for (std::size_t k1 = 0; k1 < psize; ++k1)
-          C(k0, k1) = coeffs_view(k0, k1 + psize * j);
-
-      math::dot(C,
-                mdspan_t<const F, 2>(B.data_handle(), B.extent(0), B.extent(1)),
-                result);
-
-      if (_dof_ordering.empty())
-      {
-        for (std::size_t k0 = 0; k0 < basis_data.extent(1); ++k0)
-          for (std::size_t k1 = 0; k1 < basis_data.extent(2); ++k1)
-            basis_data(p, k0, k1, j) = result(k1, k0);
-      }
-      else
+      c0 = b / blocks_per_cell;
+      nc = 1;
+      p0 = (b % blocks_per_cell) * points_per_block;
+      np = std::min(points_per_block, npoints - p0);
+    }
+    else
+    {
+      c0 = b * cells_per_block;
+      nc = std::min(cells_per_block, ncells - c0);
+      p0 = 0;
+      np = npoints;
+    }
+    std::span<F> w = work.subspan(thread * block_work, block_work);
+
+    // Tabulate the polyset at the points of the block at once. The
+    // points are stored contiguously, so they can be viewed as a
+    // single (nc * np, tdim) array.
+    const std::array<std::size_t, 3> bsize = {nderivs, psize, nc * np};
+    mdspan_t<F, 3> basis(w.data(), bsize);
+    polyset::tabulate(
+        basis, _cell_type, _poly_type, _embedded_superdegree, nd,
+        mdspan_t<const F, 2>(x.data_handle() + (c0 * npoints + p0) * _cell_tdim,
+                             bsize[2], _cell_tdim),
+        w.subspan(2 * basis.size()));
+
+    // Gather the polyset values for all derivatives into a single
+    // (nc * nderivs * np, psize) matrix, with rows ordered as the
+    // (cell, derivative, point) indices of the output. A product
+    // with the pre-split coefficients then computes all
+    // derivatives and value components of all basis functions, and
+    // writes them directly into the output.
+    mdspan_t<F, 2> B(w.data() + basis.size(), bsize[0] * bsize[2], bsize[1]);
+    for (std::size_t c = 0; c < nc; ++c)
+      for (std::size_t p = 0; p < bsize[0]; ++p)
+        for (std::size_t k0 = 0; k0 < np; ++k0)
+          for (std::size_t k1 = 0; k1 < bsize[1]; ++k1)
+            B((c * bsize[0] + p) * np + k0, k1) = basis(p, k1, c * np + k0);
+
+    const std::size_t ncols = C.extent(1);
+    if (np == npoints)
+    {
+      // The rows of B are contiguous in the output
+      math::dot(B, C,
+                mdspan_t<F, 2>(basis_data.data_handle()
+                                   + c0 * nderivs * npoints * ncols,
+                               B.extent(0), ncols));
+    }
+    else
+    {
+      // The rows of B for each derivative are contiguous in the
+      // output
+      for (std::size_t p = 0; p < nderivs; ++p)
       {
-        for (std::size_t k0 = 0; k0 < basis_data.extent(1); ++k0)
-          for (std::size_t k1 = 0; k1 < basis_data.extent(2); ++k1)
-            basis_data(p, k0, _dof_ordering[k1], j) = result(k1, k0);
+        math::dot(
+            mdspan_t<const F, 2>(B.data_handle() + p * np * psize, np, psize),
+            C,
+            mdspan_t<F, 2>(basis_data.data_handle()
+                               + ((c0 * nderivs + p) * npoints + p0) * ncols,
+                           np, ncols));
       }
     }
+  };
+
+  // With one thread, the blocks are tabulated directly so that no
+  // memory is allocated
+  if (nthreads == 1)
+  {
+    for (std::size_t b = 0; b < nblocks; ++b)
+      tabulate_block(0, b);
   }
+  else
+    parallel::for_each(nblocks, (int)nthreads, tabulate_block);
 }
 //-----------------------------------------------------------------------------
 template <std::floating_point F>
@@ -1089,6 +1460,59 @@ void FiniteElement<F>::tabulate(int nd, std::span<const F> x,
 }
 //-----------------------------------------------------------------------------
 template <std::floating_point F>
+std::pair<std::vector<F>, std::array<std::size_t, 4>>
+FiniteElement<F>::tabulate_tensor_factors(int nd,
+                                          impl::mdspan_t<const F, 2> x) const
+{
+  if (!has_tensor_product_factorisation())
+    throw std::runtime_error("Element has no tensor product representation.");
+  if (_tensor_factors.size() != 1)
+  {
+    throw std::runtime_error(
+        "Element is not a single tensor product of interval elements.");
+  }
+  if (x.extent(1) != _cell_tdim)
+  {
+    throw std::runtime_error("Point dim (" + std::to_string(x.extent(1))
+                             + ") does not match element dim ("
+                             + std::to_string(_cell_tdim) + ").");
+  }
+
+  const std::vector<FiniteElement<F>>& factors
+      = std::get<0>(_tensor_factors.front());
+  assert(factors.size() == _cell_tdim);
+  const std::size_t ndofs1d = factors.front().dim();
+  for (auto& e : factors)
+  {
+    if (e.dim() != (int)ndofs1d or !e.value_shape().empty())
+    {
+      throw std::runtime_error(
+          "Tensor product factors must be scalar and of the same dimension.");
+    }
+  }
+
+  const std::size_t npoints = x.extent(0);
+  std::array<std::size_t, 4> shape
+      = {_cell_tdim, (std::size_t)nd + 1, npoints, ndofs1d};
+  std::vector<F> datab(shape[0] * shape[1] * shape[2] * shape[3]);
+  mdspan_t<F, 4> data(datab.data(), shape);
+
+  std::vector<F> x1b(npoints);
+  std::vector<F> tabb(shape[1] * npoints * ndofs1d);
+  for (std::size_t k = 0; k < _cell_tdim; ++k)
+  {
+    for (std::size_t p = 0; p < npoints; ++p)
+      x1b[p] = x(p, k);
+    factors[k].tabulate(
+        nd, mdspan_t<const F, 2>(x1b.data(), npoints, 1),
+        mdspan_t<F, 4>(tabb.data(), shape[1], npoints, ndofs1d, 1));
+    std::copy(tabb.begin(), tabb.end(), &data(k, 0, 0, 0));
+  }
+
+  return {std::move(datab), shape};
+}
+//-----------------------------------------------------------------------------
+template <std::floating_point F>
 std::pair<std::vector<F>, std::array<std::size_t, 3>>
 FiniteElement<F>::base_transformations() const
 {
@@ -1158,6 +1582,17 @@ FiniteElement<F>::base_transformations() const
 }
 //-----------------------------------------------------------------------------
 template <std::floating_point F>
+void FiniteElement<F>::dot(std::span<const F> A,
+                           std::array<std::size_t, 2> Ashape,
+                           std::span<const F> B,
+                           std::array<std::size_t, 2> Bshape, std::span<F> C)
+{
+  math::dot(mdspan_t<const F, 2>(A.data(), Ashape),
+            mdspan_t<const F, 2>(B.data(), Bshape),
+            mdspan_t<F, 2>(C.data(), Ashape[0], Bshape[1]));
+}
+//-----------------------------------------------------------------------------
+template <std::floating_point F>
 std::pair<std::vector<F>, std::array<std::size_t, 3>>
 FiniteElement<F>::push_forward(impl::mdspan_t<const F, 3> U,
                                impl::mdspan_t<const F, 3> J,
@@ -1170,30 +1605,7 @@ FiniteElement<F>::push_forward(impl::mdspan_t<const F, 3> U,
   std::array<std::size_t, 3> shape
       = {U.extent(0), U.extent(1), physical_value_size};
   std::vector<F> ub(shape[0] * shape[1] * shape[2]);
-  mdspan_t<F, 3> u(ub.data(), shape);
-
-  using u_t = MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
-      F, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 2>>;
-  using U_t = MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
-      const F, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 2>>;
-  using J_t = MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
-      const F, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 2>>;
-  using K_t = MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
-      const F, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 2>>;
-  auto map = this->map_fn<u_t, U_t, J_t, K_t>();
-  for (std::size_t i = 0; i < u.extent(0); ++i)
-  {
-    u_t _u(u.data_handle() + i * u.extent(1) * u.extent(2), u.extent(1),
-           u.extent(2));
-    U_t _U(U.data_handle() + i * U.extent(1) * U.extent(2), U.extent(1),
-           U.extent(2));
-    J_t _J(J.data_handle() + i * J.extent(1) * J.extent(2), J.extent(1),
-           J.extent(2));
-    K_t _K(K.data_handle() + i * K.extent(1) * K.extent(2), K.extent(1),
-           K.extent(2));
-    map(_u, _U, _J, detJ[i], _K);
-  }
-
+  push_forward(U, J, detJ, K, mdspan_t<F, 3>(ub.data(), shape));
   return {std::move(ub), shape};
 }
 //-----------------------------------------------------------------------------
@@ -1210,31 +1622,335 @@ FiniteElement<F>::pull_back(impl::mdspan_t<const F, 3> u,
   std::array<std::size_t, 3> shape
       = {u.extent(0), u.extent(1), reference_value_size};
   std::vector<F> Ub(shape[0] * shape[1] * shape[2]);
-  mdspan_t<F, 3> U(Ub.data(), shape);
-
-  using u_t = MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
-      const F, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 2>>;
-  using U_t = MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
-      F, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 2>>;
-  using J_t = MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
-      const F, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 2>>;
-  using K_t = MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
-      const F, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 2>>;
-  auto map = this->map_fn<U_t, u_t, K_t, J_t>();
-  for (std::size_t i = 0; i < u.extent(0); ++i)
+  pull_back(u, J, detJ, K, mdspan_t<F, 3>(Ub.data(), shape));
+  return {std::move(Ub), shape};
+}
+//-----------------------------------------------------------------------------
+template <std::floating_point F>
+void FiniteElement<F>::push_forward(impl::mdspan_t<const F, 3> U,
+                                    impl::mdspan_t<const F, 3> J,
+                                    std::span<const F> detJ,
+                                    impl::mdspan_t<const F, 3> K,
+                                    impl::mdspan_t<F, 3> u) const
+{
+  profiling::timer timer("FiniteElement::push_forward");
+  if (J.extent(0) != U.extent(0) or detJ.size() != U.extent(0)
+      or K.extent(0) != U.extent(0))
+    throw std::runtime_error("Number of Jacobians does not match the data.");
+  if (u.extent(0) != U.extent(0) or u.extent(1) != U.extent(1)
+      or u.extent(2) != compute_value_size(_map_type, J.extent(1)))
+    throw std::runtime_error("Output has the wrong shape.");
+  map_blocks<F>(_map_type, U, J, detJ, K, u);
+}
+//-----------------------------------------------------------------------------
+template <std::floating_point F>
+void FiniteElement<F>::pull_back(impl::mdspan_t<const F, 3> u,
+                                 impl::mdspan_t<const F, 3> J,
+                                 std::span<const F> detJ,
+                                 impl::mdspan_t<const F, 3> K,
+                                 impl::mdspan_t<F, 3> U) const
+{
+  profiling::timer timer("FiniteElement::pull_back");
+  if (J.extent(0) != u.extent(0) or detJ.size() != u.extent(0)
+      or K.extent(0) != u.extent(0))
+    throw std::runtime_error("Number of Jacobians does not match the data.");
+  const std::size_t reference_value_size = std::accumulate(
+      _value_shape.begin(), _value_shape.end(), 1, std::multiplies{});
+  if (U.extent(0) != u.extent(0) or U.extent(1) != u.extent(1)
+      or U.extent(2) != reference_value_size)
+    throw std::runtime_error("Output has the wrong shape.");
+
+  // The pull back is the push forward with the roles of J and K
+  // swapped and 1 / detJ in place of detJ. The reciprocals are computed
+  // in blocks to avoid allocating.
+  constexpr std::size_t block = 64;
+  std::array<F, block> detJ_inv;
+  for (std::size_t i0 = 0; i0 < u.extent(0); i0 += block)
   {
-    u_t _u(u.data_handle() + i * u.extent(1) * u.extent(2), u.extent(1),
-           u.extent(2));
-    U_t _U(U.data_handle() + i * U.extent(1) * U.extent(2), U.extent(1),
-           U.extent(2));
-    J_t _J(J.data_handle() + i * J.extent(1) * J.extent(2), J.extent(1),
-           J.extent(2));
-    K_t _K(K.data_handle() + i * K.extent(1) * K.extent(2), K.extent(1),
-           K.extent(2));
-    map(_U, _u, _K, 1.0 / detJ[i], _J);
+    const std::size_t n = std::min(block, u.extent(0) - i0);
+    for (std::size_t i = 0; i < n; ++i)
+      detJ_inv[i] = 1.0 / detJ[i0 + i];
+    auto sub = [i0, n](auto x)
+    {
+      using X = decltype(x);
+      return X(x.data_handle() + i0 * x.extent(1) * x.extent(2), n, x.extent(1),
+               x.extent(2));
+    };
+    map_blocks<F>(_map_type, sub(u), sub(K), std::span(detJ_inv.data(), n),
+                  sub(J), sub(U));
   }
+}
+//-----------------------------------------------------------------------------
+namespace
+{
+/// Identifies a buffer as a serialized FiniteElement
+constexpr std::array<char, 8> serialize_magic
+    = {'B', 'A', 'S', 'I', 'X', 'F', 'E', '\0'};
+
+// Write data to the end of a buffer. Containers are written as their
+// size followed by their entries.
+template <typename T>
+  requires std::is_arithmetic_v<T> or std::is_enum_v<T>
+void write(std::vector<std::byte>& buffer, const T& x);
+template <typename T>
+void write(std::vector<std::byte>& buffer, const std::vector<T>& x);
+template <typename T, std::size_t N>
+void write(std::vector<std::byte>& buffer, const std::array<T, N>& x);
+template <typename T0, typename T1>
+void write(std::vector<std::byte>& buffer, const std::pair<T0, T1>& x);
+template <typename K, typename V>
+void write(std::vector<std::byte>& buffer, const std::map<K, V>& x);
+void write(std::vector<std::byte>& buffer, const std::string& x);
+
+// Read data from the start of a buffer, advancing the buffer past the
+// data that was read
+template <typename T>
+  requires std::is_arithmetic_v<T> or std::is_enum_v<T>
+void read(std::span<const std::byte>& buffer, T& x);
+template <typename T>
+void read(std::span<const std::byte>& buffer, std::vector<T>& x);
+template <typename T, std::size_t N>
+void read(std::span<const std::byte>& buffer, std::array<T, N>& x);
+template <typename T0, typename T1>
+void read(std::span<const std::byte>& buffer, std::pair<T0, T1>& x);
+template <typename T, std::size_t N>
+void read(std::span<const std::byte>& buffer,
+          std::pair<std::vector<T>, std::array<std::size_t, N>>& x);
+template <typename K, typename V>
+void read(std::span<const std::byte>& buffer, std::map<K, V>& x);
+void read(std::span<const std::byte>& buffer, std::string& x);
 
-  return {std::move(Ub), shape};
+//-----------------------------------------------------------------------------
+template <typename T>
+  requires std::is_arithmetic_v<T> or std::is_enum_v<T>
+void write(std::vector<std::byte>& buffer, const T& x)
+{
+  const std::byte* ptr = reinterpret_cast<const std::byte*>(&x);
+  buffer.insert(buffer.end(), ptr, ptr + sizeof(T));
+}
+//-----------------------------------------------------------------------------
+template <typename T>
+void write(std::vector<std::byte>& buffer, const std::vector<T>& x)
+{
+  write(buffer, static_cast<std::uint64_t>(x.size()));
+  if constexpr (std::is_arithmetic_v<T> or std::is_enum_v<T>)
+  {
+    const std::byte* ptr = reinterpret_cast<const std::byte*>(x.data());
+    buffer.insert(buffer.end(), ptr, ptr + x.size() * sizeof(T));
+  }
+  else
+  {
+    for (auto& xi : x)
+      write(buffer, xi);
+  }
+}
+//-----------------------------------------------------------------------------
+template <typename T, std::size_t N>
+void write(std::vector<std::byte>& buffer, const std::array<T, N>& x)
+{
+  for (auto& xi : x)
+    write(buffer, xi);
+}
+//-----------------------------------------------------------------------------
+template <typename T0, typename T1>
+void write(std::vector<std::byte>& buffer, const std::pair<T0, T1>& x)
+{
+  write(buffer, x.first);
+  write(buffer, x.second);
+}
+//-----------------------------------------------------------------------------
+template <typename K, typename V>
+void write(std::vector<std::byte>& buffer, const std::map<K, V>& x)
+{
+  write(buffer, static_cast<std::uint64_t>(x.size()));
+  for (auto& [key, value] : x)
+  {
+    write(buffer, key);
+    write(buffer, value);
+  }
+}
+//-----------------------------------------------------------------------------
+void write(std::vector<std::byte>& buffer, const std::string& x)
+{
+  write(buffer, std::vector<char>(x.begin(), x.end()));
+}
+//-----------------------------------------------------------------------------
+template <typename T>
+  requires std::is_arithmetic_v<T> or std::is_enum_v<T>
+void read(std::span<const std::byte>& buffer, T& x)
+{
+  if (buffer.size() < sizeof(T))
+    throw std::runtime_error("Serialized element is truncated.");
+  std::memcpy(&x, buffer.data(), sizeof(T));
+  buffer = buffer.subspan(sizeof(T));
+}
+//-----------------------------------------------------------------------------
+template <typename T>
+void read(std::span<const std::byte>& buffer, std::vector<T>& x)
+{
+  std::uint64_t size;
+  read(buffer, size);
+  if constexpr (std::is_arithmetic_v<T> or std::is_enum_v<T>)
+  {
+    if (buffer.size() / sizeof(T) < size)
+      throw std::runtime_error("Serialized element is truncated.");
+    x.resize(size);
+    std::memcpy(x.data(), buffer.data(), size * sizeof(T));
+    buffer = buffer.subspan(size * sizeof(T));
+  }
+  else
+  {
+    // Each entry takes at least one byte
+    if (buffer.size() < size)
+      throw std::runtime_error("Serialized element is truncated.");
+    x.resize(size);
+    for (auto& xi : x)
+      read(buffer, xi);
+  }
+}
+//-----------------------------------------------------------------------------
+template <typename T, std::size_t N>
+void read(std::span<const std::byte>& buffer, std::array<T, N>& x)
+{
+  for (auto& xi : x)
+    read(buffer, xi);
+}
+//-----------------------------------------------------------------------------
+template <typename T0, typename T1>
+void read(std::span<const std::byte>& buffer, std::pair<T0, T1>& x)
+{
+  read(buffer, x.first);
+  read(buffer, x.second);
+}
+//-----------------------------------------------------------------------------
+template <typename T, std::size_t N>
+void read(std::span<const std::byte>& buffer,
+          std::pair<std::vector<T>, std::array<std::size_t, N>>& x)
+{
+  // An array and its shape: check that they are consistent, as the
+  // shape is used to index the data
+  read(buffer, x.first);
+  read(buffer, x.second);
+  std::size_t size = 1;
+  for (std::size_t n : x.second)
+  {
+    if (n != 0 and size > std::numeric_limits<std::size_t>::max() / n)
+      throw std::runtime_error("Serialized element has inconsistent shapes.");
+    size *= n;
+  }
+  if (size != x.first.size())
+    throw std::runtime_error("Serialized element has inconsistent shapes.");
+}
+//-----------------------------------------------------------------------------
+template <typename K, typename V>
+void read(std::span<const std::byte>& buffer, std::map<K, V>& x)
+{
+  std::uint64_t size;
+  read(buffer, size);
+  x.clear();
+  for (std::uint64_t i = 0; i < size; ++i)
+  {
+    K key;
+    read(buffer, key);
+    read(buffer, x[key]);
+  }
+}
+//-----------------------------------------------------------------------------
+void read(std::span<const std::byte>& buffer, std::string& x)
+{
+  std::vector<char> c;
+  read(buffer, c);
+  x.assign(c.begin(), c.end());
+}
+//-----------------------------------------------------------------------------
+} // namespace
+//-----------------------------------------------------------------------------
+template <std::floating_point F>
+template <typename Self>
+auto FiniteElement<F>::tie_members(Self& e)
+{
+  return std::tie(
+      e._cell_type, e._poly_type, e._cell_tdim, e._cell_subentity_types,
+      e._family, e._lagrange_variant, e._dpc_variant, e._degree,
+      e._interpolation_nderivs, e._embedded_superdegree, e._embedded_subdegree,
+      e._value_shape, e._map_type, e._sobolev_space, e._coeffs, e._coeffs_split,
+      e._edofs, e._e_closure_dofs, e._entity_transformations, e._points, e._x,
+      e._matM, e._dof_transformations_are_permutations,
+      e._dof_transformations_are_identity, e._eperm, e._eperm_rev, e._etrans,
+      e._etransT, e._etrans_inv, e._etrans_invT, e._discontinuous,
+      e._dual_matrix, e._dof_ordering, e._interpolation_is_identity, e._wcoeffs,
+      e._M);
+}
+//-----------------------------------------------------------------------------
+template <std::floating_point F>
+std::vector<std::byte> FiniteElement<F>::serialize() const
+{
+  std::vector<std::byte> buffer;
+  write(buffer, serialize_magic);
+  write(buffer, version());
+  write(buffer, static_cast<std::uint32_t>(sizeof(F)));
+
+  std::apply([&buffer](auto&... m) { (write(buffer, m), ...); },
+             tie_members(*this));
+
+  // Tensor factors are themselves elements
+  write(buffer, static_cast<std::uint64_t>(_tensor_factors.size()));
+  for (auto& [factors, perm] : _tensor_factors)
+  {
+    write(buffer, static_cast<std::uint64_t>(factors.size()));
+    for (auto& e : factors)
+      write(buffer, e.serialize());
+    write(buffer, perm);
+  }
+
+  return buffer;
+}
+//-----------------------------------------------------------------------------
+template <std::floating_point F>
+FiniteElement<F>
+FiniteElement<F>::deserialize(std::span<const std::byte> buffer)
+{
+  std::array<char, 8> magic;
+  read(buffer, magic);
+  if (magic != serialize_magic)
+    throw std::runtime_error("Buffer is not a serialized element.");
+  std::string v;
+  read(buffer, v);
+  if (v != version())
+  {
+    throw std::runtime_error("Serialized element was created by Basix " + v
+                             + ", but this is Basix " + version() + ".");
+  }
+  std::uint32_t scalar_size;
+  read(buffer, scalar_size);
+  if (scalar_size != sizeof(F))
+    throw std::runtime_error("Serialized element has a different dtype.");
+
+  FiniteElement<F> e;
+  std::apply([&buffer](auto&... m) { (read(buffer, m), ...); }, tie_members(e));
+  if (!e._dof_transformations_are_identity)
+    e.compose_entity_transformations();
+
+  std::uint64_t num_products;
+  read(buffer, num_products);
+  for (std::uint64_t i = 0; i < num_products; ++i)
+  {
+    auto& [factors, perm] = e._tensor_factors.emplace_back();
+    std::uint64_t num_factors;
+    read(buffer, num_factors);
+    for (std::uint64_t j = 0; j < num_factors; ++j)
+    {
+      std::vector<std::byte> data;
+      read(buffer, data);
+      factors.push_back(FiniteElement<F>::deserialize(data));
+    }
+    read(buffer, perm);
+  }
+
+  if (!buffer.empty())
+    throw std::runtime_error("Serialized element has trailing data.");
+
+  return e;
 }
 //-----------------------------------------------------------------------------
 std::string basix::version()
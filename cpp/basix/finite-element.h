@@ -10,7 +10,9 @@
 #include "mdspan.hpp"
 #include "polyset.h"
 #include "precompute.h"
+#include "profiling.h"
 #include "sobolev-spaces.h"
+#include <algorithm>
 #include <array>
 #include <concepts>
 #include <cstdint>
@@ -134,6 +136,9 @@ make_discontinuous(const std::array<std::vector<mdspan_t<const T, 2>>, 4>& x,
 /// The basis of a finite element is stored as a set of coefficients,
 /// which are applied to the underlying expansion set for that cell
 /// type, when tabulating.
+///
+/// The `const` member functions do not modify the element, so an
+/// element can be used by several threads at the same time.
 template <std::floating_point F>
 class FiniteElement
 {
@@ -449,10 +454,39 @@ public:
   /// - The fourth index is the basis function component. Its has size
   /// one for scalar basis functions.
   ///
-  /// @todo Remove all internal dynamic memory allocation, pass scratch
-  /// space as required
-  void tabulate(int nd, impl::mdspan_t<const F, 2> x,
-                mdspan_t<F, 4> basis) const;
+  /// @param[in] num_threads Number of threads to split the points
+  /// across. If 0, `parallel::get_num_threads()` threads are used.
+  ///
+  /// @note This function allocates its own scratch space. Use the
+  /// version that takes a workspace to avoid dynamic memory allocation
+  /// in repeated calls.
+  void tabulate(int nd, impl::mdspan_t<const F, 2> x, mdspan_t<F, 4> basis,
+                int num_threads = 0) const;
+
+  /// @brief Compute basis values and derivatives at set of points,
+  /// using caller-provided scratch space.
+  ///
+  /// All intermediate data is stored in @p work, so no temporary arrays
+  /// are allocated. The same workspace can be reused for any number of
+  /// calls.
+  ///
+  /// @note This function is designed to be called at runtime, so its
+  /// performance is critical.
+  ///
+  /// @param[in] nd The order of derivatives, up to and including, to
+  /// compute. Use 0 for the basis functions only.
+  /// @param[in] x The points at which to compute the basis functions.
+  /// The shape of x is (number of points, geometric dimension).
+  /// @param [out] basis Memory location to fill. It must be allocated
+  /// with the shape returned by `FiniteElement::tabulate_shape`.
+  /// @param work Scratch space. Its size must be at least
+  /// `tabulate_workspace_size(nd, x.extent(0))`.
+  /// @param[in] num_threads Number of threads to split the points
+  /// across. If 0, `parallel::get_num_threads()` threads are used. When
+  /// more than one thread is used, additional scratch space may be
+  /// allocated.
+  void tabulate(int nd, impl::mdspan_t<const F, 2> x, mdspan_t<F, 4> basis,
+                std::span<F> work, int num_threads = 0) const;
 
   /// @brief Compute basis values and derivatives at set of points.
   ///
@@ -482,6 +516,68 @@ public:
   void tabulate(int nd, std::span<const F> x, std::array<std::size_t, 2> xshape,
                 std::span<F> basis) const;
 
+  /// @brief Compute basis values and derivatives at a set of points on
+  /// each cell in a batch of cells.
+  ///
+  /// The points for all cells are tabulated in a single pass, so the
+  /// polynomial set and the intermediate storage are shared by the
+  /// whole batch.
+  ///
+  /// Large sets of points are split into blocks, which can be
+  /// tabulated by several threads (see basix::parallel). The blocks do
+  /// not depend on the number of threads, so the result is the same
+  /// for any number of threads.
+  ///
+  /// @note This function is designed to be called at runtime, so its
+  /// performance is critical.
+  ///
+  /// @param[in] nd The order of derivatives, up to and including, to
+  /// compute. Use 0 for the basis functions only.
+  /// @param[in] x The points at which to compute the basis functions.
+  /// The shape of x is (number of cells, number of points, geometric
+  /// dimension).
+  /// @param [out] basis Memory location to fill. It must be allocated
+  /// with shape (num_cells, num_derivatives, num_points, num basis
+  /// functions, value_size). For each cell, the layout is the same as
+  /// that returned by `FiniteElement::tabulate_shape`.
+  /// @param[in] num_threads Number of threads to split the points
+  /// across. If 0, `parallel::get_num_threads()` threads are used.
+  void tabulate(int nd, impl::mdspan_t<const F, 3> x, mdspan_t<F, 5> basis,
+                int num_threads = 0) const;
+
+  /// @brief Compute basis values and derivatives at a set of points on
+  /// each cell in a batch of cells, using caller-provided scratch
+  /// space.
+  ///
+  /// All intermediate data is stored in @p work, so no temporary arrays
+  /// are allocated.
+  ///
+  /// @param[in] nd The order of derivatives, up to and including, to
+  /// compute.
+  /// @param[in] x The points, shape is (number of cells, number of
+  /// points, geometric dimension).
+  /// @param [out] basis Memory location to fill, shape is (num_cells,
+  /// num_derivatives, num_points, num basis functions, value_size).
+  /// @param work Scratch space. Its size must be at least
+  /// `tabulate_workspace_size(nd, x.extent(0) * x.extent(1))`.
+  /// @param[in] num_threads Number of threads to split the points
+  /// across. If 0, `parallel::get_num_threads()` threads are used. When
+  /// more than one thread is used, additional scratch space may be
+  /// allocated.
+  void tabulate(int nd, impl::mdspan_t<const F, 3> x, mdspan_t<F, 5> basis,
+                std::span<F> work, int num_threads = 0) const;
+
+  /// @brief Size of the scratch space used by `FiniteElement::tabulate`.
+  ///
+  /// A workspace of this size can be reused for any call to `tabulate`
+  /// with derivative order up to @p nd and at most @p num_points points
+  /// (summed over all cells when tabulating a batch of cells).
+  ///
+  /// @param[in] nd The order of derivatives
+  /// @param[in] num_points The (maximum) number of points
+  /// @return The number of entries required in the workspace
+  std::size_t tabulate_workspace_size(int nd, std::size_t num_points) const;
+
   /// Get the element cell type
   /// @return The cell type
   cell::type cell_type() const { return _cell_type; }
@@ -585,6 +681,49 @@ public:
   pull_back(impl::mdspan_t<const F, 3> u, impl::mdspan_t<const F, 3> J,
             std::span<const F> detJ, impl::mdspan_t<const F, 3> K) const;
 
+  /// @brief Map function values from the reference to a physical cell
+  /// without allocating.
+  ///
+  /// Each block `U(i, :, :)` of values is mapped using the Jacobian
+  /// `J(i, :, :)`. For affine cells, a block holds the values at all
+  /// points of a cell. For non-affine cells, where the Jacobian varies
+  /// between points, a block holds the values at a single point, i.e.
+  /// the Jacobian index is the flattened (cell, point) index. A block
+  /// can hold, e.g., the values of all basis functions at a point.
+  ///
+  /// @param[in] U The function values on the reference. The indices
+  /// are [Jacobian index, point index, components].
+  /// @param[in] J The Jacobian of the mapping. The indices are
+  /// [Jacobian index, J_i, J_j].
+  /// @param[in] detJ The determinant of the Jacobian of the mapping. It
+  /// has length `J.shape(0)`
+  /// @param[in] K The inverse of the Jacobian of the mapping. The
+  /// indices are [Jacobian index, K_i, K_j].
+  /// @param[out] u The function values on the cell. The indices are
+  /// [Jacobian index, point index, components].
+  void push_forward(impl::mdspan_t<const F, 3> U, impl::mdspan_t<const F, 3> J,
+                    std::span<const F> detJ, impl::mdspan_t<const F, 3> K,
+                    impl::mdspan_t<F, 3> u) const;
+
+  /// @brief Map function values from a physical cell to the reference
+  /// without allocating.
+  ///
+  /// See `push_forward` for the layout of the blocks of values.
+  ///
+  /// @param[in] u The function values on the cell. The indices are
+  /// [Jacobian index, point index, components].
+  /// @param[in] J The Jacobian of the mapping. The indices are
+  /// [Jacobian index, J_i, J_j].
+  /// @param[in] detJ The determinant of the Jacobian of the mapping. It
+  /// has length `J.shape(0)`
+  /// @param[in] K The inverse of the Jacobian of the mapping. The
+  /// indices are [Jacobian index, K_i, K_j].
+  /// @param[out] U The function values on the reference. The indices
+  /// are [Jacobian index, point index, components].
+  void pull_back(impl::mdspan_t<const F, 3> u, impl::mdspan_t<const F, 3> J,
+                 std::span<const F> detJ, impl::mdspan_t<const F, 3> K,
+                 impl::mdspan_t<F, 3> U) const;
+
   /// Return a function that performs the appropriate
   /// push-forward/pull-back for the element type
   ///
@@ -630,6 +769,9 @@ public:
           for (std::size_t j = 0; j < U.extent(1); ++j)
             u(i, j) = U(i, j);
       };
+    case maps::type::L2Piola:
+      return [](O& u, const P& U, const Q& J, F detJ, const R& K)
+      { maps::l2_piola(u, U, J, detJ, K); };
     case maps::type::covariantPiola:
       return [](O& u, const P& U, const Q& J, F detJ, const R& K)
       { maps::covariant_piola(u, U, J, detJ, K); };
@@ -782,7 +924,7 @@ public:
     if (_dof_transformations_are_identity)
       return;
 
-    permute_data<std::int32_t, false>(dofs, 1, cell_info, _eperm);
+    permute_data<std::int32_t>(dofs, 1, cell_info, _eperm_states);
   }
 
   /// Unpermute the dof numbering on a cell
@@ -803,7 +945,7 @@ public:
     if (_dof_transformations_are_identity)
       return;
 
-    permute_data<std::int32_t, true>(dofs, 1, cell_info, _eperm_rev);
+    permute_data<std::int32_t>(dofs, 1, cell_info, _eperm_rev_states);
   }
 
   /// Multiply data by DOF transformation matrix from the left
@@ -904,6 +1046,176 @@ public:
   void post_apply_inverse_transpose_dof_transformation(
       std::span<T> data, int block_size, std::uint32_t cell_info) const;
 
+  /// Multiply data by DOF transformation matrix from the left
+  /// for many cells
+  ///
+  /// Batched version of `pre_apply_dof_transformation` that applies
+  /// the transformation to the data of many cells. Cells are grouped by
+  /// the orientation of each sub-entity, and each distinct
+  /// transformation of a sub-entity is applied to all cells in its group
+  /// at once as a matrix-matrix product. If the DOF transformations are
+  /// permutations, they are applied cell by cell.
+  ///
+  /// @param[in,out] data The data for each cell. The shape is
+  /// (number of cells, dim(), block_size), using row-major storage.
+  /// @param block_size The number of data points per DOF
+  /// @param cell_info The permutation info for each cell
+  template <typename T>
+  void
+  pre_apply_dof_transformation(std::span<T> data, int block_size,
+                               std::span<const std::uint32_t> cell_info) const
+  {
+    transform_data_batched<T>(data, block_size, cell_info, _etrans_dense, false,
+                              [this](std::span<T> d, int bs, std::uint32_t c)
+                              { pre_apply_dof_transformation(d, bs, c); });
+  }
+
+  /// Multiply data by transpose DOF transformation matrix from the left
+  /// for many cells
+  ///
+  /// Batched version of `pre_apply_transpose_dof_transformation`. See
+  /// `pre_apply_dof_transformation`.
+  ///
+  /// @param[in,out] data The data for each cell. The shape is
+  /// (number of cells, dim(), block_size), using row-major storage.
+  /// @param block_size The number of data points per DOF
+  /// @param cell_info The permutation info for each cell
+  template <typename T>
+  void pre_apply_transpose_dof_transformation(
+      std::span<T> data, int block_size,
+      std::span<const std::uint32_t> cell_info) const
+  {
+    transform_data_batched<T>(
+        data, block_size, cell_info, _etransT_dense, false,
+        [this](std::span<T> d, int bs, std::uint32_t c)
+        { pre_apply_transpose_dof_transformation(d, bs, c); });
+  }
+
+  /// Multiply data by inverse transpose DOF transformation matrix from the left
+  /// for many cells
+  ///
+  /// Batched version of `pre_apply_inverse_transpose_dof_transformation`. See
+  /// `pre_apply_dof_transformation`.
+  ///
+  /// @param[in,out] data The data for each cell. The shape is
+  /// (number of cells, dim(), block_size), using row-major storage.
+  /// @param block_size The number of data points per DOF
+  /// @param cell_info The permutation info for each cell
+  template <typename T>
+  void pre_apply_inverse_transpose_dof_transformation(
+      std::span<T> data, int block_size,
+      std::span<const std::uint32_t> cell_info) const
+  {
+    transform_data_batched<T>(
+        data, block_size, cell_info, _etrans_invT_dense, false,
+        [this](std::span<T> d, int bs, std::uint32_t c)
+        { pre_apply_inverse_transpose_dof_transformation(d, bs, c); });
+  }
+
+  /// Multiply data by inverse DOF transformation matrix from the left
+  /// for many cells
+  ///
+  /// Batched version of `pre_apply_inverse_dof_transformation`. See
+  /// `pre_apply_dof_transformation`.
+  ///
+  /// @param[in,out] data The data for each cell. The shape is
+  /// (number of cells, dim(), block_size), using row-major storage.
+  /// @param block_size The number of data points per DOF
+  /// @param cell_info The permutation info for each cell
+  template <typename T>
+  void pre_apply_inverse_dof_transformation(
+      std::span<T> data, int block_size,
+      std::span<const std::uint32_t> cell_info) const
+  {
+    transform_data_batched<T>(
+        data, block_size, cell_info, _etrans_inv_dense, false,
+        [this](std::span<T> d, int bs, std::uint32_t c)
+        { pre_apply_inverse_dof_transformation(d, bs, c); });
+  }
+
+  /// Multiply data by transpose DOF transformation matrix from the right
+  /// for many cells
+  ///
+  /// Batched version of `post_apply_transpose_dof_transformation`. See
+  /// `pre_apply_dof_transformation`.
+  ///
+  /// @param[in,out] data The data for each cell. The shape is
+  /// (number of cells, block_size, dim()), using row-major storage.
+  /// @param block_size The number of data points per DOF
+  /// @param cell_info The permutation info for each cell
+  template <typename T>
+  void post_apply_transpose_dof_transformation(
+      std::span<T> data, int block_size,
+      std::span<const std::uint32_t> cell_info) const
+  {
+    transform_data_batched<T>(
+        data, block_size, cell_info, _etrans_dense, true,
+        [this](std::span<T> d, int bs, std::uint32_t c)
+        { post_apply_transpose_dof_transformation(d, bs, c); });
+  }
+
+  /// Multiply data by DOF transformation matrix from the right
+  /// for many cells
+  ///
+  /// Batched version of `post_apply_dof_transformation`. See
+  /// `pre_apply_dof_transformation`.
+  ///
+  /// @param[in,out] data The data for each cell. The shape is
+  /// (number of cells, block_size, dim()), using row-major storage.
+  /// @param block_size The number of data points per DOF
+  /// @param cell_info The permutation info for each cell
+  template <typename T>
+  void
+  post_apply_dof_transformation(std::span<T> data, int block_size,
+                                std::span<const std::uint32_t> cell_info) const
+  {
+    transform_data_batched<T>(data, block_size, cell_info, _etransT_dense, true,
+                              [this](std::span<T> d, int bs, std::uint32_t c)
+                              { post_apply_dof_transformation(d, bs, c); });
+  }
+
+  /// Multiply data by inverse DOF transformation matrix from the right
+  /// for many cells
+  ///
+  /// Batched version of `post_apply_inverse_dof_transformation`. See
+  /// `pre_apply_dof_transformation`.
+  ///
+  /// @param[in,out] data The data for each cell. The shape is
+  /// (number of cells, block_size, dim()), using row-major storage.
+  /// @param block_size The number of data points per DOF
+  /// @param cell_info The permutation info for each cell
+  template <typename T>
+  void post_apply_inverse_dof_transformation(
+      std::span<T> data, int block_size,
+      std::span<const std::uint32_t> cell_info) const
+  {
+    transform_data_batched<T>(
+        data, block_size, cell_info, _etrans_invT_dense, true,
+        [this](std::span<T> d, int bs, std::uint32_t c)
+        { post_apply_inverse_dof_transformation(d, bs, c); });
+  }
+
+  /// Multiply data by inverse transpose DOF transformation matrix from the
+  /// right for many cells
+  ///
+  /// Batched version of `post_apply_inverse_transpose_dof_transformation`. See
+  /// `pre_apply_dof_transformation`.
+  ///
+  /// @param[in,out] data The data for each cell. The shape is
+  /// (number of cells, block_size, dim()), using row-major storage.
+  /// @param block_size The number of data points per DOF
+  /// @param cell_info The permutation info for each cell
+  template <typename T>
+  void post_apply_inverse_transpose_dof_transformation(
+      std::span<T> data, int block_size,
+      std::span<const std::uint32_t> cell_info) const
+  {
+    transform_data_batched<T>(
+        data, block_size, cell_info, _etrans_inv_dense, true,
+        [this](std::span<T> d, int bs, std::uint32_t c)
+        { post_apply_inverse_transpose_dof_transformation(d, bs, c); });
+  }
+
   /// Return the interpolation points, i.e. the coordinates on the
   /// reference element where a function need to be evaluated in order
   /// to interpolate it in the finite element space.
@@ -1117,6 +1429,30 @@ public:
     return _tensor_factors;
   }
 
+  /// @brief Tabulate the 1D factors of the tensor product
+  /// representation of this element.
+  ///
+  /// This can be used with the kernels in `basix::sum_factorisation`
+  /// to evaluate functions at a tensor product of points without
+  /// tabulating the full basis. The element must have a tensor product
+  /// representation that consists of a single product of scalar
+  /// elements on an interval.
+  ///
+  /// The 1D dofs are numbered in tensor product ordering: 1D dofs (i_0,
+  /// ..., i_{d-1}) correspond to the tensor product dof with row-major
+  /// index i, and entry i of the permutation in the tensor product
+  /// representation gives the corresponding dof of this element.
+  ///
+  /// @param[in] nd The order of derivatives, up to and including, to
+  /// compute.
+  /// @param[in] x The 1D points in each direction. The shape is (number
+  /// of points, tdim), with column k holding the points in direction k.
+  /// @return The tabulated 1D basis functions (and derivatives) and the
+  /// shape. The shape is (tdim, nd + 1, number of points, number of 1D
+  /// dofs).
+  std::pair<std::vector<F>, std::array<std::size_t, 4>>
+  tabulate_tensor_factors(int nd, impl::mdspan_t<const F, 2> x) const;
+
   /// Indicates whether or not the interpolation matrix for this element
   /// is an identity matrix
   bool interpolation_is_identity() const { return _interpolation_is_identity; }
@@ -1127,14 +1463,43 @@ public:
   /// Get dof layout
   const std::vector<int>& dof_ordering() const { return _dof_ordering; }
 
+  /// @brief Serialize the element into a binary buffer.
+  ///
+  /// The buffer holds all data of the element, including data that is
+  /// computed when the element is created (the dual matrix, the
+  /// coefficients and the entity transformations). An element can be
+  /// recreated from the buffer without repeating these computations
+  /// using `FiniteElement::deserialize`.
+  ///
+  /// The buffer is tagged with the Basix version and the scalar type.
+  /// It is intended for caching, not as a stable storage format.
+  ///
+  /// @return The serialized element
+  std::vector<std::byte> serialize() const;
+
+  /// @brief Create an element from a buffer created by
+  /// `FiniteElement::serialize`.
+  ///
+  /// Throws an exception if the buffer was not created by the same
+  /// version of Basix with the same scalar type, or if it is malformed.
+  ///
+  /// @param[in] data The serialized element
+  /// @return The element
+  static FiniteElement deserialize(std::span<const std::byte> data);
+
 private:
+  // Create an uninitialised element. Used by deserialize.
+  FiniteElement() = default;
+
+  // Tie all data members, except the tensor factors, for serialization
+  template <typename Self>
+  static auto tie_members(Self& e);
   // Data permutation
   // @param data Data to be permuted
   // @param block_size
   // @param cell_info Cell bitmap selecting required permutations
-  // @param eperm Permutation to use
-  // @param post Whether reflect is pre- or post- rotation.
-  template <typename T, bool post>
+  // @param eperm Permutation for each orientation of each entity type
+  template <typename T>
   void permute_data(
       std::span<T> data, int block_size, std::uint32_t cell_info,
       const std::map<cell::type, std::vector<std::vector<std::size_t>>>& eperm)
@@ -1149,13 +1514,41 @@ private:
   /// @param data Data to be transformed (using matrices)
   /// @param block_size
   /// @param cell_info Cell bitmap selecting required transforms
-  /// @param etrans Transformation matrices
-  /// @param post Whether reflect is pre- or post- rotation.
-  template <typename T, bool post, typename OP>
+  /// @param etrans Transformation matrix for each orientation of each
+  /// entity type
+  template <typename T, typename OP>
   void
   transform_data(std::span<T> data, int block_size, std::uint32_t cell_info,
                  const std::map<cell::type, trans_data_t>& etrans, OP op) const;
 
+  // Compose the entity permutations and transformations for each
+  // orientation of each entity, so that each entity is transformed by
+  // a single permutation or matrix, and expand the composed matrices to
+  // dense matrices for the batched transformations
+  void compose_entity_transformations();
+
+  /// Data transformation for many cells
+  /// @param data Data to be transformed, for each cell
+  /// @param block_size
+  /// @param cell_info Cell bitmap selecting required transforms, for
+  /// each cell
+  /// @param etrans Dense transformation of each state of each entity
+  /// type. From the right, the transpose of these is applied.
+  /// @param right Whether the transformation is applied from the right
+  /// @param op Function that transforms the data of one cell, used
+  /// when the DOF transformations are permutations
+  template <typename T, typename OP>
+  void transform_data_batched(
+      std::span<T> data, int block_size,
+      std::span<const std::uint32_t> cell_info,
+      const std::map<cell::type, std::vector<std::vector<F>>>& etrans,
+      bool right, OP op) const;
+
+  // Compute C = A * B, where A, B and C are row-major matrices
+  static void dot(std::span<const F> A, std::array<std::size_t, 2> Ashape,
+                  std::span<const F> B, std::array<std::size_t, 2> Bshape,
+                  std::span<F> C);
+
   // Cell type
   cell::type _cell_type;
 
@@ -1205,6 +1598,12 @@ private:
   // (@f$\psi_{i}@f$).
   std::pair<std::vector<F>, std::array<std::size_t, 2>> _coeffs;
 
+  // The coefficients in _coeffs split by value component, with the dof
+  // ordering applied. Column (i * value_size + j) holds the
+  // coefficients of component j of basis function i, i.e. the shape is
+  // (polyset dim, ndofs * value_size).
+  std::pair<std::vector<F>, std::array<std::size_t, 2>> _coeffs_split;
+
   // Dofs associated with each cell (sub-)entity
   std::vector<std::vector<std::vector<int>>> _edofs;
 
@@ -1259,6 +1658,29 @@ private:
   // The inverse transpose entity transformations in precomputed form
   std::map<cell::type, trans_data_t> _etrans_invT;
 
+  // The permutations and transformations above, composed for each
+  // orientation of each entity type. These are indexed by the bits of
+  // the cell info for the entity: 0 and 1 for an interval (reversed),
+  // and 0 to 7 for a face (reflected + 2 * number of rotations). These
+  // are computed by compose_entity_transformations and are not
+  // serialized.
+  std::map<cell::type, std::vector<std::vector<std::size_t>>> _eperm_states;
+  std::map<cell::type, std::vector<std::vector<std::size_t>>> _eperm_rev_states;
+  std::map<cell::type, trans_data_t> _etrans_states;
+  std::map<cell::type, trans_data_t> _etransT_states;
+  std::map<cell::type, trans_data_t> _etrans_inv_states;
+  std::map<cell::type, trans_data_t> _etrans_invT_states;
+
+  // The composed transformations as dense row-major matrices, used by
+  // the batched DOF transformations. The matrix D for each state is
+  // such that applying the state to data from the left computes D *
+  // data. These are computed by compose_entity_transformations and are
+  // not serialized.
+  std::map<cell::type, std::vector<std::vector<F>>> _etrans_dense;
+  std::map<cell::type, std::vector<std::vector<F>>> _etransT_dense;
+  std::map<cell::type, std::vector<std::vector<F>>> _etrans_inv_dense;
+  std::map<cell::type, std::vector<std::vector<F>>> _etrans_invT_dense;
+
   // Indicates whether or not this is the discontinuous version of the
   // element
   bool _discontinuous;
@@ -1357,7 +1779,7 @@ std::string version();
 
 //-----------------------------------------------------------------------------
 template <std::floating_point F>
-template <typename T, bool post>
+template <typename T>
 void FiniteElement<F>::permute_data(
     std::span<T> data, int block_size, std::uint32_t cell_info,
     const std::map<cell::type, std::vector<std::vector<std::size_t>>>& eperm)
@@ -1371,12 +1793,12 @@ void FiniteElement<F>::permute_data(
 
     // Permute DOFs on edges
     {
-      auto& trans = eperm.at(cell::type::interval)[0];
+      auto& trans = eperm.at(cell::type::interval);
       for (std::size_t e = 0; e < _edofs[1].size(); ++e)
       {
         // Reverse an edge
         if (cell_info >> (face_start + e) & 1)
-          precompute::pre_apply_permutation_mapped(trans, data, _edofs[1][e],
+          precompute::pre_apply_permutation_mapped(trans[1], data, _edofs[1][e],
                                                    block_size);
       }
     }
@@ -1386,26 +1808,11 @@ void FiniteElement<F>::permute_data(
       // Permute DOFs on faces
       for (std::size_t f = 0; f < _edofs[2].size(); ++f)
       {
-        auto& trans = eperm.at(_cell_subentity_types[2][f]);
-
-        // Reflect a face (pre rotate)
-        if (!post and cell_info >> (3 * f) & 1)
+        // Reflect and rotate a face
+        if (std::uint32_t v = cell_info >> (3 * f) & 7; v != 0)
         {
-          precompute::pre_apply_permutation_mapped(trans[1], data, _edofs[2][f],
-                                                   block_size);
-        }
-
-        // Rotate a face
-        for (std::uint32_t r = 0; r < (cell_info >> (3 * f + 1) & 3); ++r)
-        {
-          precompute::pre_apply_permutation_mapped(trans[0], data, _edofs[2][f],
-                                                   block_size);
-        }
-
-        // Reflect a face (post rotate)
-        if (post and cell_info >> (3 * f) & 1)
-        {
-          precompute::pre_apply_permutation_mapped(trans[1], data, _edofs[2][f],
+          auto& trans = eperm.at(_cell_subentity_types[2][f]);
+          precompute::pre_apply_permutation_mapped(trans[v], data, _edofs[2][f],
                                                    block_size);
         }
       }
@@ -1414,7 +1821,7 @@ void FiniteElement<F>::permute_data(
 }
 //-----------------------------------------------------------------------------
 template <std::floating_point F>
-template <typename T, bool post, typename OP>
+template <typename T, typename OP>
 void FiniteElement<F>::transform_data(
     std::span<T> data, int block_size, std::uint32_t cell_info,
     const std::map<cell::type, trans_data_t>& etrans, OP op) const
@@ -1430,7 +1837,7 @@ void FiniteElement<F>::transform_data(
 
     // Transform DOFs on edges
     {
-      auto& [v_size_t, matrix] = etrans.at(cell::type::interval)[0];
+      auto& [v_size_t, matrix] = etrans.at(cell::type::interval)[1];
       for (std::size_t e = 0; e < _edofs[1].size(); ++e)
       {
         // Reverse an edge
@@ -1446,45 +1853,180 @@ void FiniteElement<F>::transform_data(
 
     if (_cell_tdim == 3)
     {
-      // Permute DOFs on faces
+      // Transform DOFs on faces
       for (std::size_t f = 0; f < _edofs[2].size(); ++f)
       {
-        auto& trans = etrans.at(_cell_subentity_types[2][f]);
-
-        // Reflect a face (pre rotation)
-        if (!post and cell_info >> (3 * f) & 1)
+        // Reflect and rotate a face
+        if (std::uint32_t v = cell_info >> (3 * f) & 7; v != 0)
         {
-          const auto& m = trans[1];
-          const auto& v_size_t = std::get<0>(m);
-          const auto& matrix = std::get<1>(m);
+          auto& [v_size_t, matrix] = etrans.at(_cell_subentity_types[2][f])[v];
           op(std::span(v_size_t),
              mdspan_t<const F, 2>(matrix.first.data(), matrix.second), data,
              dofstart, block_size);
         }
+        dofstart += _edofs[2][f].size();
+      }
+    }
+  }
+}
+//-----------------------------------------------------------------------------
+template <std::floating_point F>
+template <typename T, typename OP>
+void FiniteElement<F>::transform_data_batched(
+    std::span<T> data, int block_size, std::span<const std::uint32_t> cell_info,
+    const std::map<cell::type, std::vector<std::vector<F>>>& etrans, bool right,
+    OP op) const
+{
+  profiling::timer timer("FiniteElement::dof_transformations");
+  const std::size_t ndofs = this->dim();
+  const std::size_t bs = block_size;
+  const std::size_t cell_size = ndofs * bs;
+  if (data.size() != cell_info.size() * cell_size)
+    throw std::runtime_error("Data has the wrong size.");
+
+  if (_dof_transformations_are_identity)
+    return;
+
+  // Permutations are cheap to apply, so are applied cell by cell
+  if (_dof_transformations_are_permutations)
+  {
+    for (std::size_t c = 0; c < cell_info.size(); ++c)
+      op(data.subspan(c * cell_size, cell_size), block_size, cell_info[c]);
+    return;
+  }
+
+  // The sub-entities that are transformed, as (first bit of cell_info,
+  // mask of bits, first dof, number of dofs), and the dense
+  // transformation of each state of each sub-entity. The layout matches
+  // transform_data.
+  std::vector<std::array<std::size_t, 4>> entities;
+  std::vector<const std::vector<std::vector<F>>*> entity_trans;
+  if (_cell_tdim >= 2)
+  {
+    const std::size_t face_start = _cell_tdim == 3 ? 3 * _edofs[2].size() : 0;
+    std::size_t dofstart = 0;
+    for (auto& edofs0 : _edofs[0])
+      dofstart += edofs0.size();
+    for (std::size_t e = 0; e < _edofs[1].size(); ++e)
+    {
+      entities.push_back({face_start + e, 1, dofstart, _edofs[1][e].size()});
+      entity_trans.push_back(&etrans.at(cell::type::interval));
+      dofstart += _edofs[1][e].size();
+    }
+    if (_cell_tdim == 3)
+    {
+      for (std::size_t f = 0; f < _edofs[2].size(); ++f)
+      {
+        entities.push_back({3 * f, 7, dofstart, _edofs[2][f].size()});
+        entity_trans.push_back(&etrans.at(_cell_subentity_types[2][f]));
+        dofstart += _edofs[2][f].size();
+      }
+    }
+  }
+
+  // Cells are processed in chunks, so that the data of a chunk stays in
+  // cache while each entity is transformed
+  constexpr std::size_t chunk = 256;
+  std::vector<T> X, Y;
+  std::vector<F> At;
+  std::array<std::vector<std::size_t>, 8> cells;
+  for (std::size_t c0 = 0; c0 < cell_info.size(); c0 += chunk)
+  {
+    const std::size_t c1 = std::min(c0 + chunk, cell_info.size());
+    for (std::size_t e = 0; e < entities.size(); ++e)
+    {
+      auto [shift, mask, d0, n] = entities[e];
+      if (n == 0)
+        continue;
+
+      // Group the cells by the orientation of the entity
+      for (auto& c : cells)
+        c.clear();
+      for (std::size_t c = c0; c < c1; ++c)
+      {
+        if (std::uint32_t v = (cell_info[c] >> shift) & mask; v != 0)
+          cells[v].push_back(c);
+      }
 
-        // Rotate a face
-        for (std::uint32_t r = 0; r < (cell_info >> (3 * f + 1) & 3); ++r)
+      for (std::uint32_t v = 1; v <= mask; ++v)
+      {
+        const std::vector<std::size_t>& group = cells[v];
+        if (group.empty())
+          continue;
+
+        // Gather the entity data of the cells in the group, transform
+        // it and scatter it back. From the left, X has shape (n, m) and
+        // Y = AX. From the right, X has shape (m, n) and Y = XA^T.
+        std::span<const F> Ae((*entity_trans[e])[v]);
+        if (right)
         {
-          const auto& m = trans[0];
-          const auto& v_size_t = std::get<0>(m);
-          const auto& matrix = std::get<1>(m);
-          op(std::span(v_size_t),
-             mdspan_t<const F, 2>(matrix.first.data(), matrix.second), data,
-             dofstart, block_size);
+          At.resize(n * n);
+          for (std::size_t i = 0; i < n; ++i)
+            for (std::size_t j = 0; j < n; ++j)
+              At[j * n + i] = Ae[i * n + j];
+          Ae = At;
+        }
+        const std::size_t m = group.size() * bs;
+        X.resize(n * m);
+        Y.resize(n * m);
+        if (right)
+        {
+          for (std::size_t s = 0; s < group.size(); ++s)
+            for (std::size_t b = 0; b < bs; ++b)
+              std::copy_n(data.data() + group[s] * cell_size + b * ndofs + d0,
+                          n, X.data() + (s * bs + b) * n);
+        }
+        else
+        {
+          for (std::size_t s = 0; s < group.size(); ++s)
+            for (std::size_t i = 0; i < n; ++i)
+              std::copy_n(data.data() + group[s] * cell_size + (d0 + i) * bs,
+                          bs, X.data() + i * m + s * bs);
         }
 
-        // Reflect a face (post rotation)
-        if (post and cell_info >> (3 * f) & 1)
+        std::array<std::size_t, 2> Ashape = {n, n};
+        std::array<std::size_t, 2> Xshape
+            = right ? std::array{m, n} : std::array{n, m};
+        if constexpr (std::is_same_v<T, F>)
         {
-          const auto& m = trans[1];
-          const auto& v_size_t = std::get<0>(m);
-          const auto& matrix = std::get<1>(m);
-          op(std::span(v_size_t),
-             mdspan_t<const F, 2>(matrix.first.data(), matrix.second), data,
-             dofstart, block_size);
+          if (right)
+            dot(X, Xshape, Ae, Ashape, Y);
+          else
+            dot(Ae, Ashape, X, Xshape, Y);
+        }
+        else
+        {
+          std::fill(Y.begin(), Y.end(), 0);
+          if (right)
+          {
+            for (std::size_t r = 0; r < m; ++r)
+              for (std::size_t k = 0; k < n; ++k)
+                for (std::size_t j = 0; j < n; ++j)
+                  Y[r * n + j] += X[r * n + k] * Ae[k * n + j];
+          }
+          else
+          {
+            for (std::size_t i = 0; i < n; ++i)
+              for (std::size_t k = 0; k < n; ++k)
+                for (std::size_t r = 0; r < m; ++r)
+                  Y[i * m + r] += Ae[i * n + k] * X[k * m + r];
+          }
         }
 
-        dofstart += _edofs[2][f].size();
+        if (right)
+        {
+          for (std::size_t s = 0; s < group.size(); ++s)
+            for (std::size_t b = 0; b < bs; ++b)
+              std::copy_n(Y.data() + (s * bs + b) * n, n,
+                          data.data() + group[s] * cell_size + b * ndofs + d0);
+        }
+        else
+        {
+          for (std::size_t s = 0; s < group.size(); ++s)
+            for (std::size_t i = 0; i < n; ++i)
+              std::copy_n(Y.data() + i * m + s * bs, bs,
+                          data.data() + group[s] * cell_size + (d0 + i) * bs);
+        }
       }
     }
   }
@@ -1500,12 +2042,12 @@ void FiniteElement<F>::pre_apply_dof_transformation(
 
   if (_dof_transformations_are_permutations)
   {
-    permute_data<T, false>(data, block_size, cell_info, _eperm);
+    permute_data<T>(data, block_size, cell_info, _eperm_states);
   }
   else
   {
-    transform_data<T, false>(data, block_size, cell_info, _etrans,
-                             precompute::pre_apply_matrix<F, T>);
+    transform_data<T>(data, block_size, cell_info, _etrans_states,
+                      precompute::pre_apply_matrix<F, T>);
   }
 }
 //-----------------------------------------------------------------------------
@@ -1519,12 +2061,12 @@ void FiniteElement<F>::pre_apply_transpose_dof_transformation(
 
   if (_dof_transformations_are_permutations)
   {
-    permute_data<T, true>(data, block_size, cell_info, _eperm_rev);
+    permute_data<T>(data, block_size, cell_info, _eperm_rev_states);
   }
   else
   {
-    transform_data<T, true>(data, block_size, cell_info, _etransT,
-                            precompute::pre_apply_matrix<F, T>);
+    transform_data<T>(data, block_size, cell_info, _etransT_states,
+                      precompute::pre_apply_matrix<F, T>);
   }
 }
 //-----------------------------------------------------------------------------
@@ -1538,12 +2080,12 @@ void FiniteElement<F>::pre_apply_inverse_transpose_dof_transformation(
 
   if (_dof_transformations_are_permutations)
   {
-    permute_data<T, false>(data, block_size, cell_info, _eperm);
+    permute_data<T>(data, block_size, cell_info, _eperm_states);
   }
   else
   {
-    transform_data<T, false>(data, block_size, cell_info, _etrans_invT,
-                             precompute::pre_apply_matrix<F, T>);
+    transform_data<T>(data, block_size, cell_info, _etrans_invT_states,
+                      precompute::pre_apply_matrix<F, T>);
   }
 }
 //-----------------------------------------------------------------------------
@@ -1557,12 +2099,12 @@ void FiniteElement<F>::pre_apply_inverse_dof_transformation(
 
   if (_dof_transformations_are_permutations)
   {
-    permute_data<T, true>(data, block_size, cell_info, _eperm_rev);
+    permute_data<T>(data, block_size, cell_info, _eperm_rev_states);
   }
   else
   {
-    transform_data<T, true>(data, block_size, cell_info, _etrans_inv,
-                            precompute::pre_apply_matrix<F, T>);
+    transform_data<T>(data, block_size, cell_info, _etrans_inv_states,
+                      precompute::pre_apply_matrix<F, T>);
   }
 }
 //-----------------------------------------------------------------------------
@@ -1581,13 +2123,13 @@ void FiniteElement<F>::post_apply_transpose_dof_transformation(
     for (int i = 0; i < block_size; ++i)
     {
       std::span<T> dblock(data.data() + i * step, step);
-      permute_data<T, false>(dblock, 1, cell_info, _eperm);
+      permute_data<T>(dblock, 1, cell_info, _eperm_states);
     }
   }
   else
   {
-    transform_data<T, false>(data, block_size, cell_info, _etrans,
-                             precompute::post_apply_tranpose_matrix<F, T>);
+    transform_data<T>(data, block_size, cell_info, _etrans_states,
+                      precompute::post_apply_tranpose_matrix<F, T>);
   }
 }
 //-----------------------------------------------------------------------------
@@ -1606,13 +2148,13 @@ void FiniteElement<F>::post_apply_inverse_dof_transformation(
     for (int i = 0; i < block_size; ++i)
     {
       std::span<T> dblock(data.data() + i * step, step);
-      permute_data<T, false>(dblock, 1, cell_info, _eperm);
+      permute_data<T>(dblock, 1, cell_info, _eperm_states);
     }
   }
   else
   {
-    transform_data<T, false>(data, block_size, cell_info, _etrans_invT,
-                             precompute::post_apply_tranpose_matrix<F, T>);
+    transform_data<T>(data, block_size, cell_info, _etrans_invT_states,
+                      precompute::post_apply_tranpose_matrix<F, T>);
   }
 }
 //-----------------------------------------------------------------------------
@@ -1631,13 +2173,13 @@ void FiniteElement<F>::post_apply_dof_transformation(
     for (int i = 0; i < block_size; ++i)
     {
       std::span<T> dblock(data.data() + i * step, step);
-      permute_data<T, true>(dblock, 1, cell_info, _eperm_rev);
+      permute_data<T>(dblock, 1, cell_info, _eperm_rev_states);
     }
   }
   else
   {
-    transform_data<T, true>(data, block_size, cell_info, _etransT,
-                            precompute::post_apply_tranpose_matrix<F, T>);
+    transform_data<T>(data, block_size, cell_info, _etransT_states,
+                      precompute::post_apply_tranpose_matrix<F, T>);
   }
 }
 //-----------------------------------------------------------------------------
@@ -1656,13 +2198,13 @@ void FiniteElement<F>::post_apply_inverse_transpose_dof_transformation(
     for (int i = 0; i < block_size; ++i)
     {
       std::span<T> dblock(data.data() + i * step, step);
-      permute_data<T, true>(dblock, 1, cell_info, _eperm_rev);
+      permute_data<T>(dblock, 1, cell_info, _eperm_rev_states);
     }
   }
   else
   {
-    transform_data<T, true>(data, block_size, cell_info, _etrans_inv,
-                            precompute::post_apply_tranpose_matrix<F, T>);
+    transform_data<T>(data, block_size, cell_info, _etrans_inv_states,
+                      precompute::post_apply_tranpose_matrix<F, T>);
   }
 }
 //-----------------------------------------------------------------------------
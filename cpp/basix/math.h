@@ -7,6 +7,7 @@
 #pragma once
 
 #include "mdspan.hpp"
+#include "profiling.h"
 #include <array>
 #include <cmath>
 #include <concepts>
@@ -34,6 +35,16 @@ extern "C"
               double* a, int* lda, double* b, int* ldb, double* beta, double* c,
               int* ldc);
 
+  void sgeqrf_(int* m, int* n, float* a, int* lda, float* tau, float* work,
+               int* lwork, int* info);
+  void dgeqrf_(int* m, int* n, double* a, int* lda, double* tau, double* work,
+               int* lwork, int* info);
+
+  void sorgqr_(int* m, int* n, int* k, float* a, int* lda, float* tau,
+               float* work, int* lwork, int* info);
+  void dorgqr_(int* m, int* n, int* k, double* a, int* lda, double* tau,
+               double* work, int* lwork, int* info);
+
   int sgetrf_(const int* m, const int* n, float* a, const int* lda, int* lpiv,
               int* info);
   int dgetrf_(const int* m, const int* n, double* a, const int* lda, int* lpiv,
@@ -85,6 +96,54 @@ void dot_blas(std::span<const T> A, std::array<std::size_t, 2> Ashape,
   }
 }
 
+/// Compute C = alpha * op(A) * op(B) + beta * C using BLAS, where
+/// op(X) is X or its transpose. The matrices are row-major, with
+/// leading dimensions lda, ldb and ldc. C is unchanged if m, n or k is
+/// zero.
+/// @param[in] transA If true, op(A) is the transpose of A
+/// @param[in] transB If true, op(B) is the transpose of B
+/// @param[in] m Number of rows of op(A) and C
+/// @param[in] n Number of columns of op(B) and C
+/// @param[in] k Number of columns of op(A) and rows of op(B)
+/// @param[in] alpha Scale of the product
+/// @param[in] A Input matrix
+/// @param[in] lda Leading dimension of A
+/// @param[in] B Input matrix
+/// @param[in] ldb Leading dimension of B
+/// @param[in] beta Scale of C
+/// @param[in,out] C Output matrix
+/// @param[in] ldc Leading dimension of C
+template <std::floating_point T>
+void gemm_blas(bool transA, bool transB, std::size_t m, std::size_t n,
+               std::size_t k, T alpha, const T* A, std::size_t lda, const T* B,
+               std::size_t ldb, T beta, T* C, std::size_t ldc)
+{
+  static_assert(std::is_same_v<T, float> or std::is_same_v<T, double>);
+  if (m == 0 or n == 0 or k == 0)
+    return;
+
+  // A row-major matrix is the transpose of a column-major matrix, so
+  // compute C^T = op(B)^T * op(A)^T
+  int M = n;
+  int N = m;
+  int K = k;
+  int _lda = lda;
+  int _ldb = ldb;
+  int _ldc = ldc;
+  char ta = transA ? 'T' : 'N';
+  char tb = transB ? 'T' : 'N';
+  if constexpr (std::is_same_v<T, float>)
+  {
+    sgemm_(&tb, &ta, &M, &N, &K, &alpha, const_cast<T*>(B), &_ldb,
+           const_cast<T*>(A), &_lda, &beta, C, &_ldc);
+  }
+  else if constexpr (std::is_same_v<T, double>)
+  {
+    dgemm_(&tb, &ta, &M, &N, &K, &alpha, const_cast<T*>(B), &_ldb,
+           const_cast<T*>(A), &_lda, &beta, C, &_ldc);
+  }
+}
+
 } // namespace impl
 
 /// @brief Compute the outer product of vectors u and v.
@@ -355,6 +414,11 @@ std::vector<T> eye(std::size_t n)
 }
 
 /// Orthogonalise the rows of a matrix (in place)
+///
+/// The rows are orthonormalised in order, as by the Gram-Schmidt
+/// process, using a Householder QR factorisation of the transpose of
+/// the matrix computed by LAPACK.
+///
 /// @param[in] wcoeffs The matrix
 /// @param[in] start The row to start from. The rows before this should already
 /// be orthogonal
@@ -365,28 +429,85 @@ void orthogonalise(
         wcoeffs,
     std::size_t start = 0)
 {
-  for (std::size_t i = start; i < wcoeffs.extent(0); ++i)
+  profiling::timer timer("math::orthogonalise");
+  if (start >= wcoeffs.extent(0))
+    return;
+
+  // The rows from start onwards, in row-major order, are the columns of
+  // a column-major (ncols x nrows) matrix A. Factorise A = QR, then
+  // overwrite A with Q.
+  if (wcoeffs.extent(0) - start > wcoeffs.extent(1))
   {
-    for (std::size_t j = start; j < i; ++j)
-    {
-      T a = 0;
-      for (std::size_t k = 0; k < wcoeffs.extent(1); ++k)
-        a += wcoeffs(i, k) * wcoeffs(j, k);
-      for (std::size_t k = 0; k < wcoeffs.extent(1); ++k)
-        wcoeffs(i, k) -= a * wcoeffs(j, k);
-    }
+    throw std::runtime_error(
+        "Cannot orthogonalise the rows of a matrix with incomplete row rank");
+  }
+  int M = wcoeffs.extent(1);
+  int N = wcoeffs.extent(0) - start;
+  int lda = M;
+  T* A = wcoeffs.data_handle() + start * wcoeffs.extent(1);
+  std::vector<T> tau(N);
+  int lwork = -1;
+  int info;
+  std::vector<T> work(1);
+
+  // Query optimal workspace size
+  if constexpr (std::is_same_v<T, float>)
+    sgeqrf_(&M, &N, A, &lda, tau.data(), work.data(), &lwork, &info);
+  else if constexpr (std::is_same_v<T, double>)
+    dgeqrf_(&M, &N, A, &lda, tau.data(), work.data(), &lwork, &info);
+  if (info != 0)
+    throw std::runtime_error("Could not find workspace size for geqrf.");
 
-    T norm = 0;
-    for (std::size_t k = 0; k < wcoeffs.extent(1); ++k)
-      norm += wcoeffs(i, k) * wcoeffs(i, k);
-    if (std::abs(norm) < 4 * std::numeric_limits<T>::epsilon())
+  work.resize(work[0]);
+  lwork = work.size();
+  if constexpr (std::is_same_v<T, float>)
+    sgeqrf_(&M, &N, A, &lda, tau.data(), work.data(), &lwork, &info);
+  else if constexpr (std::is_same_v<T, double>)
+    dgeqrf_(&M, &N, A, &lda, tau.data(), work.data(), &lwork, &info);
+  if (info != 0)
+    throw std::runtime_error("QR factorisation failed: "
+                             + std::to_string(info));
+
+  // The diagonal of R is (up to sign) the norm of each row after the
+  // components in the directions of the previous rows are removed. The
+  // sign of each row of Q is chosen so that the diagonal of R is
+  // positive, as in the Gram-Schmidt process.
+  std::vector<T> sign(N);
+  for (int i = 0; i < N; ++i)
+  {
+    T r = A[i * lda + i];
+    if (r * r < 4 * std::numeric_limits<T>::epsilon())
     {
       throw std::runtime_error(
           "Cannot orthogonalise the rows of a matrix with incomplete row rank");
     }
+    sign[i] = r < 0 ? -1 : 1;
+  }
 
-    for (std::size_t k = 0; k < wcoeffs.extent(1); ++k)
-      wcoeffs(i, k) /= std::sqrt(norm);
+  lwork = -1;
+  if constexpr (std::is_same_v<T, float>)
+    sorgqr_(&M, &N, &N, A, &lda, tau.data(), work.data(), &lwork, &info);
+  else if constexpr (std::is_same_v<T, double>)
+    dorgqr_(&M, &N, &N, A, &lda, tau.data(), work.data(), &lwork, &info);
+  if (info != 0)
+    throw std::runtime_error("Could not find workspace size for orgqr.");
+
+  work.resize(work[0]);
+  lwork = work.size();
+  if constexpr (std::is_same_v<T, float>)
+    sorgqr_(&M, &N, &N, A, &lda, tau.data(), work.data(), &lwork, &info);
+  else if constexpr (std::is_same_v<T, double>)
+    dorgqr_(&M, &N, &N, A, &lda, tau.data(), work.data(), &lwork, &info);
+  if (info != 0)
+    throw std::runtime_error("Computing Q failed: " + std::to_string(info));
+
+  for (int i = 0; i < N; ++i)
+  {
+    if (sign[i] < 0)
+    {
+      for (int k = 0; k < M; ++k)
+        A[i * lda + k] = -A[i * lda + k];
+    }
   }
 }
 //-----------------------------------------------------------------------------
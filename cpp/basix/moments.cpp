@@ -6,6 +6,7 @@
 #include "cell.h"
 #include "finite-element.h"
 #include "math.h"
+#include "profiling.h"
 #include "quadrature.h"
 
 using namespace basix;
@@ -107,6 +108,7 @@ moments::make_integral_moments(const FiniteElement<T>& V, cell::type celltype,
                                polyset::type ptype, std::size_t value_size,
                                int q_deg)
 {
+  profiling::timer timer("moments::make_integral_moments");
   const cell::type sub_celltype = V.cell_type();
   const std::size_t entity_dim = cell::topological_dimension(sub_celltype);
   if (entity_dim == 0)
@@ -199,6 +201,7 @@ moments::make_dot_integral_moments(const FiniteElement<T>& V,
                                    cell::type celltype, polyset::type ptype,
                                    std::size_t value_size, int q_deg)
 {
+  profiling::timer timer("moments::make_dot_integral_moments");
   const cell::type sub_celltype = V.cell_type();
   const std::size_t entity_dim = cell::topological_dimension(sub_celltype);
   const std::size_t num_entities = cell::num_sub_entities(celltype, entity_dim);
@@ -276,6 +279,7 @@ moments::make_tangent_integral_moments(const FiniteElement<T>& V,
                                        cell::type celltype, polyset::type ptype,
                                        std::size_t value_size, int q_deg)
 {
+  profiling::timer timer("moments::make_tangent_integral_moments");
   const cell::type sub_celltype = V.cell_type();
   const std::size_t entity_dim = cell::topological_dimension(sub_celltype);
   const std::size_t num_entities = cell::num_sub_entities(celltype, entity_dim);
@@ -351,6 +355,7 @@ moments::make_normal_integral_moments(const FiniteElement<T>& V,
                                       cell::type celltype, polyset::type ptype,
                                       std::size_t value_size, int q_deg)
 {
+  profiling::timer timer("moments::make_normal_integral_moments");
   const std::size_t tdim = cell::topological_dimension(celltype);
   assert(tdim == value_size);
   const cell::type sub_celltype = V.cell_type();
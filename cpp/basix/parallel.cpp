@@ -0,0 +1,134 @@
+// Copyright (c) 2024 Basix contributors
+// FEniCS Project
+// SPDX-License-Identifier:    MIT
+
+#include "parallel.h"
+#include <algorithm>
+#include <atomic>
+#include <exception>
+#include <stdexcept>
+#include <string>
+#include <thread>
+#include <vector>
+
+using namespace basix;
+
+namespace
+{
+/// Default number of threads
+std::atomic<int> default_num_threads = 1;
+
+/// True on threads that are running items of a parallel kernel
+thread_local bool in_parallel_region = false;
+
+/// Number of hardware threads
+int hardware_threads()
+{
+  return std::max(1, (int)std::thread::hardware_concurrency());
+}
+} // namespace
+
+//-----------------------------------------------------------------------------
+void parallel::set_num_threads(int num_threads)
+{
+  if (num_threads < 0)
+  {
+    throw std::runtime_error("Number of threads must be non-negative (got "
+                             + std::to_string(num_threads) + ").");
+  }
+  default_num_threads = num_threads == 0 ? hardware_threads() : num_threads;
+}
+//-----------------------------------------------------------------------------
+int parallel::get_num_threads() { return default_num_threads; }
+//-----------------------------------------------------------------------------
+std::size_t parallel::num_workers(std::size_t n, int num_threads)
+{
+  if (num_threads < 0)
+  {
+    throw std::runtime_error("Number of threads must be non-negative (got "
+                             + std::to_string(num_threads) + ").");
+  }
+  if (in_parallel_region)
+    return 1;
+  if (num_threads == 0)
+    num_threads = default_num_threads;
+  return std::max<std::size_t>(1, std::min<std::size_t>(n, num_threads));
+}
+//-----------------------------------------------------------------------------
+void parallel::for_each(std::size_t n, int num_threads,
+                        const std::function<void(std::size_t, std::size_t)>& f)
+{
+  // Run contiguous ranges of items, with the first range on the
+  // calling thread. Kernels called by f run on a single thread.
+  const std::size_t nt = num_workers(n, num_threads);
+  std::vector<std::exception_ptr> errors(nt);
+  auto run = [&](std::size_t t)
+  {
+    const bool nested = in_parallel_region;
+    in_parallel_region = true;
+    try
+    {
+      for (std::size_t i = t * n / nt; i < (t + 1) * n / nt; ++i)
+        f(t, i);
+    }
+    catch (...)
+    {
+      errors[t] = std::current_exception();
+    }
+    in_parallel_region = nested;
+  };
+
+  {
+    std::vector<std::jthread> threads;
+    threads.reserve(nt - 1);
+    for (std::size_t t = 1; t < nt; ++t)
+      threads.emplace_back(run, t);
+    run(0);
+  }
+
+  for (auto& e : errors)
+    if (e)
+      std::rethrow_exception(e);
+}
+//-----------------------------------------------------------------------------
+void parallel::run_tasks(std::span<const std::function<void()>> tasks,
+                         int num_threads)
+{
+  const std::size_t nt = num_workers(tasks.size(), num_threads);
+  std::vector<std::exception_ptr> errors(tasks.size());
+  std::atomic<std::size_t> next = 0;
+  std::atomic<bool> failed = false;
+  auto run = [&]()
+  {
+    // Once a task has thrown, no more tasks are started, as later tasks
+    // may rely on checks made by earlier ones
+    const bool nested = in_parallel_region;
+    in_parallel_region = true;
+    for (std::size_t i = next++; i < tasks.size() and !failed; i = next++)
+    {
+      try
+      {
+        tasks[i]();
+      }
+      catch (...)
+      {
+        errors[i] = std::current_exception();
+        failed = true;
+      }
+    }
+    in_parallel_region = nested;
+  };
+
+  {
+    std::vector<std::jthread> threads;
+    threads.reserve(nt - 1);
+    for (std::size_t t = 1; t < nt; ++t)
+      threads.emplace_back(run);
+    run();
+  }
+
+  for (auto& e : errors)
+    if (e)
+      std::rethrow_exception(e);
+}
+//-----------------------------------------------------------------------------
@@ -0,0 +1,86 @@
+// Copyright (c) 2024 Basix contributors
+// FEniCS Project
+// SPDX-License-Identifier:    MIT
+
+#pragma once
+
+#include <cstddef>
+#include <functional>
+#include <span>
+
+/// @brief Multithreaded execution of kernels.
+///
+/// Kernels that work on large sets of points, such as
+/// `polyset::tabulate` and `FiniteElement::tabulate`, can split the
+/// points across a number of threads. By default, a single thread is
+/// used. Points are split into blocks whose size does not depend on
+/// the number of threads, and each block is computed in the same way
+/// whichever thread computes it, so results are identical for any
+/// number of threads.
+///
+/// Element creation runs independent parts of the construction, such
+/// as the moments and moment spaces of each type of sub-entity and the
+/// DOF transformations of each type of sub-entity, as concurrent tasks
+/// using the same number of threads. Each task computes the same data
+/// in the same way as the serial code, so created elements are
+/// identical for any number of threads.
+namespace basix::parallel
+{
+/// @brief Set the number of threads used by default by parallel
+/// kernels.
+///
+/// This setting is shared by all threads of the process.
+///
+/// @param[in] num_threads Number of threads. If 0, the number of
+/// hardware threads is used.
+void set_num_threads(int num_threads);
+
+/// @brief Get the number of threads used by default by parallel
+/// kernels.
+/// @return Number of threads
+int get_num_threads();
+
+/// @brief Run a function for each item in a range, using a number of
+/// threads.
+///
+/// The items are split into contiguous ranges, one per thread, and the
+/// first range is run on the calling thread. Parallel kernels called
+/// by @p f run on a single thread, so threads are not oversubscribed.
+/// If @p f throws, the first exception is rethrown after all threads
+/// have finished.
+///
+/// @param[in] n Number of items
+/// @param[in] num_threads Number of threads. If 0, the number returned
+/// by `get_num_threads` is used.
+/// @param[in] f Function called as `f(thread, item)` for each item,
+/// where `thread` is the index (in `[0, num_threads)`) of the thread
+/// running the item.
+void for_each(std::size_t n, int num_threads,
+              const std::function<void(std::size_t, std::size_t)>& f);
+
+/// @brief Run a number of independent tasks, using a number of
+/// threads.
+///
+/// Each thread repeatedly takes the first task that has not been
+/// started, so tasks of different costs are shared out between the
+/// threads. Tasks are started in order, and the first thread is the
+/// calling thread. Parallel kernels called by the tasks run on a single
+/// thread, so threads are not oversubscribed. If a task throws, no
+/// more tasks are started, and the exception of the first task (in
+/// task order) that threw is rethrown after the running tasks have
+/// finished.
+///
+/// @param[in] tasks The tasks
+/// @param[in] num_threads Number of threads. If 0, the number returned
+/// by `get_num_threads` is used.
+void run_tasks(std::span<const std::function<void()>> tasks,
+               int num_threads = 0);
+
+/// @brief Number of threads that `for_each` will use.
+/// @param[in] n Number of items
+/// @param[in] num_threads Number of threads requested, as passed to
+/// `for_each`.
+/// @return Number of threads
+std::size_t num_workers(std::size_t n, int num_threads);
+
+} // namespace basix::parallel
@@ -6,9 +6,13 @@
 #include "cell.h"
 #include "indexing.h"
 #include "mdspan.hpp"
+#include "parallel.h"
+#include "profiling.h"
+#include <algorithm>
 #include <array>
 #include <cmath>
 #include <stdexcept>
+#include <vector>
 
 using namespace basix;
 using namespace basix::indexing;
@@ -19,6 +23,14 @@ namespace stdex
 namespace
 {
 //-----------------------------------------------------------------------------
+
+/// Points, stored column-major so that each coordinate of the points is
+/// contiguous
+template <typename T>
+using xspan_t = MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
+    const T, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 2>,
+    MDSPAN_IMPL_STANDARD_NAMESPACE::layout_left>;
+//-----------------------------------------------------------------------------
 constexpr int single_choose(int n, int k)
 {
   int out = 1;
@@ -49,10 +61,7 @@ void tabulate_polyset_point_derivs(
     MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
         T, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 3>>
         P,
-    std::size_t, std::size_t nderiv,
-    MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
-        const T, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 2>>
-        x)
+    std::size_t, std::size_t nderiv, xspan_t<T> x)
 {
   assert(x.extent(0) > 0);
   assert(P.extent(0) == nderiv + 1);
@@ -75,10 +84,7 @@ void tabulate_polyset_line_derivs(
     MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
         T, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 3>>
         P,
-    std::size_t n, std::size_t nderiv,
-    MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
-        const T, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 2>>
-        x)
+    std::size_t n, std::size_t nderiv, xspan_t<T> x)
 {
   assert(x.extent(0) > 0);
   assert(P.extent(0) == nderiv + 1);
@@ -140,10 +146,7 @@ void tabulate_polyset_line_macroedge_derivs(
     MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
         T, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 3>>
         P,
-    std::size_t n, std::size_t nderiv,
-    MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
-        const T, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 2>>
-        x)
+    std::size_t n, std::size_t nderiv, xspan_t<T> x)
 {
   assert(x.extent(0) > 0);
   assert(P.extent(0) == nderiv + 1);
@@ -247,10 +250,7 @@ void tabulate_polyset_quadrilateral_macroedge_derivs(
     MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
         T, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 3>>
         P,
-    std::size_t n, std::size_t nderiv,
-    MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
-        const T, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 2>>
-        x)
+    std::size_t n, std::size_t nderiv, xspan_t<T> x)
 {
   assert(x.extent(0) > 0);
   assert(P.extent(0) == (nderiv + 1) * (nderiv + 2) / 2);
@@ -464,10 +464,7 @@ void tabulate_polyset_triangle_macroedge_derivs(
     MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
         T, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 3>>
         P,
-    std::size_t n, std::size_t nderiv,
-    MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
-        const T, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 2>>
-        x)
+    std::size_t n, std::size_t nderiv, xspan_t<T> x)
 {
   assert(x.extent(0) > 0);
   assert(P.extent(0) == (nderiv + 1) * (nderiv + 2) / 2);
@@ -959,10 +956,7 @@ void tabulate_polyset_tetrahedron_macroedge_derivs(
     MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
         T, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 3>>
         P,
-    std::size_t n, std::size_t nderiv,
-    MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
-        const T, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 2>>
-        x)
+    std::size_t n, std::size_t nderiv, xspan_t<T> x)
 {
   assert(x.extent(0) > 0);
   assert(P.extent(0) == (nderiv + 1) * (nderiv + 2) * (nderiv + 3) / 6);
@@ -1297,10 +1291,7 @@ void tabulate_polyset_hexahedron_macroedge_derivs(
     MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
         T, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 3>>
         P,
-    std::size_t n, std::size_t nderiv,
-    MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
-        const T, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 2>>
-        x)
+    std::size_t n, std::size_t nderiv, xspan_t<T> x)
 {
   assert(x.extent(0) > 0);
   assert(P.extent(0) == (nderiv + 1) * (nderiv + 2) * (nderiv + 3) / 6);
@@ -1640,10 +1631,7 @@ void tabulate_polyset_triangle_derivs(
     MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
         T, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 3>>
         P,
-    std::size_t n, std::size_t nderiv,
-    MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
-        const T, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 2>>
-        x)
+    std::size_t n, std::size_t nderiv, xspan_t<T> x)
 {
   assert(x.extent(1) == 2);
 
@@ -1804,10 +1792,7 @@ void tabulate_polyset_tetrahedron_derivs(
     MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
         T, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 3>>
         P,
-    std::size_t n, std::size_t nderiv,
-    MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
-        const T, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 2>>
-        x)
+    std::size_t n, std::size_t nderiv, xspan_t<T> x)
 {
   assert(x.extent(1) == 3);
   assert(P.extent(0) == (nderiv + 1) * (nderiv + 2) * (nderiv + 3) / 6);
@@ -2116,10 +2101,7 @@ void tabulate_polyset_pyramid_derivs(
     MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
         T, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 3>>
         P,
-    std::size_t n, std::size_t nderiv,
-    MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
-        const T, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 2>>
-        x)
+    std::size_t n, std::size_t nderiv, xspan_t<T> x)
 {
   assert(x.extent(1) == 3);
   assert(P.extent(0) == (nderiv + 1) * (nderiv + 2) * (nderiv + 3) / 6);
@@ -2387,10 +2369,7 @@ void tabulate_polyset_quad_derivs(
     MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
         T, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 3>>
         P,
-    std::size_t n, std::size_t nderiv,
-    MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
-        const T, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 2>>
-        x)
+    std::size_t n, std::size_t nderiv, xspan_t<T> x)
 {
   assert(x.extent(1) == 2);
   assert(P.extent(0) == (nderiv + 1) * (nderiv + 2) / 2);
@@ -2572,10 +2551,7 @@ void tabulate_polyset_hex_derivs(
     MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
         T, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 3>>
         P,
-    std::size_t n, std::size_t nderiv,
-    MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
-        const T, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 2>>
-        x)
+    std::size_t n, std::size_t nderiv, xspan_t<T> x)
 {
   assert(x.extent(1) == 3);
   assert(P.extent(0) == (nderiv + 1) * (nderiv + 2) * (nderiv + 3) / 6);
@@ -2892,10 +2868,7 @@ void tabulate_polyset_prism_derivs(
     MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
         T, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 3>>
         P,
-    std::size_t n, std::size_t nderiv,
-    MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
-        const T, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 2>>
-        x)
+    std::size_t n, std::size_t nderiv, xspan_t<T> x)
 {
   assert(x.extent(1) == 3);
   assert(P.extent(0) == (nderiv + 1) * (nderiv + 2) * (nderiv + 3) / 6);
@@ -3116,17 +3089,15 @@ void tabulate_polyset_prism_derivs(
     }
   }
 }
-} // namespace
 //-----------------------------------------------------------------------------
-template <std::floating_point T>
-void polyset::tabulate(
+
+/// Tabulate the polyset at a tile of points
+template <typename T>
+void tabulate_tile(
     MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
         T, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 3>>
         P,
-    cell::type celltype, polyset::type ptype, int d, int n,
-    MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
-        const T, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 2>>
-        x)
+    cell::type celltype, polyset::type ptype, int d, int n, xspan_t<T> x)
 {
   switch (ptype)
   {
@@ -3188,6 +3159,150 @@ void polyset::tabulate(
     throw std::runtime_error("Polynomial set: unsupported polynomial type.");
   }
 }
+// Points are processed in tiles that are small enough for the values at
+// the points in the tile to stay in cache during the recurrences. The
+// coordinates of the points in a tile are copied to contiguous scratch
+// space, so the loops over the points in the recurrences can be
+// vectorised.
+
+/// The number of points in each tile, for polynomial sets with the
+/// given number of rows (derivatives times basis functions)
+template <std::floating_point T>
+std::size_t tile_size(std::size_t rows)
+{
+  constexpr std::size_t tile_bytes = 1 << 17;
+  constexpr std::size_t simd_width = 16;
+  std::size_t tile = tile_bytes / (sizeof(T) * std::max<std::size_t>(rows, 1));
+  return std::max(simd_width, tile - tile % simd_width);
+}
+//-----------------------------------------------------------------------------
+
+/// Tabulate the polyset at the points [p0, p0 + np) of x, using scratch
+/// space xb of size np * tdim for the coordinates and, if these are not
+/// all of the points, Pb of size rows * np for the values
+template <std::floating_point T>
+void tabulate_points(
+    MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
+        T, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 3>>
+        P,
+    cell::type celltype, polyset::type ptype, int d, int n,
+    MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
+        const T, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 2>>
+        x,
+    std::size_t p0, std::size_t np, T* xb, T* Pb)
+{
+  const std::size_t npts = x.extent(0);
+  const std::size_t tdim = x.extent(1);
+  for (std::size_t i = 0; i < np; ++i)
+    for (std::size_t j = 0; j < tdim; ++j)
+      xb[j * np + i] = x(p0 + i, j);
+  if (np == npts)
+  {
+    // Tabulate directly into P
+    tabulate_tile(P, celltype, ptype, d, n, xspan_t<T>(xb, np, tdim));
+    return;
+  }
+
+  tabulate_tile(
+      MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
+          T, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 3>>(
+          Pb, P.extent(0), P.extent(1), np),
+      celltype, ptype, d, n, xspan_t<T>(xb, np, tdim));
+  const std::size_t rows = P.extent(0) * P.extent(1);
+  for (std::size_t r = 0; r < rows; ++r)
+    std::copy_n(Pb + r * np, np, P.data_handle() + r * npts + p0);
+}
+//-----------------------------------------------------------------------------
+} // namespace
+//-----------------------------------------------------------------------------
+template <std::floating_point T>
+void polyset::tabulate(
+    MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
+        T, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 3>>
+        P,
+    cell::type celltype, polyset::type ptype, int d, int n,
+    MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
+        const T, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 2>>
+        x)
+{
+  profiling::timer timer("polyset::tabulate");
+
+  const std::size_t npts = x.extent(0);
+  const std::size_t tdim = x.extent(1);
+  const std::size_t rows = P.extent(0) * P.extent(1);
+  const std::size_t tile = tile_size<T>(rows);
+  if (tile >= npts)
+  {
+    std::vector<T> xbuffer(npts * tdim);
+    tabulate_points<T>(P, celltype, ptype, d, n, x, 0, npts, xbuffer.data(),
+                       nullptr);
+    return;
+  }
+
+  // Tiles are independent, so they can be split across threads (see
+  // basix::parallel). Each thread has its own scratch space.
+  const std::size_t ntiles = (npts + tile - 1) / tile;
+  const std::size_t nthreads = parallel::num_workers(ntiles, 0);
+  std::vector<T> xbuffer(nthreads * tile * tdim);
+  std::vector<T> Pbuffer(nthreads * rows * tile);
+  parallel::for_each(
+      ntiles, (int)nthreads,
+      [&](std::size_t thread, std::size_t t)
+      {
+        const std::size_t p0 = t * tile;
+        tabulate_points(P, celltype, ptype, d, n, x, p0,
+                        std::min(tile, npts - p0),
+                        xbuffer.data() + thread * tile * tdim,
+                        Pbuffer.data() + thread * rows * tile);
+      });
+}
+//-----------------------------------------------------------------------------
+template <std::floating_point T>
+void polyset::tabulate(
+    MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
+        T, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 3>>
+        P,
+    cell::type celltype, polyset::type ptype, int d, int n,
+    MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
+        const T, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 2>>
+        x,
+    std::span<T> work)
+{
+  profiling::timer timer("polyset::tabulate");
+
+  const std::size_t npts = x.extent(0);
+  const std::size_t tdim = x.extent(1);
+  const std::size_t rows = P.extent(0) * P.extent(1);
+  if (work.size()
+      < polyset::tabulate_workspace_size<T>(celltype, ptype, d, n, npts))
+  {
+    throw std::runtime_error("Workspace is too small.");
+  }
+
+  const std::size_t tile = std::min(tile_size<T>(rows), npts);
+  T* xb = work.data();
+  T* Pb = work.data() + tile * tdim;
+  for (std::size_t p0 = 0; p0 < npts; p0 += tile)
+  {
+    tabulate_points(P, celltype, ptype, d, n, x, p0, std::min(tile, npts - p0),
+                    xb, Pb);
+  }
+}
+//-----------------------------------------------------------------------------
+template <std::floating_point T>
+std::size_t polyset::tabulate_workspace_size(cell::type celltype,
+                                             polyset::type ptype, int d, int n,
+                                             std::size_t num_points)
+{
+  const std::size_t tdim = cell::topological_dimension(celltype);
+  const std::size_t rows
+      = polyset::nderivs(celltype, n) * polyset::dim(celltype, ptype, d);
+  const std::size_t tile = tile_size<T>(rows);
+  if (tile >= num_points)
+    return num_points * tdim;
+  else
+    return tile * (tdim + rows);
+}
 //-----------------------------------------------------------------------------
 template <std::floating_point T>
 std::pair<std::vector<T>, std::array<std::size_t, 3>> polyset::tabulate(
@@ -3219,6 +3334,27 @@ polyset::tabulate(
     MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
         const double,
         MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 2>>);
+template void polyset::tabulate(
+    MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
+        float, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 3>>,
+    cell::type, polyset::type, int, int,
+    MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
+        const float, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 2>>,
+    std::span<float>);
+template void polyset::tabulate(
+    MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
+        double, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 3>>,
+    cell::type, polyset::type, int, int,
+    MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
+        const double, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 2>>,
+    std::span<double>);
+template std::size_t polyset::tabulate_workspace_size<float>(cell::type,
+                                                             polyset::type, int,
+                                                             int, std::size_t);
+template std::size_t polyset::tabulate_workspace_size<double>(cell::type,
+                                                              polyset::type,
+                                                              int, int,
+                                                              std::size_t);
 /// @endcond
 //-----------------------------------------------------------------------------
 int polyset::dim(cell::type celltype, polyset::type ptype, int d)
@@ -8,6 +8,7 @@
 #include "mdspan.hpp"
 #include <array>
 #include <concepts>
+#include <span>
 #include <utility>
 #include <vector>
 
@@ -200,6 +201,11 @@ tabulate(cell::type celltype, polyset::type ptype, int d, int n,
 /// @note This function will be called at runtime when tabulating a
 /// finite element, so its performance is critical.
 ///
+/// @note Large sets of points are split across
+/// `parallel::get_num_threads()` threads. The result does not depend on
+/// the number of threads. Scratch space is allocated for each call; the
+/// overload that takes a workspace does not allocate memory.
+///
 /// @param[in,out] P Polynomial sets, for each derivative, tabulated at
 /// points. The shape is `(number of derivatives computed, number of
 /// points, basis index)`.
@@ -234,6 +240,47 @@ void tabulate(
         const T, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 2>>
         x);
 
+/// @brief Tabulate the orthonormal polynomial basis, and derivatives,
+/// at points on the reference cell, using caller-provided scratch
+/// space.
+///
+/// This computes the same values as the overload without @p work, but
+/// does not allocate memory. The points are tabulated on the calling
+/// thread.
+///
+/// @param[in,out] P Polynomial sets, for each derivative, tabulated at
+/// points. The shape is `(number of derivatives computed, number of
+/// points, basis index)`.
+/// @param[in] celltype Cell type
+/// @param[in] ptype The polynomial type
+/// @param[in] d Polynomial degree
+/// @param[in] n Maximum derivative order. Use n = 0 for the basis only.
+/// @param[in] x Points at which to evaluate the basis. The shape is
+/// (number of points, geometric dimension).
+/// @param work Scratch space. Its size must be at least
+/// `tabulate_workspace_size<T>(celltype, ptype, d, n, x.extent(0))`.
+template <std::floating_point T>
+void tabulate(
+    MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
+        T, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 3>>
+        P,
+    cell::type celltype, polyset::type ptype, int d, int n,
+    MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
+        const T, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 2>>
+        x,
+    std::span<T> work);
+
+/// @brief Size of the scratch space used by `tabulate`.
+/// @param[in] celltype Cell type
+/// @param[in] ptype The polynomial type
+/// @param[in] d Polynomial degree
+/// @param[in] n Maximum derivative order
+/// @param[in] num_points The number of points
+/// @return The number of entries required in the workspace
+template <std::floating_point T>
+std::size_t tabulate_workspace_size(cell::type celltype, polyset::type ptype,
+                                    int d, int n, std::size_t num_points);
+
 /// @brief Dimension of a polynomial space
 /// @param[in] cell The cell type
 /// @param[in] ptype The polynomial type
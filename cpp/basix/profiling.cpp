@@ -0,0 +1,63 @@
+// Copyright (c) 2024 Basix contributors
+// FEniCS Project
+// SPDX-License-Identifier:    MIT
+
+#include "profiling.h"
+#include <mutex>
+
+using namespace basix;
+
+std::atomic<bool> profiling::impl::enabled = false;
+
+namespace
+{
+/// Mutex protecting the recorded timings and the callback
+std::mutex timings_mutex;
+
+/// Recorded timings
+std::map<std::string, profiling::timing> recorded_timings;
+
+/// Callback called after each timed call
+profiling::callback_type timing_callback;
+} // namespace
+
+//-----------------------------------------------------------------------------
+void profiling::enable(bool enabled) { impl::enabled = enabled; }
+//-----------------------------------------------------------------------------
+bool profiling::is_enabled() { return impl::enabled; }
+//-----------------------------------------------------------------------------
+std::map<std::string, profiling::timing> profiling::timings()
+{
+  std::scoped_lock lock(timings_mutex);
+  return recorded_timings;
+}
+//-----------------------------------------------------------------------------
+void profiling::reset()
+{
+  std::scoped_lock lock(timings_mutex);
+  recorded_timings.clear();
+}
+//-----------------------------------------------------------------------------
+void profiling::set_callback(callback_type callback)
+{
+  std::scoped_lock lock(timings_mutex);
+  timing_callback = std::move(callback);
+}
+//-----------------------------------------------------------------------------
+void profiling::impl::record(const char* name, double time)
+{
+  callback_type callback;
+  {
+    std::scoped_lock lock(timings_mutex);
+    timing& t = recorded_timings[name];
+    ++t.count;
+    t.time += time;
+    callback = timing_callback;
+  }
+
+  // Call outside the lock, so the callback may use the profiling
+  // functions
+  if (callback)
+    callback(name, time);
+}
+//-----------------------------------------------------------------------------
@@ -0,0 +1,111 @@
+// Copyright (c) 2024 Basix contributors
+// FEniCS Project
+// SPDX-License-Identifier:    MIT
+
+#pragma once
+
+#include <atomic>
+#include <chrono>
+#include <cstddef>
+#include <functional>
+#include <map>
+#include <string>
+#include <string_view>
+
+/// @brief Timing of element construction phases and runtime kernels.
+///
+/// Profiling is disabled by default. When it is enabled, the wall time
+/// and number of calls of each instrumented phase (for example
+/// `create_element`, `polyset::tabulate` or `FiniteElement::tabulate`)
+/// are recorded. Times are inclusive: the time of a phase includes the
+/// time of the phases that it calls. When profiling is disabled, an
+/// instrumented phase only checks a flag.
+namespace basix::profiling
+{
+/// Timing of a phase
+struct timing
+{
+  /// Number of calls
+  std::size_t count = 0;
+  /// Total wall time of the calls, in seconds
+  double time = 0;
+};
+
+/// @brief Function called after each call of an instrumented phase,
+/// with the name of the phase and the wall time of the call in
+/// seconds.
+using callback_type = std::function<void(std::string_view, double)>;
+
+/// @brief Enable or disable profiling.
+///
+/// This setting is shared by all threads of the process.
+///
+/// @param[in] enabled If `true`, timings are recorded.
+void enable(bool enabled = true);
+
+/// @brief Check if profiling is enabled.
+/// @return `true` if profiling is enabled.
+bool is_enabled();
+
+/// @brief Get the timings recorded since profiling was enabled or last
+/// reset.
+/// @return Timing of each phase, keyed by the name of the phase.
+std::map<std::string, timing> timings();
+
+/// @brief Remove all recorded timings.
+void reset();
+
+/// @brief Set a function that is called after each call of an
+/// instrumented phase while profiling is enabled.
+///
+/// The callback is called on the thread that ran the phase, so it must
+/// be thread-safe if kernels are called from several threads.
+///
+/// @param[in] callback The callback. Pass an empty function to remove
+/// the callback.
+void set_callback(callback_type callback);
+
+/// @private
+namespace impl
+{
+/// True if profiling is enabled
+extern std::atomic<bool> enabled;
+
+/// Record a call of a phase
+void record(const char* name, double time);
+} // namespace impl
+
+/// @brief Timer that records the wall time of a phase from its
+/// construction to its destruction, if profiling is enabled.
+class timer
+{
+public:
+  /// @brief Start timing a phase.
+  /// @param[in] name Name of the phase. It must outlive the timer.
+  explicit timer(const char* name)
+      : _name(impl::enabled.load(std::memory_order_relaxed) ? name : nullptr)
+  {
+    if (_name)
+      _start = std::chrono::steady_clock::now();
+  }
+
+  /// Stop timing and record the time
+  ~timer()
+  {
+    if (_name)
+    {
+      const std::chrono::duration<double> t
+          = std::chrono::steady_clock::now() - _start;
+      impl::record(_name, t.count());
+    }
+  }
+
+  timer(const timer&) = delete;
+  timer& operator=(const timer&) = delete;
+
+private:
+  const char* _name;
+  std::chrono::steady_clock::time_point _start;
+};
+
+} // namespace basix::profiling
@@ -9,6 +9,10 @@
 #include <array>
 #include <cmath>
 #include <concepts>
+#include <map>
+#include <memory>
+#include <mutex>
+#include <tuple>
 #include <vector>
 
 using namespace basix;
@@ -4889,6 +4893,59 @@ make_macroedge_quadrature(quadrature::type rule, cell::type celltype, int m)
   }
 }
 //-----------------------------------------------------------------------------
+template <std::floating_point T>
+std::array<std::vector<T>, 2> compute_quadrature(quadrature::type rule,
+                                                 cell::type celltype,
+                                                 polyset::type polytype, int m)
+{
+  switch (polytype)
+  {
+  case polyset::type::standard:
+    switch (rule)
+    {
+    case quadrature::type::Default:
+      return compute_quadrature<T>(quadrature::get_default_rule(celltype, m),
+                                   celltype, polytype, m);
+    case quadrature::type::gauss_jacobi:
+      return make_gauss_jacobi_quadrature<T>(celltype, m);
+    case quadrature::type::gll:
+      return make_gll_quadrature<T>(celltype, m);
+    case quadrature::type::xiao_gimbutas:
+      return make_xiao_gimbutas_quadrature<T>(celltype, m);
+    case quadrature::type::zienkiewicz_taylor:
+      return make_zienkiewicz_taylor_quadrature<T>(celltype, m);
+    case quadrature::type::keast:
+      return make_keast_quadrature<T>(celltype, m);
+    case quadrature::type::strang_fix:
+      return make_strang_fix_quadrature<T>(celltype, m);
+    default:
+      throw std::runtime_error("Unknown quadrature rule");
+    }
+  case polyset::type::macroedge:
+    return make_macroedge_quadrature<T>(rule, celltype, m);
+  default:
+    throw std::runtime_error("Unsupported polyset type");
+  }
+}
+//-----------------------------------------------------------------------------
+
+/// Cache of quadrature rules
+template <std::floating_point T>
+struct rule_cache_t
+{
+  std::mutex mutex;
+  std::map<std::tuple<quadrature::type, cell::type, polyset::type, int>,
+           std::shared_ptr<const std::array<std::vector<T>, 2>>>
+      rules;
+};
+//-----------------------------------------------------------------------------
+template <std::floating_point T>
+rule_cache_t<T>& rule_cache()
+{
+  static rule_cache_t<T> c;
+  return c;
+}
+//-----------------------------------------------------------------------------
 } // namespace
 //-----------------------------------------------------------------------------
 quadrature::type quadrature::get_default_rule(cell::type celltype, int m)
@@ -4924,34 +4981,32 @@ std::array<std::vector<T>, 2>
 quadrature::make_quadrature(quadrature::type rule, cell::type celltype,
                             polyset::type polytype, int m)
 {
-  switch (polytype)
+  return *make_quadrature_shared<T>(rule, celltype, polytype, m);
+}
+//-----------------------------------------------------------------------------
+template <std::floating_point T>
+std::shared_ptr<const std::array<std::vector<T>, 2>>
+quadrature::make_quadrature_shared(quadrature::type rule, cell::type celltype,
+                                   polyset::type polytype, int m)
+{
+  if (polytype == polyset::type::standard and rule == type::Default)
+    rule = get_default_rule(celltype, m);
+  const std::tuple key(rule, celltype, polytype, m);
+
+  rule_cache_t<T>& c = rule_cache<T>();
   {
-  case polyset::type::standard:
-    switch (rule)
-    {
-    case quadrature::type::Default:
-      return make_quadrature<T>(get_default_rule(celltype, m), celltype,
-                                polytype, m);
-    case quadrature::type::gauss_jacobi:
-      return make_gauss_jacobi_quadrature<T>(celltype, m);
-    case quadrature::type::gll:
-      return make_gll_quadrature<T>(celltype, m);
-    case quadrature::type::xiao_gimbutas:
-      return make_xiao_gimbutas_quadrature<T>(celltype, m);
-    case quadrature::type::zienkiewicz_taylor:
-      return make_zienkiewicz_taylor_quadrature<T>(celltype, m);
-    case quadrature::type::keast:
-      return make_keast_quadrature<T>(celltype, m);
-    case quadrature::type::strang_fix:
-      return make_strang_fix_quadrature<T>(celltype, m);
-    default:
-      throw std::runtime_error("Unknown quadrature rule");
-    }
-  case polyset::type::macroedge:
-    return make_macroedge_quadrature<T>(rule, celltype, m);
-  default:
-    throw std::runtime_error("Unsupported polyset type");
+    std::scoped_lock lock(c.mutex);
+    if (auto it = c.rules.find(key); it != c.rules.end())
+      return it->second;
   }
+
+  // Compute the rule without holding the lock. If another thread
+  // computes the same rule meanwhile, the first rule to be inserted is
+  // kept.
+  auto q = std::make_shared<const std::array<std::vector<T>, 2>>(
+      compute_quadrature<T>(rule, celltype, polytype, m));
+  std::scoped_lock lock(c.mutex);
+  return c.rules.try_emplace(key, q).first->second;
 }
 //-----------------------------------------------------------------------------
 template <std::floating_point T>
@@ -4975,6 +5030,13 @@ quadrature::make_quadrature(quadrature::type, cell::type, polyset::type, int);
 template std::array<std::vector<double>, 2>
 quadrature::make_quadrature(quadrature::type, cell::type, polyset::type, int);
 
+template std::shared_ptr<const std::array<std::vector<float>, 2>>
+quadrature::make_quadrature_shared(quadrature::type, cell::type, polyset::type,
+                                   int);
+template std::shared_ptr<const std::array<std::vector<double>, 2>>
+quadrature::make_quadrature_shared(quadrature::type, cell::type, polyset::type,
+                                   int);
+
 template std::vector<float> quadrature::get_gl_points(int);
 template std::vector<double> quadrature::get_gl_points(int);
 
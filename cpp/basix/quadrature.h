@@ -8,6 +8,7 @@
 #include "polyset.h"
 #include <array>
 #include <concepts>
+#include <memory>
 #include <vector>
 
 /// Quadrature rules
@@ -27,6 +28,10 @@ enum class type
 };
 
 /// Make a quadrature rule on a reference cell
+///
+/// Rules are computed once and cached (see `make_quadrature_shared`),
+/// so this function returns a copy of the cached rule.
+///
 /// @param[in] rule Type of quadrature rule (or use quadrature::Default)
 /// @param[in] celltype The cell type
 /// @param[in] polytype The polyset type
@@ -39,6 +44,25 @@ std::array<std::vector<T>, 2> make_quadrature(const quadrature::type rule,
                                               cell::type celltype,
                                               polyset::type polytype, int m);
 
+/// @brief Get a shared quadrature rule on a reference cell.
+///
+/// Quadrature rules are cached in a thread-safe cache keyed on the
+/// rule, cell type, polyset type and degree, so a rule is computed
+/// only once. The returned rule is immutable and can be shared without
+/// copying.
+///
+/// @param[in] rule Type of quadrature rule (or use quadrature::Default)
+/// @param[in] celltype The cell type
+/// @param[in] polytype The polyset type
+/// @param[in] m Maximum degree of polynomial that this quadrature rule
+/// will integrate exactly
+/// @return List of points and list of weights. The number of points
+/// arrays has shape (num points, gdim)
+template <std::floating_point T>
+std::shared_ptr<const std::array<std::vector<T>, 2>>
+make_quadrature_shared(quadrature::type rule, cell::type celltype,
+                       polyset::type polytype, int m);
+
 /// Get the default quadrature type for the given cell and order
 /// @param[in] celltype The cell type
 /// @param[in] m Maximum degree of polynomial that this quadrature rule
@@ -0,0 +1,141 @@
+// Copyright (c) 2024 Basix contributors
+// FEniCS Project
+// SPDX-License-Identifier:    MIT
+
+#include "sum-factorisation.h"
+#include <algorithm>
+#include <functional>
+#include <numeric>
+#include <stdexcept>
+#include <vector>
+
+using namespace basix;
+namespace sf = basix::sum_factorisation;
+
+namespace
+{
+//-----------------------------------------------------------------------------
+
+/// Contract the middle index of the tensor @p in, of shape (n0, n1,
+/// n2), with @p phi. If @p transpose is false, phi has shape (m1, n1)
+/// and out(a, q, b) = sum_i phi(q, i) in(a, i, b). If @p transpose is
+/// true, phi has shape (n1, m1) and out(a, q, b) = sum_i phi(i, q) in(a,
+/// i, b). The shape of @p out is (n0, m1, n2).
+template <typename T>
+void contract(sf::impl::mdspan_t<const T> phi, bool transpose,
+              std::span<const T> in, std::size_t n0, std::size_t n1,
+              std::size_t n2, std::span<T> out)
+{
+  const std::size_t m1 = transpose ? phi.extent(1) : phi.extent(0);
+  std::fill_n(out.begin(), n0 * m1 * n2, 0);
+  for (std::size_t a = 0; a < n0; ++a)
+  {
+    for (std::size_t q = 0; q < m1; ++q)
+    {
+      T* out_aq = out.data() + (a * m1 + q) * n2;
+      for (std::size_t i = 0; i < n1; ++i)
+      {
+        const T p = transpose ? phi(i, q) : phi(q, i);
+        const T* in_ai = in.data() + (a * n1 + i) * n2;
+        for (std::size_t b = 0; b < n2; ++b)
+          out_aq[b] += p * in_ai[b];
+      }
+    }
+  }
+}
+//-----------------------------------------------------------------------------
+
+/// Apply phi (or its transpose) in each direction in turn
+template <typename T>
+void apply(std::span<const sf::impl::mdspan_t<const T>> phi, bool transpose,
+           std::span<const T> in, std::span<T> out, std::span<T> work)
+{
+  const std::size_t tdim = phi.size();
+  if (tdim == 0)
+    throw std::runtime_error("No 1D factors given.");
+
+  // Input and output extents in each direction
+  std::vector<std::size_t> shape_in(tdim), shape_out(tdim);
+  for (std::size_t k = 0; k < tdim; ++k)
+  {
+    shape_in[k] = transpose ? phi[k].extent(0) : phi[k].extent(1);
+    shape_out[k] = transpose ? phi[k].extent(1) : phi[k].extent(0);
+  }
+
+  auto prod = [](auto first, auto last)
+  { return std::accumulate(first, last, std::size_t(1), std::multiplies{}); };
+  if (in.size() != prod(shape_in.begin(), shape_in.end()))
+    throw std::runtime_error("Input has the wrong size.");
+  if (out.size() != prod(shape_out.begin(), shape_out.end()))
+    throw std::runtime_error("Output has the wrong size.");
+  if (work.size() < sf::workspace_size<T>(phi))
+    throw std::runtime_error("Workspace is too small.");
+
+  // Contract one direction at a time. After contracting direction k,
+  // the shape of the intermediate tensor is (shape_out[0], ...,
+  // shape_out[k], shape_in[k + 1], ...). Intermediate tensors
+  // alternate between the two halves of the workspace, and the last
+  // contraction writes to the output.
+  const std::size_t half = work.size() / 2;
+  std::span<const T> current = in;
+  for (std::size_t k = 0; k < tdim; ++k)
+  {
+    std::span<T> next
+        = k + 1 == tdim ? out : work.subspan((k % 2) * half, half);
+    contract(phi[k], transpose, current,
+             prod(shape_out.begin(), shape_out.begin() + k), shape_in[k],
+             prod(shape_in.begin() + k + 1, shape_in.end()), next);
+    current = next;
+  }
+}
+//-----------------------------------------------------------------------------
+} // namespace
+
+//-----------------------------------------------------------------------------
+template <std::floating_point T>
+std::size_t sf::workspace_size(std::span<const sf::impl::mdspan_t<const T>> phi)
+{
+  // Every intermediate tensor has at most max(m_k, n_k) entries in
+  // each direction k
+  std::size_t size = 1;
+  for (auto& p : phi)
+    size *= std::max(p.extent(0), p.extent(1));
+  return 2 * size;
+}
+//-----------------------------------------------------------------------------
+template <std::floating_point T>
+void sf::evaluate(std::span<const sf::impl::mdspan_t<const T>> phi,
+                  std::span<const T> u, std::span<T> v, std::span<T> work)
+{
+  apply<T>(phi, false, u, v, work);
+}
+//-----------------------------------------------------------------------------
+template <std::floating_point T>
+void sf::evaluate_transpose(std::span<const sf::impl::mdspan_t<const T>> phi,
+                            std::span<const T> v, std::span<T> u,
+                            std::span<T> work)
+{
+  apply<T>(phi, true, v, u, work);
+}
+//-----------------------------------------------------------------------------
+/// @cond
+template std::size_t
+    sf::workspace_size(std::span<const sf::impl::mdspan_t<const float>>);
+template std::size_t
+    sf::workspace_size(std::span<const sf::impl::mdspan_t<const double>>);
+template void sf::evaluate(std::span<const sf::impl::mdspan_t<const float>>,
+                           std::span<const float>, std::span<float>,
+                           std::span<float>);
+template void sf::evaluate(std::span<const sf::impl::mdspan_t<const double>>,
+                           std::span<const double>, std::span<double>,
+                           std::span<double>);
+template void
+    sf::evaluate_transpose(std::span<const sf::impl::mdspan_t<const float>>,
+                           std::span<const float>, std::span<float>,
+                           std::span<float>);
+template void
+    sf::evaluate_transpose(std::span<const sf::impl::mdspan_t<const double>>,
+                           std::span<const double>, std::span<double>,
+                           std::span<double>);
+/// @endcond
+//-----------------------------------------------------------------------------
@@ -0,0 +1,83 @@
+// Copyright (c) 2024 Basix contributors
+// FEniCS Project
+// SPDX-License-Identifier:    MIT
+
+#pragma once
+
+#include "mdspan.hpp"
+#include <concepts>
+#include <span>
+
+/// @brief Sum-factorised kernels for tensor-product elements.
+///
+/// For an element on a quadrilateral or hexahedron that is a tensor
+/// product of elements on an interval (see
+/// `FiniteElement::get_tensor_product_representation`), the values of a
+/// finite element function at a tensor product of points can be
+/// computed by applying the tabulated 1D basis functions one direction
+/// at a time. With p the number of 1D dofs and points and d the
+/// topological dimension, this costs O(p^{d+1}) operations instead of
+/// the O(p^{2d}) operations needed to apply the full tabulated basis.
+///
+/// The 1D tabulations can be computed using
+/// `FiniteElement::tabulate_tensor_factors`.
+namespace basix::sum_factorisation
+{
+namespace impl
+{
+/// @private
+template <typename T>
+using mdspan_t = MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
+    T, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, 2>>;
+} // namespace impl
+
+/// @brief Size of the workspace required by `evaluate` and
+/// `evaluate_transpose`.
+/// @param[in] phi The 1D tabulated basis functions in each direction
+/// @return The number of entries required in the workspace
+template <std::floating_point T>
+std::size_t workspace_size(std::span<const impl::mdspan_t<const T>> phi);
+
+/// @brief Evaluate a function at a tensor product of points.
+///
+/// Computes
+/// @f[ v_{q_0 \ldots q_{d-1}} = \sum_{i_0, \ldots, i_{d-1}}
+/// \phi^{0}_{q_0 i_0} \cdots \phi^{d-1}_{q_{d-1} i_{d-1}} u_{i_0 \ldots
+/// i_{d-1}}. @f]
+///
+/// @param[in] phi The 1D tabulated basis functions in each direction.
+/// Entry k has shape (number of points in direction k, number of dofs
+/// in direction k).
+/// @param[in] u The coefficients of the function, in tensor product
+/// ordering (i.e. row-major with shape (n_0, ..., n_{d-1})).
+/// @param[out] v The values at the points, in tensor product ordering
+/// (i.e. row-major with shape (q_0, ..., q_{d-1})).
+/// @param work Scratch space. Its size must be at least
+/// `workspace_size(phi)`.
+template <std::floating_point T>
+void evaluate(std::span<const impl::mdspan_t<const T>> phi,
+              std::span<const T> u, std::span<T> v, std::span<T> work);
+
+/// @brief Apply the transpose of `evaluate`.
+///
+/// Computes
+/// @f[ u_{i_0 \ldots i_{d-1}} = \sum_{q_0, \ldots, q_{d-1}}
+/// \phi^{0}_{q_0 i_0} \cdots \phi^{d-1}_{q_{d-1} i_{d-1}} v_{q_0 \ldots
+/// q_{d-1}}. @f]
+///
+/// This is used in assembly, where @p v holds (weighted) values at
+/// quadrature points.
+///
+/// @param[in] phi The 1D tabulated basis functions in each direction.
+/// Entry k has shape (number of points in direction k, number of dofs
+/// in direction k).
+/// @param[in] v The values at the points, in tensor product ordering.
+/// @param[out] u The result for each dof, in tensor product ordering.
+/// @param work Scratch space. Its size must be at least
+/// `workspace_size(phi)`.
+template <std::floating_point T>
+void evaluate_transpose(std::span<const impl::mdspan_t<const T>> phi,
+                        std::span<const T> v, std::span<T> u,
+                        std::span<T> work);
+
+} // namespace basix::sum_factorisation
@@ -3,7 +3,8 @@
 The core of the library is written in C++, but the majority of Basix's
 functionality can be used via this Python interface.
 """
-from basix import cell, finite_element, lattice, polynomials, quadrature, sobolev_spaces
+from basix import (cell, finite_element, lattice, parallel, polynomials, profiling, quadrature, sobolev_spaces,
+                   sum_factorisation)
 from basix._basixcpp import __version__
 from basix.cell import CellType, geometry, topology
 from basix.finite_element import DPCVariant, ElementFamily, LagrangeVariant, create_custom_element, create_element
@@ -18,9 +19,9 @@ from basix.quadrature import QuadratureType, make_quadrature
 from basix.sobolev_spaces import SobolevSpace
 from basix.utils import index
 
-__all__ = ["cell", "finite_element", "lattice", "polynomials", "quadrature", "sobolev_spaces",
-           "CellType", "DPCVariant", "ElementFamily", "LagrangeVariant", "LatticeSimplexMethod", "LatticeType",
-           "MapType", "PolynomialType", "PolysetType", "QuadratureType", "SobolevSpace", "__version__",
+__all__ = ["cell", "finite_element", "lattice", "parallel", "polynomials", "profiling", "quadrature", "sobolev_spaces",
+           "sum_factorisation", "CellType", "DPCVariant", "ElementFamily", "LagrangeVariant", "LatticeSimplexMethod",
+           "LatticeType", "MapType", "PolynomialType", "PolysetType", "QuadratureType", "SobolevSpace", "__version__",
            "create_lattice", "geometry", "index", "polyset_restriction", "polyset_superset",
            "tabulate_polynomials", "topology", "create_custom_element", "create_element",
            "make_quadrature", "compute_interpolation_operator"]
@@ -10,15 +10,33 @@ cell_volume: nanobind.nb_func
 compute_interpolation_operator: nanobind.nb_func
 create_custom_element: nanobind.nb_func
 create_element: nanobind.nb_func
+create_element_cached: nanobind.nb_func
+deserialize_element: nanobind.nb_func
+element_cache_clear: nanobind.nb_func
+element_cache_get_directory: nanobind.nb_func
+element_cache_get_policy: nanobind.nb_func
+element_cache_set_capacity: nanobind.nb_func
+element_cache_set_directory: nanobind.nb_func
+element_cache_set_policy: nanobind.nb_func
+element_cache_stats: nanobind.nb_func
 create_lattice: nanobind.nb_func
 geometry: nanobind.nb_func
+get_num_threads: nanobind.nb_func
 index: nanobind.nb_func
+load_element: nanobind.nb_func
 make_quadrature: nanobind.nb_func
 polynomials_dim: nanobind.nb_func
+profiling_enable: nanobind.nb_func
+profiling_is_enabled: nanobind.nb_func
+profiling_reset: nanobind.nb_func
+profiling_timings: nanobind.nb_func
 restriction: nanobind.nb_func
+save_element: nanobind.nb_func
+set_num_threads: nanobind.nb_func
 sobolev_space_intersection: nanobind.nb_func
 sub_entity_connectivity: nanobind.nb_func
 sub_entity_geometry: nanobind.nb_func
+sum_factorisation_evaluate: nanobind.nb_func
 superset: nanobind.nb_func
 tabulate_polynomial_set: nanobind.nb_func
 tabulate_polynomials: nanobind.nb_func
@@ -71,6 +89,23 @@ class DPCVariant:
     @property
     def name(self) -> str: ...
 
+class ElementCachePolicy:
+    __entries__: ClassVar[dict] = ...
+    fifo: ClassVar[ElementCachePolicy] = ...
+    lru: ClassVar[ElementCachePolicy] = ...
+    __name__: str
+    def __init__(self, *args, **kwargs) -> None: ...
+    def __eq__(self, other) -> bool: ...
+    def __ge__(self, other) -> bool: ...
+    def __gt__(self, other) -> bool: ...
+    def __hash__(self) -> int: ...
+    def __int__(self) -> int: ...
+    def __le__(self, other) -> bool: ...
+    def __lt__(self, other) -> bool: ...
+    def __ne__(self, other) -> bool: ...
+    @property
+    def name(self) -> str: ...
+
 class ElementFamily:
     __entries__: ClassVar[dict] = ...
     BDM: ClassVar[ElementFamily] = ...
@@ -109,9 +144,19 @@ class FiniteElement_float32:
     def pre_apply_dof_transformation(self, *args, **kwargs) -> Any: ...
     def pre_apply_inverse_transpose_dof_transformation(self, *args, **kwargs) -> Any: ...
     def pull_back(self, *args, **kwargs) -> Any: ...
+    def pull_back_out(self, *args, **kwargs) -> Any: ...
     def push_forward(self, *args, **kwargs) -> Any: ...
+    def push_forward_out(self, *args, **kwargs) -> Any: ...
+    def serialize(self) -> bytes: ...
     def tabulate(self, *args, **kwargs) -> Any: ...
+    def tabulate_batch(self, *args, **kwargs) -> Any: ...
+    def tabulate_out(self, *args, **kwargs) -> Any: ...
+    def tabulate_shape(self, *args, **kwargs) -> tuple[int,int,int,int]: ...
+    def tabulate_tensor_factors(self, *args, **kwargs) -> Any: ...
+    def tabulate_workspace_size(self, n: int, num_points: int) -> int: ...
     def __eq__(self, other) -> Any: ...
+    def __getstate__(self) -> bytes: ...
+    def __setstate__(self, state: bytes) -> None: ...
     @property
     def M(self) -> Any: ...
     @property
@@ -186,9 +231,19 @@ class FiniteElement_float64:
     def pre_apply_dof_transformation(self, *args, **kwargs) -> Any: ...
     def pre_apply_inverse_transpose_dof_transformation(self, *args, **kwargs) -> Any: ...
     def pull_back(self, *args, **kwargs) -> Any: ...
+    def pull_back_out(self, *args, **kwargs) -> Any: ...
     def push_forward(self, *args, **kwargs) -> Any: ...
+    def push_forward_out(self, *args, **kwargs) -> Any: ...
+    def serialize(self) -> bytes: ...
     def tabulate(self, *args, **kwargs) -> Any: ...
+    def tabulate_batch(self, *args, **kwargs) -> Any: ...
+    def tabulate_out(self, *args, **kwargs) -> Any: ...
+    def tabulate_shape(self, *args, **kwargs) -> tuple[int,int,int,int]: ...
+    def tabulate_tensor_factors(self, *args, **kwargs) -> Any: ...
+    def tabulate_workspace_size(self, n: int, num_points: int) -> int: ...
     def __eq__(self, other) -> Any: ...
+    def __getstate__(self) -> bytes: ...
+    def __setstate__(self, state: bytes) -> None: ...
     @property
     def M(self) -> Any: ...
     @property
@@ -1,17 +1,31 @@
 """Functions for creating finite elements."""
 
+import os
+import pathlib
 import typing
 
 import numpy as _np
 import numpy.typing as npt
 
 from basix._basixcpp import DPCVariant as _DPCV
+from basix._basixcpp import ElementCachePolicy as _ECP
 from basix._basixcpp import ElementFamily as _EF
 from basix._basixcpp import FiniteElement_float32 as _FiniteElement_float32
 from basix._basixcpp import FiniteElement_float64 as _FiniteElement_float64
 from basix._basixcpp import LagrangeVariant as _LV
 from basix._basixcpp import create_custom_element as _create_custom_element
 from basix._basixcpp import create_element as _create_element
+from basix._basixcpp import create_element_cached as _create_element_cached
+from basix._basixcpp import deserialize_element as _deserialize_element
+from basix._basixcpp import element_cache_clear as _element_cache_clear
+from basix._basixcpp import element_cache_get_directory as _element_cache_get_directory
+from basix._basixcpp import element_cache_get_policy as _element_cache_get_policy
+from basix._basixcpp import element_cache_set_capacity as _element_cache_set_capacity
+from basix._basixcpp import element_cache_set_directory as _element_cache_set_directory
+from basix._basixcpp import element_cache_set_policy as _element_cache_set_policy
+from basix._basixcpp import element_cache_stats as _element_cache_stats
+from basix._basixcpp import load_element as _load_element
+from basix._basixcpp import save_element as _save_element
 from basix.cell import CellType
 from basix.maps import MapType
 from basix.polynomials import PolysetType
@@ -19,7 +33,10 @@ from basix.sobolev_spaces import SobolevSpace
 from basix.utils import Enum
 
 __all__ = ["FiniteElement", "create_element", "create_custom_element", "string_to_family",
-           "string_to_lagrange_variant", "string_to_dpc_variant"]
+           "string_to_lagrange_variant", "string_to_dpc_variant", "ElementCacheInfo", "ElementCachePolicy",
+           "element_cache_info", "set_element_cache_capacity", "set_element_cache_policy",
+           "get_element_cache_policy", "clear_element_cache", "set_element_cache_directory",
+           "get_element_cache_directory", "save_element", "load_element", "deserialize_element"]
 
 
 class ElementFamily(Enum):
@@ -69,8 +86,35 @@ class DPCVariant(Enum):
     legendre = _DPCV.legendre
 
 
+class ElementCachePolicy(Enum):
+    """Eviction policy of the element cache."""
+    lru = _ECP.lru
+    fifo = _ECP.fifo
+
+
+class ElementCacheInfo(typing.NamedTuple):
+    """Element cache statistics."""
+    hits: int
+    misses: int
+    evictions: int
+    currsize: int
+    maxsize: int
+    disk_hits: int
+
+
+def _as_cell_info(cell_info):
+    """Convert an array of cell permutation info to the type used by the C++ layer."""
+    if _np.ndim(cell_info) == 0:
+        return cell_info
+    return _np.ascontiguousarray(cell_info, dtype=_np.uint32)
+
+
 class FiniteElement:
-    """Finite element class."""
+    """Finite element class.
+
+    Elements cannot be modified after they are created, so an element
+    can be shared by several threads.
+    """
     _e: typing.Union[_FiniteElement_float32, _FiniteElement_float64]
 
     def __init__(self, e: typing.Union[_FiniteElement_float32, _FiniteElement_float64]):
@@ -81,19 +125,35 @@ class FiniteElement:
         """
         self._e = e
 
-    def tabulate(self, n: int, x: npt.NDArray) -> npt.NDArray[_np.floating]:
+    def tabulate(self, n: int, x: npt.NDArray, out: typing.Optional[npt.NDArray] = None,
+                 workspace: typing.Optional[npt.NDArray] = None,
+                 num_threads: typing.Optional[int] = None) -> npt.NDArray[_np.floating]:
         """Compute basis values and derivatives at set of points.
 
         Note:
-            The version of `FiniteElement::tabulate` with the basis data
-            as an out argument should be preferred for repeated call where
-            performance is critical
+            Passing ``out`` and ``workspace`` should be preferred for
+            repeated calls where performance is critical. No arrays are
+            then allocated.
+
+        Note:
+            The GIL is released while the basis functions are computed.
+            The result does not depend on the number of threads used.
 
         Args:
             n: The order of derivatives, up to and including, to
               compute. Use 0 for the basis functions only.
             x: The points at which to compute the basis functions. The
                 shape of x is (number of points, geometric dimension).
+            out: Array to write the result into. If not given, a new
+                array is allocated. It must be C-contiguous, have the
+                same dtype as the element and have the shape of the
+                returned array.
+            workspace: Scratch space, e.g. created by
+                `FiniteElement.tabulate_workspace`. If not given,
+                scratch space is allocated internally.
+            num_threads: The number of threads to split the points
+                across. If not given, the number set by
+                `basix.parallel.set_num_threads` is used.
 
         Returns:
             The basis functions (and derivatives). The shape is
@@ -113,7 +173,80 @@ class FiniteElement:
             * The third index is the basis function index one for scalar
                 basis functions.
         """
-        return self._e.tabulate(n, x)
+        num_threads = 0 if num_threads is None else num_threads
+        if out is None and workspace is None:
+            return self._e.tabulate(n, x, num_threads)
+        if out is None:
+            out = _np.empty(self._e.tabulate_shape(n, x.shape[0]), dtype=self.dtype)
+        self._e.tabulate_out(n, x, out, workspace, num_threads)
+        return out
+
+    def tabulate_workspace(self, n: int, num_points: int) -> npt.NDArray[_np.floating]:
+        """Create scratch space for `FiniteElement.tabulate`.
+
+        The workspace can be reused for any call to `tabulate` or
+        `tabulate_batch` with derivative order up to ``n`` and at most
+        ``num_points`` points (summed over all cells for
+        `tabulate_batch`).
+
+        Args:
+            n: The order of derivatives.
+            num_points: The (maximum) number of points.
+
+        Returns:
+            An uninitialised array with the element's dtype.
+        """
+        return _np.empty(self._e.tabulate_workspace_size(n, num_points), dtype=self.dtype)
+
+    def tabulate_batch(self, n: int, x: npt.NDArray, out: typing.Optional[npt.NDArray] = None,
+                       workspace: typing.Optional[npt.NDArray] = None,
+                       num_threads: typing.Optional[int] = None) -> npt.NDArray[_np.floating]:
+        """Compute basis values and derivatives at points on a batch of cells.
+
+        All cells are tabulated in a single call, sharing the polynomial
+        set evaluation and the intermediate storage.
+
+        Args:
+            n: The order of derivatives, up to and including, to
+                compute. Use 0 for the basis functions only.
+            x: The points at which to compute the basis functions. The
+                shape of x is (number of cells, number of points,
+                geometric dimension).
+            out: Array to write the result into. If not given, a new
+                array is allocated. It must be C-contiguous, have the
+                same dtype as the element and have the shape of the
+                returned array.
+            workspace: Scratch space, e.g. created by
+                `FiniteElement.tabulate_workspace`. If not given,
+                scratch space is allocated internally.
+            num_threads: The number of threads to split the points
+                across. If not given, the number set by
+                `basix.parallel.set_num_threads` is used.
+
+        Returns:
+            The basis functions (and derivatives). The shape is (cell,
+            derivative, point, basis fn index, value index). For each
+            cell the data is laid out as in `FiniteElement.tabulate`.
+        """
+        if out is None:
+            shape = self._e.tabulate_shape(n, x.shape[1])
+            out = _np.empty((x.shape[0],) + tuple(shape), dtype=self.dtype)
+        self._e.tabulate_batch(n, x, out, workspace, 0 if num_threads is None else num_threads)
+        return out
+
+    def serialize(self) -> bytes:
+        """Serialize the element.
+
+        The data includes everything that is computed when the element
+        is created, so `deserialize_element` recreates the element
+        without repeating these computations. The data is tagged with
+        the Basix version and is intended for caching, not as a stable
+        storage format.
+
+        Returns:
+            The serialized element.
+        """
+        return self._e.serialize()
 
     def __eq__(self, other) -> bool:
         """Test element for equality."""
@@ -122,42 +255,76 @@ class FiniteElement:
         except TypeError:
             return False
 
-    def push_forward(self, U, J, detJ, K) -> npt.NDArray[_np.floating]:
+    def push_forward(self, U, J, detJ, K, out: typing.Optional[npt.NDArray] = None) -> npt.NDArray[_np.floating]:
         """Map function values from the reference to a physical cell.
 
         This function can perform the mapping for multiple points,
         grouped by points that share a common Jacobian.
 
+        The Jacobians can have any number of leading (batch) indices.
+        For example, for non-affine cells with a Jacobian at each point,
+        ``J`` can have shape (cell, point, J_i, J_j) and ``U`` shape
+        (cell, point, basis fn index, components), and all cells are
+        mapped in one call.
+
         Args:
             U: The function values on the reference. The indices are
                 [Jacobian index, point index, components].
             J: The Jacobian of the mapping. The indices are [Jacobian
                 index, J_i, J_j].
             detJ: The determinant of the Jacobian of the mapping. It has
-                length `J.shape(0)` K: The inverse of the Jacobian of the
-            mapping. The indices are [Jacobian index, K_i, K_j].
+                length `J.shape(0)`
+            K: The inverse of the Jacobian of the mapping. The indices
+                are [Jacobian index, K_i, K_j].
+            out: Array to write the result into. If not given, a new
+                array is allocated. It must be C-contiguous and have the
+                same dtype as the element.
 
         Returns:
             The function values on the cell. The indices are [Jacobian
             index, point index, components].
         """
-        return self._e.push_forward(U, J, detJ, K)
+        return self._map(self._e.push_forward, self._e.push_forward_out, U, J, detJ, K, out)
 
     def pull_back(self, u: npt.NDArray, J: npt.NDArray,
-                  detJ: npt.NDArray, K: npt.NDArray) -> npt.NDArray[_np.floating]:
+                  detJ: npt.NDArray, K: npt.NDArray,
+                  out: typing.Optional[npt.NDArray] = None) -> npt.NDArray[_np.floating]:
         """Map function values from a physical cell to the reference.
 
+        The Jacobians can have any number of leading (batch) indices,
+        as for `FiniteElement.push_forward`.
+
         Args:
             u: The function values on the cell
             J: The Jacobian of the mapping
             detJ: The determinant of the Jacobian of the mapping
             K: The inverse of the Jacobian of the mapping
+            out: Array to write the result into. If not given, a new
+                array is allocated. It must be C-contiguous and have the
+                same dtype as the element.
 
         Returns:
             The function values on the reference. The indices are
             [Jacobian index, point index, components].
         """
-        return self._e.pull_back(u, J, detJ, K)
+        return self._map(self._e.pull_back, self._e.pull_back_out, u, J, detJ, K, out)
+
+    @staticmethod
+    def _map(map_fn, map_out_fn, U, J, detJ, K, out):
+        """Apply a push forward or pull back, flattening batch indices."""
+        batch_shape = J.shape[:-2]
+        n = int(_np.prod(batch_shape, dtype=int))
+        U = U.reshape(n, *U.shape[len(batch_shape):])
+        J = J.reshape(n, *J.shape[-2:])
+        K = K.reshape(n, *K.shape[-2:])
+        detJ = detJ.reshape(n)
+        if out is None:
+            u = map_fn(U, J, detJ, K)
+            return u.reshape(*batch_shape, *u.shape[1:])
+        if not out.flags.c_contiguous:
+            raise TypeError("out must be C-contiguous.")
+        map_out_fn(U, J, detJ, K, out.reshape(n, *out.shape[len(batch_shape):]))
+        return out
 
     def pre_apply_dof_transformation(self, data, block_size, cell_info) -> None:
         """Pre-apply DOF transformations to some data in-place.
@@ -166,13 +333,23 @@ class FiniteElement:
             This function is designed to be called at runtime, so its
             performance is critical.
 
+            If ``cell_info`` is an array, the transformations are
+            applied to the data of many cells in one call. The data
+            then has shape (cell, dof, block) and cells are grouped by the
+            orientations of their sub-entities. This is faster than
+            applying the transformations cell by cell from Python, by
+            several times for more than a few cells. The data must be
+            C-contiguous and have the same dtype as the element, as it
+            is transformed in place.
+
         Args:
             data: The data
             block_size: The number of data points per DOF
-            cell_info: The permutation info for the cell
+            cell_info: The permutation info for the cell, or an array
+                of the permutation info for each cell.
 
         """
-        self._e.pre_apply_dof_transformation(data, block_size, cell_info)
+        self._e.pre_apply_dof_transformation(data, block_size, _as_cell_info(cell_info))
 
     def post_apply_transpose_dof_transformation(self, data, block_size, cell_info) -> None:
         """Post-apply DOF transformations to some transposed data in-place.
@@ -181,12 +358,22 @@ class FiniteElement:
             This function is designed to be called at runtime, so its
             performance is critical.
 
+            If ``cell_info`` is an array, the transformations are
+            applied to the data of many cells in one call. The data
+            then has shape (cell, block, dof) and cells are grouped by the
+            orientations of their sub-entities. This is faster than
+            applying the transformations cell by cell from Python, by
+            several times for more than a few cells. The data must be
+            C-contiguous and have the same dtype as the element, as it
+            is transformed in place.
+
         Args:
             data: The data
             block_size: The number of data points per DOF
-            cell_info: The permutation info for the cell
+            cell_info: The permutation info for the cell, or an array
+                of the permutation info for each cell.
         """
-        self._e.post_apply_transpose_dof_transformation(data, block_size, cell_info)
+        self._e.post_apply_transpose_dof_transformation(data, block_size, _as_cell_info(cell_info))
 
     def pre_apply_inverse_transpose_dof_transformation(self, data, block_size, cell_info) -> None:
         """Pre-apply inverse transpose DOF transformations to some data.
@@ -195,12 +382,22 @@ class FiniteElement:
             This function is designed to be called at runtime, so its
             performance is critical.
 
+            If ``cell_info`` is an array, the transformations are
+            applied to the data of many cells in one call. The data
+            then has shape (cell, dof, block) and cells are grouped by the
+            orientations of their sub-entities. This is faster than
+            applying the transformations cell by cell from Python, by
+            several times for more than a few cells. The data must be
+            C-contiguous and have the same dtype as the element, as it
+            is transformed in place.
+
         Args:
             data: The data
             block_size: The number of data points per DOF
-            cell_info: The permutation info for the cell
+            cell_info: The permutation info for the cell, or an array
+                of the permutation info for each cell.
         """
-        self._e.pre_apply_inverse_transpose_dof_transformation(data, block_size, cell_info)
+        self._e.pre_apply_inverse_transpose_dof_transformation(data, block_size, _as_cell_info(cell_info))
 
     def base_transformations(self) -> npt.NDArray[_np.floating]:
         r"""Get the base transformations.
@@ -329,6 +526,36 @@ class FiniteElement:
         factors = self._e.get_tensor_product_representation()
         return [([FiniteElement(e) for e in elements], perm) for elements, perm in factors]
 
+    def tabulate_tensor_factors(self, n: int, x: npt.NDArray) -> npt.NDArray[_np.floating]:
+        """Tabulate the 1D factors of the tensor product representation.
+
+        The result can be passed to `basix.sum_factorisation.evaluate`
+        and `basix.sum_factorisation.evaluate_transpose` to evaluate
+        functions at a tensor product of points without tabulating the
+        full basis.
+
+        Raises an exception if the element is not a single tensor
+        product of scalar elements on an interval.
+
+        The 1D dofs are numbered in tensor product ordering. Entry ``i``
+        of the permutation returned by
+        `FiniteElement.get_tensor_product_representation` gives the dof
+        of this element that corresponds to the tensor product dof with
+        (row-major) index ``i``.
+
+        Args:
+            n: The order of derivatives, up to and including, to
+                compute.
+            x: The 1D points in each direction. The shape is (number of
+                points, tdim), with column ``k`` holding the points in
+                direction ``k``.
+
+        Returns:
+            The tabulated 1D basis functions (and derivatives). The
+            shape is (tdim, n + 1, number of points, number of 1D dofs).
+        """
+        return self._e.tabulate_tensor_factors(n, x)
+
     @property
     def degree(self) -> int:
         """Element polynomial degree."""
@@ -553,9 +780,15 @@ def create_element(family: ElementFamily, celltype: CellType, degree: int,
                    dpc_variant: DPCVariant = DPCVariant.unset,
                    discontinuous: bool = False,
                    dof_ordering: typing.List[int] = [],
-                   dtype: npt.DTypeLike = _np.float64) -> FiniteElement:
+                   dtype: npt.DTypeLike = _np.float64,
+                   cache: bool = True) -> FiniteElement:
     """Create a finite element.
 
+    By default, elements are stored in a process-wide cache, and
+    creating an element with the same arguments again returns the
+    cached element. See `element_cache_info` and
+    `set_element_cache_capacity`.
+
     Args:
         family: Finite element family.
         celltype: Reference cell type that the element is defined on
@@ -568,15 +801,129 @@ def create_element(family: ElementFamily, celltype: CellType, degree: int,
             the interior of the cell.
         dof_ordering: Ordering of dofs for ElementDofLayout
         dtype: Element scalar type.
+        cache: If `True`, use the element cache.
 
     Returns:
         A finite element.
     """
-    return FiniteElement(_create_element(
+    create = _create_element_cached if cache else _create_element
+    return FiniteElement(create(
         family.value, celltype.value, degree, lagrange_variant.value, dpc_variant.value,
         discontinuous, dof_ordering, _np.dtype(dtype).char))
 
 
+def element_cache_info() -> ElementCacheInfo:
+    """Get the element cache statistics.
+
+    Returns:
+        The number of cache hits, misses and evictions since the cache
+        was last cleared, and the current size and capacity of the
+        cache.
+    """
+    return ElementCacheInfo(*_element_cache_stats())
+
+
+def set_element_cache_capacity(capacity: int):
+    """Set the maximum number of elements held in the element cache.
+
+    If the cache holds more elements than the new capacity, elements
+    are evicted. A capacity of 0 disables caching.
+
+    Args:
+        capacity: The maximum number of elements.
+    """
+    _element_cache_set_capacity(capacity)
+
+
+def set_element_cache_policy(policy: ElementCachePolicy):
+    """Set the eviction policy of the element cache.
+
+    Args:
+        policy: The eviction policy.
+    """
+    _element_cache_set_policy(policy.value)
+
+
+def get_element_cache_policy() -> ElementCachePolicy:
+    """Get the eviction policy of the element cache.
+
+    Returns:
+        The eviction policy.
+    """
+    return getattr(ElementCachePolicy, _element_cache_get_policy().name)
+
+
+def clear_element_cache():
+    """Remove all elements from the in-memory element cache and reset its statistics.
+
+    Files in the on-disk element cache are not removed.
+    """
+    _element_cache_clear()
+
+
+def set_element_cache_directory(path: typing.Optional[typing.Union[str, os.PathLike]]):
+    """Set the directory of the on-disk element cache.
+
+    Elements that are not in the in-memory cache are loaded from this
+    directory if possible, and otherwise created and written to it.
+    The directory is created if it does not exist.
+
+    Args:
+        path: The directory. If `None`, the on-disk cache is disabled,
+            which is the default.
+    """
+    _element_cache_set_directory(None if path is None else pathlib.Path(path))
+
+
+def get_element_cache_directory() -> typing.Optional[pathlib.Path]:
+    """Get the directory of the on-disk element cache.
+
+    Returns:
+        The directory, or `None` if the on-disk cache is disabled.
+    """
+    return _element_cache_get_directory()
+
+
+def save_element(path: typing.Union[str, os.PathLike], element: FiniteElement):
+    """Write an element to a file.
+
+    Args:
+        path: The file.
+        element: The element.
+    """
+    _save_element(pathlib.Path(path), element._e)
+
+
+def load_element(path: typing.Union[str, os.PathLike], dtype: npt.DTypeLike = _np.float64) -> FiniteElement:
+    """Read an element from a file written by `save_element`.
+
+    The file is memory mapped where supported.
+
+    Args:
+        path: The file.
+        dtype: Element scalar type. This must match the type of the
+            element that was written.
+
+    Returns:
+        The element.
+    """
+    return FiniteElement(_load_element(pathlib.Path(path), _np.dtype(dtype).char))
+
+
+def deserialize_element(data: bytes, dtype: npt.DTypeLike = _np.float64) -> FiniteElement:
+    """Create an element from data returned by `FiniteElement.serialize`.
+
+    Args:
+        data: The serialized element.
+        dtype: Element scalar type. This must match the type of the
+            element that was serialized.
+
+    Returns:
+        The element.
+    """
+    return FiniteElement(_deserialize_element(data, _np.dtype(dtype).char))
+
+
 def create_custom_element(cell_type: CellType, value_shape, wcoeffs, x, M, interpolation_nderivs: int, map_type,
                           sobolev_space, discontinuous: bool,
                           embedded_subdegree: int, embedded_superdegree: int,
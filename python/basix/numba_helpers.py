@@ -1,4 +1,11 @@
-"""Helper functions for writing DOLFINx custom kernels using Numba."""
+"""Helper functions for writing DOLFINx custom kernels using Numba.
+
+The functions are compiled when they are first called, and the compiled
+code is cached on disk, so later processes do not compile them again.
+To compile the functions for some cell types and data types in
+advance, for example when setting up an environment, use
+`precompile`.
+"""
 
 try:
     import numba as _numba
@@ -6,11 +13,16 @@ except ImportError:
     raise RuntimeError("You must have Numba installed to use the Numba helper functions.")
 
 from typing import Dict as _Dict
+from typing import Iterable as _Iterable
 from typing import List as _ListT
+from typing import Optional as _Optional
+from typing import Tuple as _Tuple
 
 import numpy as _np
 import numpy.typing as npt
 
+import basix as _basix
+
 __all__ = ["pre_apply_dof_transformation", "pre_apply_dof_transformation_interval",
            "pre_apply_dof_transformation_triangle", "pre_apply_dof_transformation_quadrilateral",
            "pre_apply_dof_transformation_tetrahedron",  "pre_apply_dof_transformation_hexahedron",
@@ -18,10 +30,12 @@ __all__ = ["pre_apply_dof_transformation", "pre_apply_dof_transformation_interva
            "post_apply_transpose_dof_transformation", "post_apply_transpose_dof_transformation_interval",
            "post_apply_transpose_dof_transformation_triangle", "post_apply_transpose_dof_transformation_quadrilateral",
            "post_apply_transpose_dof_transformation_tetrahedron", "post_apply_transpose_dof_transformation_hexahedron",
-           "post_apply_transpose_dof_transformation_prism", "post_apply_transpose_dof_transformation_pyramid"]
+           "post_apply_transpose_dof_transformation_prism", "post_apply_transpose_dof_transformation_pyramid",
+           "pack_dof_transformations", "pre_apply_dof_transformation_batched",
+           "post_apply_transpose_dof_transformation_batched", "precompile"]
 
 
-@_numba.jit(nopython=True)
+@_numba.njit(cache=True)
 def pre_apply_dof_transformation(
     tdim: int, edge_count: int, face_count: int, entity_transformations: _Dict[str, npt.NDArray],
     entity_dofs: _ListT[_ListT[int]], data: npt.NDArray, cell_info: int, face_types: _ListT[str]
@@ -50,8 +64,10 @@ def pre_apply_dof_transformation(
         dofstart = 0
         for i in entity_dofs[0]:
             dofstart += i
-        # NOTE: Copy array to make numba compilation faster (contiguous array assumption)
-        edge_reflection = entity_transformations["interval"][0].copy()
+        # NOTE: Convert arrays to the type of the data, as this is required by
+        # np.dot. This also gives contiguous arrays, which makes numba
+        # compilation faster.
+        edge_reflection = entity_transformations["interval"][0].astype(data.dtype)
         for e in range(edge_count):
             edofs = entity_dofs[1][e]
             if edofs == 0:
@@ -62,8 +78,8 @@ def pre_apply_dof_transformation(
 
         if tdim == 3:
             for f in range(face_count):
-                face_rotation = entity_transformations[face_types[f]][0].copy()
-                face_reflection = entity_transformations[face_types[f]][1].copy()
+                face_rotation = entity_transformations[face_types[f]][0].astype(data.dtype)
+                face_reflection = entity_transformations[face_types[f]][1].astype(data.dtype)
                 fdofs = entity_dofs[2][f]
                 if fdofs == 0:
                     continue
@@ -74,7 +90,7 @@ def pre_apply_dof_transformation(
                 dofstart += fdofs
 
 
-@_numba.jit(nopython=True)
+@_numba.njit(cache=True)
 def pre_apply_dof_transformation_interval(
     entity_transformations: _Dict[str, npt.NDArray[_np.float64]],
     entity_dofs: _Dict[str, npt.NDArray[_np.int32]],
@@ -93,7 +109,7 @@ def pre_apply_dof_transformation_interval(
     return
 
 
-@_numba.jit(nopython=True)
+@_numba.njit(cache=True)
 def pre_apply_dof_transformation_triangle(
     entity_transformations: _Dict[str, npt.NDArray[_np.float64]],
     entity_dofs: _Dict[str, npt.NDArray[_np.int32]],
@@ -113,7 +129,7 @@ def pre_apply_dof_transformation_triangle(
                                  data, cell_info, _numba.typed.List.empty_list(_numba.core.types.string))
 
 
-@_numba.jit(nopython=True)
+@_numba.njit(cache=True)
 def pre_apply_dof_transformation_quadrilateral(
     entity_transformations: _Dict[str, npt.NDArray[_np.float64]],
     entity_dofs: _Dict[str, npt.NDArray[_np.int32]],
@@ -133,7 +149,7 @@ def pre_apply_dof_transformation_quadrilateral(
                                  data, cell_info, _numba.typed.List.empty_list(_numba.core.types.string))
 
 
-@_numba.jit(nopython=True)
+@_numba.njit(cache=True)
 def pre_apply_dof_transformation_tetrahedron(
     entity_transformations: _Dict[str, npt.NDArray[_np.float64]],
     entity_dofs: _Dict[str, npt.NDArray[_np.int32]],
@@ -153,7 +169,7 @@ def pre_apply_dof_transformation_tetrahedron(
                                  data, cell_info, _numba.typed.List(["triangle"] * 4))
 
 
-@_numba.jit(nopython=True)
+@_numba.njit(cache=True)
 def pre_apply_dof_transformation_hexahedron(
     entity_transformations: _Dict[str, npt.NDArray[_np.float64]],
     entity_dofs: _Dict[str, npt.NDArray[_np.int32]],
@@ -173,7 +189,7 @@ def pre_apply_dof_transformation_hexahedron(
                                  data, cell_info, _numba.typed.List(["quadrilateral"] * 6))
 
 
-@_numba.jit(nopython=True)
+@_numba.njit(cache=True)
 def pre_apply_dof_transformation_prism(
     entity_transformations: _Dict[str, npt.NDArray[_np.float64]],
     entity_dofs: _Dict[str, npt.NDArray[_np.int32]],
@@ -194,7 +210,7 @@ def pre_apply_dof_transformation_prism(
         data, cell_info, _numba.typed.List(["triangle"] + ["quadrilateral"] * 4 + ["triangle"]))
 
 
-@_numba.jit(nopython=True)
+@_numba.njit(cache=True)
 def pre_apply_dof_transformation_pyramid(
     entity_transformations: _Dict[str, npt.NDArray[_np.float64]],
     entity_dofs: _Dict[str, npt.NDArray[_np.int32]],
@@ -214,7 +230,7 @@ def pre_apply_dof_transformation_pyramid(
                                  data, cell_info, _numba.typed.List(["quadrilateral"] + ["triangle"] * 4))
 
 
-@_numba.jit(nopython=True)
+@_numba.njit(cache=True)
 def post_apply_transpose_dof_transformation(
     tdim: int, edge_count: int, face_count: int, entity_transformations: _ListT[int], entity_dofs: _ListT[int],
     data: npt.NDArray, cell_info: int, face_types: _ListT[str]
@@ -240,7 +256,7 @@ def post_apply_transpose_dof_transformation(
     data[:] = transposed_data.transpose()
 
 
-@_numba.jit(nopython=True)
+@_numba.njit(cache=True)
 def post_apply_transpose_dof_transformation_interval(
     entity_transformations: _Dict[str, npt.NDArray[_np.float64]],
     entity_dofs: _Dict[str, npt.NDArray[_np.int32]],
@@ -259,7 +275,7 @@ def post_apply_transpose_dof_transformation_interval(
     return
 
 
-@_numba.jit(nopython=True)
+@_numba.njit(cache=True)
 def post_apply_transpose_dof_transformation_triangle(
     entity_transformations: _Dict[str, npt.NDArray[_np.float64]],
     entity_dofs: _Dict[str, npt.NDArray[_np.int32]],
@@ -279,7 +295,7 @@ def post_apply_transpose_dof_transformation_triangle(
                                             data, cell_info, _numba.typed.List.empty_list(_numba.core.types.string))
 
 
-@_numba.jit(nopython=True)
+@_numba.njit(cache=True)
 def post_apply_transpose_dof_transformation_quadrilateral(
     entity_transformations: _Dict[str, npt.NDArray[_np.float64]],
     entity_dofs: _Dict[str, npt.NDArray[_np.int32]],
@@ -299,7 +315,7 @@ def post_apply_transpose_dof_transformation_quadrilateral(
                                             data, cell_info, _numba.typed.List.empty_list(_numba.core.types.string))
 
 
-@_numba.jit(nopython=True)
+@_numba.njit(cache=True)
 def post_apply_transpose_dof_transformation_tetrahedron(entity_transformations: _Dict[str, npt.NDArray[_np.float64]],
                                                         entity_dofs: _Dict[str, npt.NDArray[_np.int32]],
                                                         data: npt.NDArray, cell_info: int):
@@ -317,7 +333,7 @@ def post_apply_transpose_dof_transformation_tetrahedron(entity_transformations:
                                             data, cell_info, _numba.typed.List(["triangle"] * 4))
 
 
-@_numba.jit(nopython=True)
+@_numba.njit(cache=True)
 def post_apply_transpose_dof_transformation_hexahedron(
     entity_transformations: _Dict[str, npt.NDArray[_np.float64]],
     entity_dofs: _Dict[str, npt.NDArray[_np.int32]],
@@ -337,7 +353,7 @@ def post_apply_transpose_dof_transformation_hexahedron(
                                             data, cell_info, _numba.typed.List(["quadrilateral"] * 6))
 
 
-@_numba.jit(nopython=True)
+@_numba.njit(cache=True)
 def post_apply_transpose_dof_transformation_prism(entity_transformations: _Dict[str, npt.NDArray[_np.float64]],
                                                   entity_dofs: _Dict[str, npt.NDArray[_np.int32]],
                                                   data: npt.NDArray, cell_info: int):
@@ -356,7 +372,7 @@ def post_apply_transpose_dof_transformation_prism(entity_transformations: _Dict[
         data, cell_info, _numba.typed.List(["triangle"] + ["quadrilateral"] * 4 + ["triangle"]))
 
 
-@_numba.jit(nopython=True)
+@_numba.njit(cache=True)
 def post_apply_transpose_dof_transformation_pyramid(entity_transformations: _Dict[str, npt.NDArray[_np.float64]],
                                                     entity_dofs: _Dict[str, npt.NDArray[_np.int32]],
                                                     data: npt.NDArray, cell_info: int):
@@ -373,3 +389,196 @@ def post_apply_transpose_dof_transformation_pyramid(entity_transformations: _Dic
     post_apply_transpose_dof_transformation(3, 8, 5, entity_transformations, entity_dofs,
                                             data, cell_info,
                                             _numba.typed.List(["quadrilateral"] + ["triangle"] * 4))
+
+
+def pack_dof_transformations(
+    element: _basix.finite_element.FiniteElement
+) -> _Tuple[npt.NDArray[_np.floating], npt.NDArray[_np.int64]]:
+    """Pack the DOF transformations of an element into arrays for the batched kernels.
+
+    The arrays are passed to `pre_apply_dof_transformation_batched` and
+    `post_apply_transpose_dof_transformation_batched`. They only need to
+    be computed once for each element.
+
+    Args:
+        element: The element.
+
+    Returns:
+        The transformation matrices, with shape ``(num_matrices, n, n)``,
+        where ``n`` is the largest number of DOFs on a sub-entity. Each
+        edge has a reflection and each face has a rotation followed by a
+        reflection. Smaller matrices are padded with zeros. The second
+        array contains a row for each sub-entity with DOFs, with shape
+        ``(num_entities, 5)``. The row contains the first DOF of the
+        entity, the number of DOFs, the index of the first matrix of the
+        entity, the number of matrices of the entity (1 for an edge and
+        2 for a face) and the position of the entity's first bit in the
+        cell info.
+
+    """
+    topology = _basix.topology(element.cell_type)
+    tdim = len(topology) - 1
+    transformations = element.entity_transformations()
+    face_types = [_basix.CellType.triangle if len(f) == 3 else _basix.CellType.quadrilateral
+                  for f in topology[2]] if tdim == 3 else []
+
+    # The matrices of each entity, and the entity's DOFs and cell info bit
+    blocks = []
+    dofstart = sum(element.num_entity_dofs[0])
+    if tdim >= 2:
+        face_start = 3 * len(face_types)
+        for e, edofs in enumerate(element.num_entity_dofs[1]):
+            if edofs > 0:
+                blocks.append((dofstart, edofs, face_start + e, transformations["interval"][:1]))
+            dofstart += edofs
+        for f, fdofs in enumerate(element.num_entity_dofs[2] if tdim == 3 else []):
+            if fdofs > 0:
+                blocks.append((dofstart, fdofs, 3 * f, transformations[face_types[f].name][:2]))
+            dofstart += fdofs
+
+    n = max((b[1] for b in blocks), default=0)
+    matrices = _np.zeros((sum(len(b[3]) for b in blocks), n, n), dtype=element.dtype)
+    entities = _np.zeros((len(blocks), 5), dtype=_np.int64)
+    m = 0
+    for i, (start, ndofs, bit, mats) in enumerate(blocks):
+        matrices[m: m + len(mats), :ndofs, :ndofs] = mats
+        entities[i] = [start, ndofs, m, len(mats), bit]
+        m += len(mats)
+    return matrices, entities
+
+
+@_numba.njit(cache=True)
+def _apply_entity_transformations(matrices: npt.NDArray, entities: npt.NDArray[_np.int64], data: npt.NDArray,
+                                  cell_info: int, work: npt.NDArray):
+    """Pre-apply the DOF transformations of one cell to some data.
+
+    Args:
+        matrices: The transformation matrices, as returned by
+            `pack_dof_transformations`.
+        entities: The sub-entity data, as returned by
+            `pack_dof_transformations`.
+        data: The data of the cell, with shape ``(ndofs, block_size)``.
+            This will be changed by this function.
+        cell_info: An integer representing the orientations of the
+            subentities of the cell.
+        work: Work array with shape ``(matrices.shape[1], block_size)``.
+
+    """
+    for i in range(entities.shape[0]):
+        start, n, m, nmatrices, bit = entities[i, 0], entities[i, 1], entities[i, 2], entities[i, 3], entities[i, 4]
+        reflect = cell_info >> bit & 1
+        # Edges are reflected. Faces are reflected, then rotated.
+        napply = reflect if nmatrices == 1 else reflect + (cell_info >> (bit + 1) & 3)
+        for a in range(napply):
+            matrix = m + 1 if nmatrices == 2 and a == 0 and reflect else m
+            for r in range(n):
+                for k in range(data.shape[1]):
+                    work[r, k] = 0
+                    for j in range(n):
+                        work[r, k] += matrices[matrix, r, j] * data[start + j, k]
+            for r in range(n):
+                for k in range(data.shape[1]):
+                    data[start + r, k] = work[r, k]
+
+
+# Number of cells that share a work array in the batched kernels
+_CHUNK_SIZE = 64
+
+
+@_numba.njit(parallel=True, cache=True)
+def pre_apply_dof_transformation_batched(matrices: npt.NDArray, entities: npt.NDArray[_np.int64],
+                                         data: npt.NDArray, cell_info: npt.NDArray[_np.uint32]):
+    """Pre-apply dof transformations to the data of many cells.
+
+    The cells are processed in parallel.
+
+    Args:
+        matrices: The transformation matrices, as returned by
+            `pack_dof_transformations`.
+        entities: The sub-entity data, as returned by
+            `pack_dof_transformations`.
+        data: The data, with shape ``(num_cells, ndofs, block_size)``.
+            This will be changed by this function.
+        cell_info: The integers representing the orientations of the
+            subentities of each cell.
+
+    """
+    for chunk in _numba.prange((data.shape[0] + _CHUNK_SIZE - 1) // _CHUNK_SIZE):
+        work = _np.empty((matrices.shape[1], data.shape[2]), dtype=data.dtype)
+        for c in range(chunk * _CHUNK_SIZE, min((chunk + 1) * _CHUNK_SIZE, data.shape[0])):
+            _apply_entity_transformations(matrices, entities, data[c], cell_info[c], work)
+
+
+@_numba.njit(parallel=True, cache=True)
+def post_apply_transpose_dof_transformation_batched(matrices: npt.NDArray, entities: npt.NDArray[_np.int64],
+                                                    data: npt.NDArray, cell_info: npt.NDArray[_np.uint32]):
+    """Post-apply dof transformations to the transposed data of many cells.
+
+    The cells are processed in parallel.
+
+    Args:
+        matrices: The transformation matrices, as returned by
+            `pack_dof_transformations`.
+        entities: The sub-entity data, as returned by
+            `pack_dof_transformations`.
+        data: The data, with shape ``(num_cells, block_size, ndofs)``.
+            This will be changed by this function.
+        cell_info: The integers representing the orientations of the
+            subentities of each cell.
+
+    """
+    for chunk in _numba.prange((data.shape[0] + _CHUNK_SIZE - 1) // _CHUNK_SIZE):
+        work = _np.empty((matrices.shape[1], data.shape[1]), dtype=data.dtype)
+        for c in range(chunk * _CHUNK_SIZE, min((chunk + 1) * _CHUNK_SIZE, data.shape[0])):
+            _apply_entity_transformations(matrices, entities, data[c].T, cell_info[c], work)
+
+
+def precompile(cells: _Optional[_Iterable[_basix.CellType]] = None,
+               dtypes: _Iterable[npt.DTypeLike] = (_np.float32, _np.float64, _np.complex64, _np.complex128)):
+    """Compile the helper functions for some cell types and data types.
+
+    The compiled code is cached on disk, so processes that call the
+    functions later do not compile them. Only the functions for the
+    given cell types are compiled.
+
+    The functions are compiled for data that is a C-contiguous array
+    with shape ``(ndofs, block_size)`` (or ``(block_size, ndofs)`` for
+    the transpose functions) or, for the batched functions, with shape
+    ``(num_cells, ndofs, block_size)``. The entity transformations have
+    the real type of the data, and the cell info is an int, or a
+    ``uint32`` array for the batched functions.
+
+    Args:
+        cells: The cell types. If not given, all cell types are used.
+        dtypes: The types of the data.
+
+    """
+    functions = {
+        _basix.CellType.interval: (pre_apply_dof_transformation_interval,
+                                   post_apply_transpose_dof_transformation_interval),
+        _basix.CellType.triangle: (pre_apply_dof_transformation_triangle,
+                                   post_apply_transpose_dof_transformation_triangle),
+        _basix.CellType.quadrilateral: (pre_apply_dof_transformation_quadrilateral,
+                                        post_apply_transpose_dof_transformation_quadrilateral),
+        _basix.CellType.tetrahedron: (pre_apply_dof_transformation_tetrahedron,
+                                      post_apply_transpose_dof_transformation_tetrahedron),
+        _basix.CellType.hexahedron: (pre_apply_dof_transformation_hexahedron,
+                                     post_apply_transpose_dof_transformation_hexahedron),
+        _basix.CellType.prism: (pre_apply_dof_transformation_prism, post_apply_transpose_dof_transformation_prism),
+        _basix.CellType.pyramid: (pre_apply_dof_transformation_pyramid,
+                                  post_apply_transpose_dof_transformation_pyramid),
+    }
+    if cells is None:
+        cells = functions.keys()
+    types = _numba.core.types
+
+    for dtype in dtypes:
+        data_type = _numba.from_dtype(_np.dtype(dtype))
+        real_type = _numba.from_dtype(_np.empty(0, dtype=dtype).real.dtype)
+        entity_transformations = types.DictType(types.unicode_type, real_type[:, :, :])
+        entity_dofs = types.DictType(types.int64, types.int32[:])
+        for cell in cells:
+            for f in functions[cell]:
+                f.compile((entity_transformations, entity_dofs, data_type[:, ::1], types.int64))
+        for f in (pre_apply_dof_transformation_batched, post_apply_transpose_dof_transformation_batched):
+            f.compile((real_type[:, :, ::1], types.int64[:, ::1], data_type[:, :, ::1], types.uint32[::1]))
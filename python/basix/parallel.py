@@ -0,0 +1,39 @@
+"""Multithreaded execution of kernels.
+
+Kernels that work on large sets of points, such as
+`basix.finite_element.FiniteElement.tabulate`, can split the points
+across a number of threads. By default, a single thread is used. The
+points are split into blocks that do not depend on the number of
+threads, so results are identical for any number of threads.
+
+Element creation runs independent parts of the construction, such as
+the moments on each type of sub-entity, as concurrent tasks using the
+same number of threads. Created elements are identical for any number
+of threads.
+"""
+
+from basix._basixcpp import get_num_threads as _get_num_threads
+from basix._basixcpp import set_num_threads as _set_num_threads
+
+__all__ = ["set_num_threads", "get_num_threads"]
+
+
+def set_num_threads(num_threads: int):
+    """Set the number of threads used by default by parallel kernels.
+
+    This setting is shared by all threads of the process.
+
+    Args:
+        num_threads: The number of threads. If 0, the number of
+            hardware threads is used.
+    """
+    _set_num_threads(num_threads)
+
+
+def get_num_threads() -> int:
+    """Get the number of threads used by default by parallel kernels.
+
+    Returns:
+        The number of threads.
+    """
+    return _get_num_threads()
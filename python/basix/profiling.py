@@ -0,0 +1,66 @@
+"""Timing of element construction and runtime kernels.
+
+Profiling is disabled by default. When it is enabled, the wall time and
+number of calls of each instrumented phase of element construction
+(for example ``create_element``, ``polyset::tabulate`` and
+``moments::make_integral_moments``) and of runtime kernels (for example
+``FiniteElement::tabulate``, ``FiniteElement::dof_transformations`` and
+``FiniteElement::push_forward``) are recorded. Times are inclusive: the
+time of a phase includes the time of the phases that it calls.
+
+Example:
+    basix.profiling.enable()
+    e = basix.create_element(basix.ElementFamily.P, basix.CellType.triangle, 3, cache=False)
+    for name, (count, time) in basix.profiling.get_timings().items():
+        print(name, count, time)
+"""
+
+import typing
+
+from basix._basixcpp import profiling_enable as _enable
+from basix._basixcpp import profiling_is_enabled as _is_enabled
+from basix._basixcpp import profiling_reset as _reset
+from basix._basixcpp import profiling_timings as _timings
+
+__all__ = ["enable", "disable", "is_enabled", "get_timings", "reset"]
+
+
+def enable():
+    """Enable profiling.
+
+    This setting is shared by all threads of the process.
+    """
+    _enable(True)
+
+
+def disable():
+    """Disable profiling.
+
+    Timings that have already been recorded are kept.
+    """
+    _enable(False)
+
+
+def is_enabled() -> bool:
+    """Check if profiling is enabled.
+
+    Returns:
+        ``True`` if profiling is enabled.
+    """
+    return _is_enabled()
+
+
+def get_timings() -> typing.Dict[str, typing.Tuple[int, float]]:
+    """Get the recorded timings.
+
+    Returns:
+        The number of calls and the total wall time of the calls, in
+        seconds, of each phase that has been called since profiling was
+        enabled or last reset, keyed by the name of the phase.
+    """
+    return _timings()
+
+
+def reset():
+    """Remove all recorded timings."""
+    _reset()
@@ -62,7 +62,9 @@ def make_quadrature(
             exactly.
 
     Returns:
-        The quadrature points and weights.
+        The quadrature points and weights. Rules are cached, and the
+        arrays are read-only views of the cached rule, so they must be
+        copied before being modified.
 
     """
     return _mq(rule.value, cell.value, polyset_type.value, degree)
@@ -0,0 +1,63 @@
+"""Sum-factorised kernels for tensor-product elements.
+
+For an element on a quadrilateral or hexahedron that is a tensor
+product of elements on an interval, the values of a finite element
+function at a tensor product of points can be computed by applying the
+tabulated 1D basis functions one direction at a time. With p the number
+of 1D dofs and points and d the topological dimension, this costs
+O(p^{d+1}) operations instead of the O(p^{2d}) operations needed to
+apply the full tabulated basis.
+
+The 1D tabulations can be computed using
+`basix.finite_element.FiniteElement.tabulate_tensor_factors`.
+"""
+
+import typing
+
+import numpy as _np
+import numpy.typing as npt
+
+from basix._basixcpp import sum_factorisation_evaluate as _evaluate
+
+
+def evaluate(phi: typing.Sequence[npt.NDArray], u: npt.NDArray) -> npt.NDArray[_np.floating]:
+    """Evaluate a function at a tensor product of points.
+
+    Computes ``v[q0, ..., qd] = sum phi[0][q0, i0] ... phi[d][qd, id]
+    u[i0, ..., id]``.
+
+    Args:
+        phi: The 1D tabulated basis functions in each direction. Entry
+            ``k`` has shape (number of points in direction ``k``,
+            number of dofs in direction ``k``).
+        u: The coefficients of the function in tensor product ordering.
+            Either a flat array or an array of shape (n_0, ..., n_d).
+
+    Returns:
+        The values at the points, with shape (q_0, ..., q_d).
+    """
+    phi = [_np.ascontiguousarray(p) for p in phi]
+    v = _evaluate(phi, _np.ascontiguousarray(u, dtype=phi[0].dtype).reshape(-1), False)
+    return v.reshape([p.shape[0] for p in phi])
+
+
+def evaluate_transpose(phi: typing.Sequence[npt.NDArray], v: npt.NDArray) -> npt.NDArray[_np.floating]:
+    """Apply the transpose of `evaluate`.
+
+    Computes ``u[i0, ..., id] = sum phi[0][q0, i0] ... phi[d][qd, id]
+    v[q0, ..., qd]``. This is used in assembly, where ``v`` holds
+    (weighted) values at quadrature points.
+
+    Args:
+        phi: The 1D tabulated basis functions in each direction. Entry
+            ``k`` has shape (number of points in direction ``k``,
+            number of dofs in direction ``k``).
+        v: The values at the points in tensor product ordering. Either
+            a flat array or an array of shape (q_0, ..., q_d).
+
+    Returns:
+        The result for each dof, with shape (n_0, ..., n_d).
+    """
+    phi = [_np.ascontiguousarray(p) for p in phi]
+    u = _evaluate(phi, _np.ascontiguousarray(v, dtype=phi[0].dtype).reshape(-1), True)
+    return u.reshape([p.shape[1] for p in phi])
@@ -824,11 +824,13 @@ class _MixedElement(_ElementBase):
     """
 
     _sub_elements: _typing.List[_ElementBase]
+    _columns: _typing.Optional[_typing.List[_npt.NDArray[_np.int64]]]
 
     def __init__(self, sub_elements: _typing.List[_ElementBase], gdim: _typing.Optional[int] = None):
         """Initialise the element."""
         assert len(sub_elements) > 0
         self._sub_elements = sub_elements
+        self._columns = None
         if all(isinstance(e.pullback, _IdentityPullback) for e in sub_elements):
             pullback = _ufl.identity_pullback
         else:
@@ -860,28 +862,54 @@ class _MixedElement(_ElementBase):
         """Degree of the element."""
         return max((e.degree for e in self._sub_elements), default=-1)
 
-    def tabulate(self, nderivs: int, points: _npt.NDArray[_np.float64]) -> _npt.NDArray[_np.float64]:
+    def _tabulate_columns(self) -> _typing.List[_npt.NDArray[_np.int64]]:
+        """Get the columns of the tabulated basis functions that each sub element is written to.
+
+        The columns are computed on the first call and cached.
+
+        Returns:
+            For each sub element, the column of the mixed element's table that each
+            column of the sub element's table is written to
+
+        """
+        if self._columns is None:
+            self._columns = []
+            start = 0
+            for e in self._sub_elements:
+                # Blocks of value_size columns of the sub element's table are written
+                # value_size of the mixed element apart
+                nblocks = -(-e.dim // e.value_size)
+                blocks = start + self.value_size * _np.arange(nblocks)
+                self._columns.append((blocks[:, None] + _np.arange(e.value_size)).flatten())
+                start += self.value_size * nblocks
+        return self._columns
+
+    def tabulate(self, nderivs: int, points: _npt.NDArray[_np.float64],
+                 out: _typing.Optional[_npt.NDArray[_np.float64]] = None) -> _npt.NDArray[_np.float64]:
         """Tabulate the basis functions of the element.
 
         Args:
             nderivs: Number of derivatives to tabulate.
             points: Points to tabulate at
+            out: Array to write the tabulated basis functions to. If
+                not given, a new array is allocated.
 
         Returns:
             Tabulated basis functions
 
         """
-        tables = []
         results = [e.tabulate(nderivs, points) for e in self._sub_elements]
-        for deriv_tables in zip(*results):
-            new_table = _np.zeros((len(points), self.value_size * self.dim))
-            start = 0
-            for e, t in zip(self._sub_elements, deriv_tables):
-                for i in range(0, e.dim, e.value_size):
-                    new_table[:, start: start + e.value_size] = t[:, i: i + e.value_size]
-                    start += self.value_size
-            tables.append(new_table)
-        return _np.asarray(tables, dtype=_np.float64)
+        shape = (results[0].shape[0], len(points), self.value_size * self.dim)
+        if out is None:
+            out = _np.zeros(shape)
+        elif out.shape != shape:
+            raise ValueError(f"out has shape {out.shape}, but {shape} is required.")
+        else:
+            out[...] = 0.0
+
+        for t, columns in zip(results, self._tabulate_columns()):
+            out[:, :, columns] = t[:, :, :len(columns)]
+        return out
 
     def get_component_element(self, flat_component: int) -> _typing.Tuple[_ElementBase, int, int]:
         """Get element that represents a component of the element, and the offset and stride of the component.
@@ -1098,6 +1126,7 @@ class _BlockedElement(_ElementBase):
     _block_shape: _typing.Tuple[int, ...]
     _sub_element: _ElementBase
     _block_size: int
+    _block_indices: _npt.NDArray[_np.int64]
 
     def __init__(self, sub_element: _ElementBase, shape: _typing.Tuple[int, ...],
                  symmetry: _typing.Optional[bool] = None, gdim: _typing.Optional[int] = None,):
@@ -1146,6 +1175,13 @@ class _BlockedElement(_ElementBase):
 
             self._pullback = _SymmetricPullback(self, symmetry_mapping)
 
+        # The index in the block of the sub element that gives each
+        # (flattened) component of the value
+        if symmetry:
+            self._block_indices = _np.array([symmetry_mapping[c] for c in _itertools.product(*map(range, shape))])
+        else:
+            self._block_indices = _np.arange(block_size)
+
     def __eq__(self, other) -> bool:
         """Check if two elements are equal."""
         return (
@@ -1157,34 +1193,43 @@ class _BlockedElement(_ElementBase):
         """Return a hash."""
         return super().__hash__()
 
-    def tabulate(self, nderivs: int, points: _npt.NDArray[_np.float64]) -> _npt.NDArray[_np.float64]:
+    def tabulate(self, nderivs: int, points: _npt.NDArray[_np.float64],
+                 out: _typing.Optional[_npt.NDArray[_np.float64]] = None) -> _npt.NDArray[_np.float64]:
         """Tabulate the basis functions of the element.
 
+        Basis function ``i * block_size + b`` is equal to basis function
+        ``i`` of the sub element in the components of the value that use
+        block ``b``, and is zero in the other components.
+
         Args:
             nderivs: Number of derivatives to tabulate.
             points: Points to tabulate at
+            out: Array to write the tabulated basis functions to. If
+                not given, a new array is allocated.
 
         Returns:
-            Tabulated basis functions
+            Tabulated basis functions, with shape
+            ``(num_derivatives, num_points, *value_shape, dim)``.
 
         """
-        assert len(self._block_shape) == 1  # TODO: block shape
-        assert self.value_size == self._block_size  # TODO: remove this assumption
-        output = []
-        for table in self._sub_element.tabulate(nderivs, points):
-            # Repeat sub element horizontally
-            assert len(table.shape) == 2
-            new_table = _np.zeros((table.shape[0], *self._block_shape,
-                                   self._block_size * table.shape[1]))
-            for i, j in enumerate(_itertools.product(*[range(s) for s in self._block_shape])):
-                if len(j) == 1:
-                    new_table[:, j[0], i::self._block_size] = table
-                elif len(j) == 2:
-                    new_table[:, j[0], j[1], i::self._block_size] = table
-                else:
-                    raise NotImplementedError()
-            output.append(new_table)
-        return _np.asarray(output, dtype=_np.float64)
+        table = self._sub_element.tabulate(nderivs, points)
+        assert len(table.shape) == 3
+        shape = (table.shape[0], table.shape[1], *self._value_shape, self.dim)
+        if out is None:
+            out = _np.zeros(shape)
+        elif out.shape != shape:
+            raise ValueError(f"out has shape {out.shape}, but {shape} is required.")
+        elif not out.flags.c_contiguous:
+            raise ValueError("out must be C-contiguous.")
+        else:
+            out[...] = 0.0
+
+        # Write the sub element table into the entries of each component
+        # that belong to the component's block
+        blocks = out.reshape(table.shape[0], table.shape[1], len(self._block_indices), table.shape[2],
+                             self._block_size)
+        blocks[:, :, _np.arange(len(self._block_indices)), :, self._block_indices] = table
+        return out
 
     def get_component_element(self, flat_component: int) -> _typing.Tuple[_ElementBase, int, int]:
         """Get element that represents a component of the element, and the offset and stride of the component.
@@ -1819,24 +1864,26 @@ def _compute_signature(element: _basix.finite_element.FiniteElement) -> str:
     signature = (f"{element.cell_type.name}, {element.value_shape}, {element.map_type.name}, "
                  f"{element.discontinuous}, {element.embedded_subdegree}, {element.embedded_superdegree}, "
                  f"{element.dtype}, {element.dof_ordering}")
-    data = ",".join([f"{i}" for row in element.wcoeffs for i in row])
-    data += "__"
-    for entity in element.x:
-        for points in entity:
-            data += ",".join([f"{i}" for p in points for i in p])
-            data += "_"
-    data += "__"
-
-    for entity in element.M:
-        for matrices in entity:
-            data += ",".join([f"{i}" for mat in matrices for row in mat for i in row])
-            data += "_"
-    data += "__"
-
-    for mat in element.entity_transformations().values():
-        data += ",".join([f"{i}" for row in mat for i in row])
-        data += "__"
-    signature += _hashlib.sha1(data.encode('utf-8')).hexdigest()
+
+    # The raw bytes of each array, converted to little-endian float64,
+    # are hashed with a header that gives the array's name and shape
+    sha = _hashlib.sha1()
+
+    def add(name: str, data: _npt.NDArray[_np.floating]):
+        array = _np.ascontiguousarray(data, dtype="<f8")
+        sha.update(f"{name}{array.shape};".encode("utf-8"))
+        sha.update(array)
+
+    add("wcoeffs", element.wcoeffs)
+    for d, entity in enumerate(element.x):
+        for i, points in enumerate(entity):
+            add(f"x{d},{i}", points)
+    for d, entity in enumerate(element.M):
+        for i, matrices in enumerate(entity):
+            add(f"M{d},{i}", matrices)
+    for cell, mat in element.entity_transformations().items():
+        add(f"T{cell}", mat)
+    signature += sha.hexdigest()
 
     return signature
 
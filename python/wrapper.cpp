@@ -3,6 +3,7 @@
 // SPDX-License-Identifier:    MIT
 
 #include <basix/cell.h>
+#include <basix/element-cache.h>
 #include <basix/element-families.h>
 #include <basix/finite-element.h>
 #include <basix/indexing.h>
@@ -10,18 +11,27 @@
 #include <basix/lattice.h>
 #include <basix/maps.h>
 #include <basix/mdspan.hpp>
+#include <basix/parallel.h>
 #include <basix/polynomials.h>
 #include <basix/polyset.h>
+#include <basix/profiling.h>
 #include <basix/quadrature.h>
 #include <basix/sobolev-spaces.h>
+#include <basix/sum-factorisation.h>
+#include <map>
 #include <memory>
 #include <nanobind/nanobind.h>
 #include <nanobind/ndarray.h>
+#include <nanobind/stl/filesystem.h>
+#include <nanobind/stl/map.h>
+#include <nanobind/stl/optional.h>
 #include <nanobind/stl/pair.h>
+#include <nanobind/stl/shared_ptr.h>
 #include <nanobind/stl/string.h>
 #include <nanobind/stl/tuple.h>
 #include <nanobind/stl/variant.h>
 #include <nanobind/stl/vector.h>
+#include <optional>
 #include <span>
 #include <string>
 #include <type_traits>
@@ -84,19 +94,122 @@ auto as_nbarrayp(std::pair<V, std::array<std::size_t, U>>&& x)
   return as_nbarray(std::move(x.first), x.second.size(), x.second.data());
 }
 
+/// Call a function with the GIL released, so that other Python threads
+/// can run while it computes. The function must not use any Python
+/// objects.
+template <typename Fn>
+auto without_gil(Fn&& f)
+{
+  nb::gil_scoped_release release;
+  return f();
+}
+
 template <typename T>
 void declare_float(nb::module_& m, std::string type)
 {
   std::string name = "FiniteElement_" + type;
   nb::class_<FiniteElement<T>>(m, name.c_str())
-      .def("tabulate",
+      .def(
+          "tabulate",
+          [](const FiniteElement<T>& self, int n,
+             nb::ndarray<const T, nb::ndim<2>, nb::c_contig> x, int num_threads)
+          {
+            mdspan_t<const T, 2> _x(x.data(), x.shape(0), x.shape(1));
+            std::array<std::size_t, 4> shape
+                = self.tabulate_shape(n, _x.extent(0));
+            std::vector<T> basis(shape[0] * shape[1] * shape[2] * shape[3]);
+            {
+              nb::gil_scoped_release release;
+              self.tabulate(n, _x, mdspan_t<T, 4>(basis.data(), shape),
+                            num_threads);
+            }
+            return as_nbarray(std::move(basis), shape.size(), shape.data());
+          },
+          "n"_a, "x"_a, "num_threads"_a = 0)
+      .def(
+          "tabulate_out",
+          [](const FiniteElement<T>& self, int n,
+             nb::ndarray<const T, nb::ndim<2>, nb::c_contig> x,
+             nb::ndarray<T, nb::ndim<4>, nb::c_contig> basis,
+             std::optional<nb::ndarray<T, nb::ndim<1>, nb::c_contig>> work,
+             int num_threads)
+          {
+            mdspan_t<const T, 2> _x(x.data(), x.shape(0), x.shape(1));
+            mdspan_t<T, 4> _basis(basis.data(), basis.shape(0),
+                                  basis.shape(1), basis.shape(2),
+                                  basis.shape(3));
+            nb::gil_scoped_release release;
+            if (work)
+              self.tabulate(n, _x, _basis,
+                            std::span<T>(work->data(), work->size()),
+                            num_threads);
+            else
+              self.tabulate(n, _x, _basis, num_threads);
+          },
+          "n"_a, "x"_a, "basis"_a.noconvert(),
+          "work"_a.noconvert().none() = nb::none(), "num_threads"_a = 0)
+      .def(
+          "tabulate_batch",
+          [](const FiniteElement<T>& self, int n,
+             nb::ndarray<const T, nb::ndim<3>, nb::c_contig> x,
+             nb::ndarray<T, nb::ndim<5>, nb::c_contig> basis,
+             std::optional<nb::ndarray<T, nb::ndim<1>, nb::c_contig>> work,
+             int num_threads)
+          {
+            mdspan_t<const T, 3> _x(x.data(), x.shape(0), x.shape(1),
+                                    x.shape(2));
+            mdspan_t<T, 5> _basis(basis.data(), basis.shape(0),
+                                  basis.shape(1), basis.shape(2),
+                                  basis.shape(3), basis.shape(4));
+            nb::gil_scoped_release release;
+            if (work)
+              self.tabulate(n, _x, _basis,
+                            std::span<T>(work->data(), work->size()),
+                            num_threads);
+            else
+              self.tabulate(n, _x, _basis, num_threads);
+          },
+          "n"_a, "x"_a, "basis"_a.noconvert(),
+          "work"_a.noconvert().none() = nb::none(), "num_threads"_a = 0)
+      .def("tabulate_workspace_size",
+           &FiniteElement<T>::tabulate_workspace_size, "n"_a, "num_points"_a)
+      .def("tabulate_shape",
+           [](const FiniteElement<T>& self, std::size_t n,
+              std::size_t num_points)
+           {
+             std::array<std::size_t, 4> s = self.tabulate_shape(n, num_points);
+             return std::tuple(s[0], s[1], s[2], s[3]);
+           })
+      .def("tabulate_tensor_factors",
            [](const FiniteElement<T>& self, int n,
               nb::ndarray<const T, nb::ndim<2>, nb::c_contig> x)
            {
              mdspan_t<const T, 2> _x(x.data(), x.shape(0), x.shape(1));
-             return as_nbarrayp(self.tabulate(n, _x));
+             return as_nbarrayp(without_gil(
+                 [&] { return self.tabulate_tensor_factors(n, _x); }));
            })
       .def("__eq__", &FiniteElement<T>::operator==)
+      .def("serialize",
+           [](const FiniteElement<T>& self)
+           {
+             std::vector<std::byte> data
+                 = without_gil([&] { return self.serialize(); });
+             return nb::bytes(data.data(), data.size());
+           })
+      .def("__getstate__",
+           [](const FiniteElement<T>& self)
+           {
+             std::vector<std::byte> data
+                 = without_gil([&] { return self.serialize(); });
+             return nb::bytes(data.data(), data.size());
+           })
+      .def("__setstate__",
+           [](FiniteElement<T>& self, nb::bytes data)
+           {
+             new (&self) FiniteElement<T>(FiniteElement<T>::deserialize(
+                 std::span(static_cast<const std::byte*>(data.data()),
+                           data.size())));
+           })
       .def("push_forward",
            [](const FiniteElement<T>& self,
               nb::ndarray<const T, nb::ndim<3>, nb::c_contig> U,
@@ -104,33 +217,83 @@ void declare_float(nb::module_& m, std::string type)
               nb::ndarray<const T, nb::ndim<1>, nb::c_contig> detJ,
               nb::ndarray<const T, nb::ndim<3>, nb::c_contig> K)
            {
-             auto u = self.push_forward(
+             auto u = without_gil(
+                 [&]
+                 {
+                   return self.push_forward(
+                       mdspan_t<const T, 3>(U.data(), U.shape(0), U.shape(1),
+                                            U.shape(2)),
+                       mdspan_t<const T, 3>(J.data(), J.shape(0), J.shape(1),
+                                            J.shape(2)),
+                       std::span<const T>(detJ.data(), detJ.shape(0)),
+                       mdspan_t<const T, 3>(K.data(), K.shape(0), K.shape(1),
+                                            K.shape(2)));
+                 });
+             return as_nbarrayp(std::move(u));
+           })
+      .def("pull_back",
+           [](const FiniteElement<T>& self,
+              nb::ndarray<const T, nb::ndim<3>, nb::c_contig> u,
+              nb::ndarray<const T, nb::ndim<3>, nb::c_contig> J,
+              nb::ndarray<const T, nb::ndim<1>, nb::c_contig> detJ,
+              nb::ndarray<const T, nb::ndim<3>, nb::c_contig> K)
+           {
+             auto U = without_gil(
+                 [&]
+                 {
+                   return self.pull_back(
+                       mdspan_t<const T, 3>(u.data(), u.shape(0), u.shape(1),
+                                            u.shape(2)),
+                       mdspan_t<const T, 3>(J.data(), J.shape(0), J.shape(1),
+                                            J.shape(2)),
+                       std::span<const T>(detJ.data(), detJ.shape(0)),
+                       mdspan_t<const T, 3>(K.data(), K.shape(0), K.shape(1),
+                                            K.shape(2)));
+                 });
+             return as_nbarrayp(std::move(U));
+           })
+      .def("push_forward_out",
+           [](const FiniteElement<T>& self,
+              nb::ndarray<const T, nb::ndim<3>, nb::c_contig> U,
+              nb::ndarray<const T, nb::ndim<3>, nb::c_contig> J,
+              nb::ndarray<const T, nb::ndim<1>, nb::c_contig> detJ,
+              nb::ndarray<const T, nb::ndim<3>, nb::c_contig> K,
+              nb::ndarray<T, nb::ndim<3>, nb::c_contig> u)
+           {
+             nb::gil_scoped_release release;
+             self.push_forward(
                  mdspan_t<const T, 3>(U.data(), U.shape(0), U.shape(1),
                                       U.shape(2)),
                  mdspan_t<const T, 3>(J.data(), J.shape(0), J.shape(1),
                                       J.shape(2)),
                  std::span<const T>(detJ.data(), detJ.shape(0)),
                  mdspan_t<const T, 3>(K.data(), K.shape(0), K.shape(1),
-                                      K.shape(2)));
-             return as_nbarrayp(std::move(u));
-           })
-      .def("pull_back",
+                                      K.shape(2)),
+                 mdspan_t<T, 3>(u.data(), u.shape(0), u.shape(1),
+                                u.shape(2)));
+           },
+           "U"_a, "J"_a, "detJ"_a, "K"_a, "u"_a.noconvert())
+      .def("pull_back_out",
            [](const FiniteElement<T>& self,
               nb::ndarray<const T, nb::ndim<3>, nb::c_contig> u,
               nb::ndarray<const T, nb::ndim<3>, nb::c_contig> J,
               nb::ndarray<const T, nb::ndim<1>, nb::c_contig> detJ,
-              nb::ndarray<const T, nb::ndim<3>, nb::c_contig> K)
+              nb::ndarray<const T, nb::ndim<3>, nb::c_contig> K,
+              nb::ndarray<T, nb::ndim<3>, nb::c_contig> U)
            {
-             auto U = self.pull_back(
+             nb::gil_scoped_release release;
+             self.pull_back(
                  mdspan_t<const T, 3>(u.data(), u.shape(0), u.shape(1),
                                       u.shape(2)),
                  mdspan_t<const T, 3>(J.data(), J.shape(0), J.shape(1),
                                       J.shape(2)),
                  std::span<const T>(detJ.data(), detJ.shape(0)),
                  mdspan_t<const T, 3>(K.data(), K.shape(0), K.shape(1),
-                                      K.shape(2)));
-             return as_nbarrayp(std::move(U));
-           })
+                                      K.shape(2)),
+                 mdspan_t<T, 3>(U.data(), U.shape(0), U.shape(1),
+                                U.shape(2)));
+           },
+           "u"_a, "J"_a, "detJ"_a, "K"_a, "U"_a.noconvert())
       .def("pre_apply_dof_transformation",
            [](const FiniteElement<T>& self,
               nb::ndarray<T, nb::ndim<1>, nb::c_contig> data, int block_size,
@@ -139,6 +302,18 @@ void declare_float(nb::module_& m, std::string type)
              self.pre_apply_dof_transformation(
                  std::span(data.data(), data.size()), block_size, cell_info);
            })
+      .def("pre_apply_dof_transformation",
+           [](const FiniteElement<T>& self,
+              nb::ndarray<T, nb::c_contig> data, int block_size,
+              nb::ndarray<const std::uint32_t, nb::ndim<1>, nb::c_contig>
+                  cell_info)
+           {
+             nb::gil_scoped_release release;
+             self.pre_apply_dof_transformation(
+                 std::span(data.data(), data.size()), block_size,
+                 std::span(cell_info.data(), cell_info.size()));
+           },
+           "data"_a.noconvert(), "block_size"_a, "cell_info"_a)
       .def("post_apply_transpose_dof_transformation",
            [](const FiniteElement<T>& self,
               nb::ndarray<T, nb::ndim<1>, nb::c_contig> data, int block_size,
@@ -147,6 +322,18 @@ void declare_float(nb::module_& m, std::string type)
              self.post_apply_transpose_dof_transformation(
                  std::span(data.data(), data.size()), block_size, cell_info);
            })
+      .def("post_apply_transpose_dof_transformation",
+           [](const FiniteElement<T>& self,
+              nb::ndarray<T, nb::c_contig> data, int block_size,
+              nb::ndarray<const std::uint32_t, nb::ndim<1>, nb::c_contig>
+                  cell_info)
+           {
+             nb::gil_scoped_release release;
+             self.post_apply_transpose_dof_transformation(
+                 std::span(data.data(), data.size()), block_size,
+                 std::span(cell_info.data(), cell_info.size()));
+           },
+           "data"_a.noconvert(), "block_size"_a, "cell_info"_a)
       .def("pre_apply_inverse_transpose_dof_transformation",
            [](const FiniteElement<T>& self,
               nb::ndarray<T, nb::ndim<1>, nb::c_contig> data, int block_size,
@@ -155,6 +342,18 @@ void declare_float(nb::module_& m, std::string type)
              self.pre_apply_inverse_transpose_dof_transformation(
                  std::span(data.data(), data.size()), block_size, cell_info);
            })
+      .def("pre_apply_inverse_transpose_dof_transformation",
+           [](const FiniteElement<T>& self,
+              nb::ndarray<T, nb::c_contig> data, int block_size,
+              nb::ndarray<const std::uint32_t, nb::ndim<1>, nb::c_contig>
+                  cell_info)
+           {
+             nb::gil_scoped_release release;
+             self.pre_apply_inverse_transpose_dof_transformation(
+                 std::span(data.data(), data.size()), block_size,
+                 std::span(cell_info.data(), cell_info.size()));
+           },
+           "data"_a.noconvert(), "block_size"_a, "cell_info"_a)
       .def("base_transformations", [](const FiniteElement<T>& self)
            { return as_nbarrayp(self.base_transformations()); })
       .def("entity_transformations",
@@ -372,6 +571,7 @@ void declare_float(nb::module_& m, std::string type)
           }
         }
 
+        nb::gil_scoped_release release;
         return basix::create_custom_element<T>(
             cell_type, value_shape,
             mdspan_t<const T, 2>(wcoeffs.data(), wcoeffs.shape(0),
@@ -389,17 +589,54 @@ void declare_float(nb::module_& m, std::string type)
         [](const FiniteElement<T>& element_from,
            const FiniteElement<T>& element_to)
         {
-          return as_nbarrayp(
-              basix::compute_interpolation_operator(element_from, element_to));
+          return as_nbarrayp(without_gil(
+              [&]
+              {
+                return basix::compute_interpolation_operator(element_from,
+                                                             element_to);
+              }));
         });
 
+  m.def(
+      "sum_factorisation_evaluate",
+      [](const std::vector<nb::ndarray<const T, nb::ndim<2>, nb::c_contig>>&
+             phi,
+         nb::ndarray<const T, nb::ndim<1>, nb::c_contig> u, bool transpose)
+      {
+        std::vector<mdspan_t<const T, 2>> _phi;
+        std::size_t size = 1;
+        for (auto& p : phi)
+        {
+          _phi.emplace_back(p.data(), p.shape(0), p.shape(1));
+          size *= transpose ? p.shape(1) : p.shape(0);
+        }
+        std::vector<T> v(size);
+        {
+          nb::gil_scoped_release release;
+          std::vector<T> work(sum_factorisation::workspace_size<T>(_phi));
+          if (transpose)
+          {
+            sum_factorisation::evaluate_transpose<T>(
+                _phi, std::span(u.data(), u.size()), v, work);
+          }
+          else
+          {
+            sum_factorisation::evaluate<T>(_phi, std::span(u.data(), u.size()),
+                                           v, work);
+          }
+        }
+        return as_nbarray(std::move(v));
+      },
+      "phi"_a.noconvert(), "u"_a.noconvert(), "transpose"_a);
+
   m.def(
       "tabulate_polynomial_set",
       [](cell::type celltype, polyset::type polytype, int d, int n,
          nb::ndarray<const T, nb::ndim<2>, nb::c_contig> x)
       {
         mdspan_t<const T, 2> _x(x.data(), x.shape(0), x.shape(1));
-        return as_nbarrayp(polyset::tabulate(celltype, polytype, d, n, _x));
+        return as_nbarrayp(without_gil(
+            [&] { return polyset::tabulate(celltype, polytype, d, n, _x); }));
       },
       "celltype"_a, "polytype"_a, "d"_a, "n"_a, "x"_a.noconvert());
 }
@@ -454,17 +691,21 @@ NB_MODULE(_basixcpp, m)
          nb::ndarray<const double, nb::ndim<2>, nb::c_contig> x)
       {
         mdspan_t<const double, 2> _x(x.data(), x.shape(0), x.shape(1));
-        return as_nbarrayp(polynomials::tabulate(polytype, celltype, d, _x));
+        return as_nbarrayp(without_gil(
+            [&] { return polynomials::tabulate(polytype, celltype, d, _x); }));
       });
   m.def("polynomials_dim", &polynomials::dim);
-  m.def(
-      "create_lattice",
-      [](cell::type celltype, int n, lattice::type type, bool exterior,
-         lattice::simplex_method method)
-      {
-        return as_nbarrayp(
-            lattice::create<double>(celltype, n, type, exterior, method));
-      });
+  m.def("create_lattice",
+        [](cell::type celltype, int n, lattice::type type, bool exterior,
+           lattice::simplex_method method)
+        {
+          return as_nbarrayp(without_gil(
+              [&]
+              {
+                return lattice::create<double>(celltype, n, type, exterior,
+                                               method);
+              }));
+        });
 
   nb::enum_<maps::type>(m, "MapType")
       .value("identity", maps::type::identity)
@@ -594,6 +835,7 @@ NB_MODULE(_basixcpp, m)
          bool discontinuous, const std::vector<int>& dof_ordering, char dtype)
           -> std::variant<FiniteElement<float>, FiniteElement<double>>
       {
+        nb::gil_scoped_release release;
         if (dtype == 'd')
         {
           return basix::create_element<double>(family_name, cell_name, degree,
@@ -614,6 +856,119 @@ NB_MODULE(_basixcpp, m)
       "dpc_variant"_a = element::dpc_variant::unset, "discontinuous"_a = false,
       "dof_ordering"_a = std::vector<int>());
 
+  m.def(
+      "create_element_cached",
+      [](element::family family_name, cell::type cell_name, int degree,
+         element::lagrange_variant lvariant, element::dpc_variant dvariant,
+         bool discontinuous, const std::vector<int>& dof_ordering,
+         char dtype) -> std::variant<std::shared_ptr<FiniteElement<float>>,
+                                     std::shared_ptr<FiniteElement<double>>>
+      {
+        // Elements are immutable from Python, so constness can be
+        // dropped to share the cached element
+        nb::gil_scoped_release release;
+        if (dtype == 'd')
+        {
+          return std::const_pointer_cast<FiniteElement<double>>(
+              element_cache::get<double>(family_name, cell_name, degree,
+                                         lvariant, dvariant, discontinuous,
+                                         dof_ordering));
+        }
+        else if (dtype == 'f')
+        {
+          return std::const_pointer_cast<FiniteElement<float>>(
+              element_cache::get<float>(family_name, cell_name, degree,
+                                        lvariant, dvariant, discontinuous,
+                                        dof_ordering));
+        }
+        else
+          throw std::runtime_error("Unsupported finite element dtype.");
+      },
+      "family_name"_a, "cell_name"_a, "degree"_a, "dtype"_a,
+      "lagrange_variant"_a = element::lagrange_variant::unset,
+      "dpc_variant"_a = element::dpc_variant::unset, "discontinuous"_a = false,
+      "dof_ordering"_a = std::vector<int>());
+
+  nb::enum_<element_cache::policy>(m, "ElementCachePolicy")
+      .value("lru", element_cache::policy::lru)
+      .value("fifo", element_cache::policy::fifo)
+      .def_prop_ro("name",
+                   [](nb::object obj) { return nb::getattr(obj, "__name__"); });
+  m.def("element_cache_set_capacity", &element_cache::set_capacity,
+        "capacity"_a);
+  m.def("element_cache_set_policy", &element_cache::set_policy, "policy"_a);
+  m.def("element_cache_get_policy", &element_cache::get_policy);
+  m.def("element_cache_clear", &element_cache::clear);
+  m.def("element_cache_stats",
+        []()
+        {
+          element_cache::statistics s = element_cache::stats();
+          return std::tuple(s.hits, s.misses, s.evictions, s.size, s.capacity,
+                            s.disk_hits);
+        });
+  m.def(
+      "element_cache_set_directory",
+      [](std::optional<std::filesystem::path> path)
+      { element_cache::set_directory(path.value_or(std::filesystem::path())); },
+      "path"_a.none());
+  m.def("element_cache_get_directory",
+        []() -> std::optional<std::filesystem::path>
+        {
+          std::filesystem::path path = element_cache::get_directory();
+          if (path.empty())
+            return std::nullopt;
+          else
+            return path;
+        });
+  m.def("set_num_threads", &parallel::set_num_threads, "num_threads"_a);
+  m.def("get_num_threads", &parallel::get_num_threads);
+  m.def("profiling_enable", &profiling::enable, "enabled"_a);
+  m.def("profiling_is_enabled", &profiling::is_enabled);
+  m.def("profiling_reset", &profiling::reset);
+  m.def("profiling_timings",
+        []()
+        {
+          std::map<std::string, std::pair<std::size_t, double>> timings;
+          for (auto& [name, t] : profiling::timings())
+            timings[name] = {t.count, t.time};
+          return timings;
+        });
+
+  m.def("save_element", &element_cache::save<float>, "path"_a, "element"_a,
+        nb::call_guard<nb::gil_scoped_release>());
+  m.def("save_element", &element_cache::save<double>, "path"_a, "element"_a,
+        nb::call_guard<nb::gil_scoped_release>());
+  m.def(
+      "load_element",
+      [](const std::filesystem::path& path, char dtype)
+          -> std::variant<FiniteElement<float>, FiniteElement<double>>
+      {
+        nb::gil_scoped_release release;
+        if (dtype == 'd')
+          return element_cache::load<double>(path);
+        else if (dtype == 'f')
+          return element_cache::load<float>(path);
+        else
+          throw std::runtime_error("Unsupported finite element dtype.");
+      },
+      "path"_a, "dtype"_a);
+  m.def(
+      "deserialize_element",
+      [](nb::bytes data, char dtype)
+          -> std::variant<FiniteElement<float>, FiniteElement<double>>
+      {
+        std::span buffer(static_cast<const std::byte*>(data.data()),
+                         data.size());
+        nb::gil_scoped_release release;
+        if (dtype == 'd')
+          return FiniteElement<double>::deserialize(buffer);
+        else if (dtype == 'f')
+          return FiniteElement<float>::deserialize(buffer);
+        else
+          throw std::runtime_error("Unsupported finite element dtype.");
+      },
+      "data"_a, "dtype"_a);
+
   nb::enum_<polyset::type>(m, "PolysetType")
       .value("standard", polyset::type::standard)
       .value("macroedge", polyset::type::macroedge)
@@ -630,17 +985,28 @@ NB_MODULE(_basixcpp, m)
       [](polyset::type ptype, cell::type cell, cell::type restriction_cell)
       { return polyset::restriction(ptype, cell, restriction_cell); });
 
-  m.def(
-      "make_quadrature",
-      [](quadrature::type rule, cell::type celltype, polyset::type polytype,
-         int m)
-      {
-        auto [pts, w]
-            = quadrature::make_quadrature<double>(rule, celltype, polytype, m);
-        std::array shape{w.size(), pts.size() / w.size()};
-        return std::pair(as_nbarray(std::move(pts), shape.size(), shape.data()),
-                         as_nbarray(std::move(w)));
-      });
+  m.def("make_quadrature",
+        [](quadrature::type rule, cell::type celltype, polyset::type polytype,
+           int m)
+        {
+          // Return read-only views into the cached rule. The arrays keep
+          // the rule alive.
+          using rule_t
+              = std::shared_ptr<const std::array<std::vector<double>, 2>>;
+          rule_t* q = new rule_t(without_gil(
+              [&]
+              {
+                return quadrature::make_quadrature_shared<double>(
+                    rule, celltype, polytype, m);
+              }));
+          nb::capsule owner(q, [](void* p) noexcept { delete (rule_t*)p; });
+          auto& [pts, w] = **q;
+          std::array shape{w.size(), pts.size() / w.size()};
+          return std::pair(nb::ndarray<const double, nb::numpy>(
+                               pts.data(), shape.size(), shape.data(), owner),
+                           nb::ndarray<const double, nb::numpy>(
+                               w.data(), 1, shape.data(), owner));
+        });
 
   m.def("index", nb::overload_cast<int>(&basix::indexing::idx));
   m.def("index", nb::overload_cast<int, int>(&basix::indexing::idx));
@@ -0,0 +1,239 @@
+# Copyright (c) 2024 Basix contributors
+# FEniCS Project
+# SPDX-License-Identifier: MIT
+"""Benchmarks of the Basix Python interface.
+
+Each benchmark calls a function repeatedly and records the time per
+call, in seconds. The results are written as JSON, in the same format
+as the C++ benchmarks (main.cpp).
+
+Run the benchmarks with::
+
+    python benchmark.py --output results.json
+
+and compare the results to an earlier run with::
+
+    python benchmark.py --compare baseline.json results.json
+
+which lists the benchmarks whose median time has increased by more than
+the tolerance, and exits with a non-zero code if there are any. The
+results of the C++ benchmarks can be compared in the same way.
+"""
+
+import argparse
+import json
+import sys
+import time
+import typing
+
+import numpy as np
+
+import basix
+
+Params = typing.Dict[str, typing.Union[str, int, bool]]
+
+
+def run(name: str, params: Params, f: typing.Callable[[], typing.Any], min_time: float,
+        num_samples: int) -> typing.Dict[str, typing.Any]:
+    """Time a function.
+
+    The number of calls per sample is chosen so that each sample takes
+    at least ``min_time``.
+    """
+    def timeit(n):
+        t0 = time.perf_counter()
+        for _ in range(n):
+            f()
+        return time.perf_counter() - t0
+
+    n = 1
+    t = timeit(n)
+    while t < min_time:
+        n = max(2 * n, int(1.2 * n * min_time / t)) if t > 0 else 10 * n
+        t = timeit(n)
+    samples = [t / n] + [timeit(n) / n for _ in range(num_samples - 1)]
+    print(name, samples[0], file=sys.stderr)
+    return {"name": name, "params": params, "iterations": n, "samples": samples, "min": min(samples),
+            "median": float(np.median(samples)), "mean": float(np.mean(samples))}
+
+
+def element_params(family: basix.ElementFamily, cell: basix.CellType, degree: int, *args) -> Params:
+    """Parameters describing an element."""
+    return {"family": family.name, "cell": cell.name, "degree": degree}
+
+
+def random_points(cell: basix.CellType, npoints: int) -> np.ndarray:
+    """Random points in a reference cell."""
+    tdim = len(basix.topology(cell)) - 1
+    x = np.random.default_rng(42).random((npoints, tdim))
+    if cell in [basix.CellType.triangle, basix.CellType.tetrahedron]:
+        s = x.sum(axis=1)
+        x[s > 1] /= tdim * s[s > 1, None]
+    return x
+
+
+def random_cell_info(cell: basix.CellType, ncells: int) -> np.ndarray:
+    """Random cell permutation info for a number of cells."""
+    topology = basix.topology(cell)
+    nbits = len(topology[1]) + (3 * len(topology[2]) if len(topology) == 4 else 0)
+    return np.random.default_rng(42).integers(0, 2 ** nbits, ncells, dtype=np.uint32)
+
+
+P, N1E, RT, Regge = basix.ElementFamily.P, basix.ElementFamily.N1E, basix.ElementFamily.RT, basix.ElementFamily.Regge
+triangle, tetrahedron, hexahedron = basix.CellType.triangle, basix.CellType.tetrahedron, basix.CellType.hexahedron
+gll, legendre = basix.LagrangeVariant.gll_warped, basix.LagrangeVariant.legendre
+
+
+def bench_create_element(bench):
+    """Benchmark element creation."""
+    elements = []
+    for k in [1, 3, 5]:
+        elements += [(P, triangle, k, gll), (P, tetrahedron, k, gll)]
+    elements += [(N1E, tetrahedron, k, legendre) for k in [1, 2, 3]]
+    for k in [1, 2]:
+        elements += [(RT, hexahedron, k, legendre), (Regge, tetrahedron, k)]
+    for args in elements:
+        bench("create_element", element_params(*args), lambda: basix.create_element(*args, cache=False))
+
+
+def bench_tabulate(bench):
+    """Benchmark tabulation."""
+    for args in [(P, tetrahedron, 3, gll), (P, hexahedron, 3, gll), (N1E, tetrahedron, 2, legendre)]:
+        e = basix.create_element(*args)
+        for nd in [0, 1, 2]:
+            for npoints in [10, 1000, 10000]:
+                x = random_points(args[1], npoints)
+                out = e.tabulate(nd, x)
+                work = e.tabulate_workspace(nd, npoints)
+                bench("tabulate", {**element_params(*args), "nd": nd, "npoints": npoints},
+                      lambda: e.tabulate(nd, x, out=out, workspace=work))
+
+
+def bench_dof_transformations(bench):
+    """Benchmark DOF transformations."""
+    ncells, bs = 1000, 3
+    for args in [(P, tetrahedron, 5, gll), (N1E, tetrahedron, 3, legendre)]:
+        e = basix.create_element(*args)
+        cell_info = random_cell_info(args[1], ncells)
+        data = np.ones((ncells, e.dim * bs))
+        for name in ["pre_apply_dof_transformation", "post_apply_transpose_dof_transformation",
+                     "pre_apply_inverse_transpose_dof_transformation"]:
+            fn = getattr(e, name)
+            params = {**element_params(*args), "ncells": ncells, "block_size": bs}
+
+            def loop():
+                for c in range(ncells):
+                    fn(data[c], bs, int(cell_info[c]))
+
+            bench(name, {**params, "batched": False}, loop)
+            bench(name, {**params, "batched": True}, lambda: fn(data, bs, cell_info))
+
+
+def bench_maps(bench):
+    """Benchmark push forward and pull back."""
+    npoints = 1000
+    for args in [(N1E, tetrahedron, 2, legendre), (RT, tetrahedron, 2, legendre), (Regge, tetrahedron, 1)]:
+        e = basix.create_element(*args)
+        U = e.tabulate(0, random_points(args[1], npoints))[0]
+
+        # A different Jacobian at each point
+        J = np.eye(3) + 0.3 * np.random.default_rng(42).random((npoints, 3, 3))
+        detJ = np.linalg.det(J)
+        K = np.linalg.inv(J)
+        u = e.push_forward(U, J, detJ, K)
+        U1 = np.empty_like(U)
+
+        params = {**element_params(*args), "npoints": npoints}
+        bench("push_forward", params, lambda: e.push_forward(U, J, detJ, K, out=u))
+        bench("pull_back", params, lambda: e.pull_back(u, J, detJ, K, out=U1))
+
+
+def bench_quadrature(bench):
+    """Benchmark quadrature rules."""
+    for cell in [triangle, tetrahedron, hexahedron]:
+        for m in [4, 10, 20]:
+            bench("make_quadrature", {"cell": cell.name, "degree": m}, lambda: basix.make_quadrature(cell, m))
+
+
+def bench_interpolation(bench):
+    """Benchmark interpolation between elements."""
+    for e0, e1 in [((P, tetrahedron, 2, gll), (P, tetrahedron, 4, gll)),
+                   ((N1E, tetrahedron, 1, legendre), (N1E, tetrahedron, 3, legendre))]:
+        element0 = basix.create_element(*e0)
+        element1 = basix.create_element(*e1)
+        bench("compute_interpolation_operator",
+              {"family": e0[0].name, "cell": e0[1].name, "degree_from": e0[2], "degree_to": e1[2]},
+              lambda: basix.compute_interpolation_operator(element0, element1))
+
+
+benchmarks = [bench_create_element, bench_tabulate, bench_dof_transformations, bench_maps, bench_quadrature,
+              bench_interpolation]
+
+
+def run_benchmarks(quick: bool = False) -> typing.Dict[str, typing.Any]:
+    """Run all benchmarks.
+
+    Args:
+        quick: If `True`, call each function only once. This checks
+            that the benchmarks run, but the timings are not reliable.
+
+    Returns:
+        The results.
+    """
+    min_time, num_samples = (0.0, 1) if quick else (0.2, 5)
+    results: typing.List[typing.Dict[str, typing.Any]] = []
+    for b in benchmarks:
+        b(lambda name, params, f: results.append(run(name, params, f, min_time, num_samples)))
+    return {"basix_version": basix.__version__, "interface": "python", "quick": quick, "benchmarks": results}
+
+
+def compare(baseline: typing.Dict[str, typing.Any], results: typing.Dict[str, typing.Any],
+            tolerance: float) -> typing.List[str]:
+    """Find benchmarks that are slower than a baseline.
+
+    Args:
+        baseline: The baseline results.
+        results: The results to compare.
+        tolerance: The relative increase of the median time that is
+            allowed.
+
+    Returns:
+        A description of each benchmark that is slower than the
+        baseline.
+    """
+    def key(b):
+        return b["name"], json.dumps(b["params"], sort_keys=True)
+
+    base = {key(b): b for b in baseline["benchmarks"]}
+    slower = []
+    for b in results["benchmarks"]:
+        if key(b) in base:
+            ratio = b["median"] / base[key(b)]["median"]
+            if ratio > 1 + tolerance:
+                slower.append(f"{b['name']} {json.dumps(b['params'])}: {ratio:.2f}x slower")
+    return slower
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the Basix benchmarks.")
+    parser.add_argument("--output", help="file to write the results to (default: standard output)")
+    parser.add_argument("--quick", action="store_true", help="call each function only once")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "RESULTS"),
+                        help="compare two result files instead of running the benchmarks")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="allowed relative increase in time when comparing (default: 0.2)")
+    args = parser.parse_args()
+
+    if args.compare is not None:
+        with open(args.compare[0]) as f0, open(args.compare[1]) as f1:
+            slower = compare(json.load(f0), json.load(f1), args.tolerance)
+        for s in slower:
+            print(s)
+        sys.exit(1 if slower else 0)
+
+    output = json.dumps(run_benchmarks(args.quick), indent=2)
+    if args.output is None:
+        print(output)
+    else:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
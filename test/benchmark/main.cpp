@@ -0,0 +1,475 @@
+// Copyright (c) 2024 Basix contributors
+// FEniCS Project
+// SPDX-License-Identifier:    MIT
+
+// Benchmarks of the Basix C++ library.
+//
+// Each benchmark calls a function repeatedly and records the time per
+// call, in seconds. The results are written as JSON in the same format
+// as the Python benchmarks (benchmark.py), which can also be used to
+// compare two sets of results.
+//
+// Usage: basix_benchmark [--quick] [--output FILE]
+//
+// With --quick, each benchmark is called only once. This checks that the
+// benchmarks run, but the timings are not reliable.
+
+#include <algorithm>
+#include <basix/finite-element.h>
+#include <basix/interpolation.h>
+#include <basix/quadrature.h>
+#include <chrono>
+#include <cstdint>
+#include <fstream>
+#include <functional>
+#include <iostream>
+#include <numeric>
+#include <random>
+#include <sstream>
+#include <string>
+#include <vector>
+
+using T = double;
+
+namespace
+{
+template <typename U, std::size_t d>
+using mdspan_t = MDSPAN_IMPL_STANDARD_NAMESPACE::mdspan<
+    U, MDSPAN_IMPL_STANDARD_NAMESPACE::dextents<std::size_t, d>>;
+
+/// Parameters of a benchmark. The values are JSON values.
+using params_t = std::vector<std::pair<std::string, std::string>>;
+
+/// Timings of a benchmark
+struct result
+{
+  std::string name;
+  params_t params;
+  std::size_t iterations;      // Number of calls per sample
+  std::vector<double> samples; // Time per call for each sample
+};
+
+/// Benchmark settings
+struct settings
+{
+  double min_time; // Minimum duration of a sample, in seconds
+  int num_samples; // Number of samples
+};
+
+/// An element used in the benchmarks
+struct element_args
+{
+  basix::element::family family;
+  std::string family_name;
+  basix::cell::type cell;
+  std::string cell_name;
+  int degree;
+  basix::element::lagrange_variant variant;
+};
+
+std::string quote(const std::string& s) { return "\"" + s + "\""; }
+
+params_t element_params(const element_args& e)
+{
+  return {{"family", quote(e.family_name)},
+          {"cell", quote(e.cell_name)},
+          {"degree", std::to_string(e.degree)}};
+}
+
+basix::FiniteElement<T> create(const element_args& e)
+{
+  return basix::create_element<T>(e.family, e.cell, e.degree, e.variant,
+                                  basix::element::dpc_variant::unset, false);
+}
+
+/// Time a function. The number of calls per sample is chosen so that
+/// each sample takes at least `s.min_time`.
+result run(const std::string& name, const params_t& params,
+           const std::function<void()>& f, const settings& s)
+{
+  using clock = std::chrono::steady_clock;
+  auto time = [&f](std::size_t n)
+  {
+    auto t0 = clock::now();
+    for (std::size_t i = 0; i < n; ++i)
+      f();
+    return std::chrono::duration<double>(clock::now() - t0).count();
+  };
+
+  std::size_t n = 1;
+  double t = time(n);
+  while (t < s.min_time)
+  {
+    n = t > 0 ? std::max(2 * n, (std::size_t)(1.2 * n * s.min_time / t))
+              : 10 * n;
+    t = time(n);
+  }
+
+  result r{name, params, n, {t / n}};
+  for (int i = 1; i < s.num_samples; ++i)
+    r.samples.push_back(time(n) / n);
+  std::cerr << name << " " << r.samples.front() << std::endl;
+  return r;
+}
+
+/// Write results as JSON
+std::string to_json(const std::vector<result>& results, bool quick)
+{
+  std::ostringstream out;
+  out.precision(6);
+  out << "{\n  \"basix_version\": " << quote(basix::version())
+      << ",\n  \"interface\": \"c++\",\n  \"quick\": "
+      << (quick ? "true" : "false") << ",\n  \"benchmarks\": [";
+  for (std::size_t i = 0; i < results.size(); ++i)
+  {
+    const result& r = results[i];
+    std::vector<double> samples = r.samples;
+    std::sort(samples.begin(), samples.end());
+    const std::size_t n = samples.size();
+    const double median = (samples[(n - 1) / 2] + samples[n / 2]) / 2;
+    const double mean
+        = std::accumulate(samples.begin(), samples.end(), 0.0) / n;
+
+    out << (i == 0 ? "\n" : ",\n") << "    {\"name\": " << quote(r.name)
+        << ", \"params\": {";
+    for (std::size_t j = 0; j < r.params.size(); ++j)
+    {
+      out << (j == 0 ? "" : ", ") << quote(r.params[j].first) << ": "
+          << r.params[j].second;
+    }
+    out << "}, \"iterations\": " << r.iterations << ", \"samples\": [";
+    for (std::size_t j = 0; j < r.samples.size(); ++j)
+      out << (j == 0 ? "" : ", ") << r.samples[j];
+    out << "], \"min\": " << samples.front() << ", \"median\": " << median
+        << ", \"mean\": " << mean << "}";
+  }
+  out << "\n  ]\n}\n";
+  return out.str();
+}
+
+/// Random points in the reference cell
+std::vector<T> random_points(basix::cell::type cell, std::size_t npoints)
+{
+  const std::size_t tdim = basix::cell::topological_dimension(cell);
+  std::mt19937 rng(42);
+  std::uniform_real_distribution<T> dist(0, 1);
+  std::vector<T> x(npoints * tdim);
+  for (std::size_t p = 0; p < npoints; ++p)
+  {
+    // Scale the point so that it is inside simplex cells
+    T sum = 0;
+    for (std::size_t j = 0; j < tdim; ++j)
+      sum += x[p * tdim + j] = dist(rng);
+    if (sum > 1
+        and (cell == basix::cell::type::triangle
+             or cell == basix::cell::type::tetrahedron))
+    {
+      for (std::size_t j = 0; j < tdim; ++j)
+        x[p * tdim + j] /= tdim * sum;
+    }
+  }
+  return x;
+}
+
+/// Random cell permutation info for a number of cells
+std::vector<std::uint32_t> random_cell_info(basix::cell::type cell,
+                                            std::size_t ncells)
+{
+  const int tdim = basix::cell::topological_dimension(cell);
+  int nbits = basix::cell::num_sub_entities(cell, 1);
+  if (tdim == 3)
+    nbits += 3 * basix::cell::num_sub_entities(cell, 2);
+  std::mt19937 rng(42);
+  std::uniform_int_distribution<std::uint32_t> dist(0, (1u << nbits) - 1);
+  std::vector<std::uint32_t> cell_info(ncells);
+  for (auto& c : cell_info)
+    c = dist(rng);
+  return cell_info;
+}
+
+// Benchmarks
+//-----------------------------------------------------------------------------
+void bench_create_element(std::vector<result>& results, const settings& s)
+{
+  using F = basix::element::family;
+  using C = basix::cell::type;
+  const auto gll = basix::element::lagrange_variant::gll_warped;
+  const auto legendre = basix::element::lagrange_variant::legendre;
+  const auto unset = basix::element::lagrange_variant::unset;
+  std::vector<element_args> elements;
+  for (int k : {1, 3, 5})
+  {
+    elements.push_back({F::P, "P", C::triangle, "triangle", k, gll});
+    elements.push_back({F::P, "P", C::tetrahedron, "tetrahedron", k, gll});
+  }
+  for (int k : {1, 2, 3})
+  {
+    elements.push_back(
+        {F::N1E, "N1E", C::tetrahedron, "tetrahedron", k, legendre});
+  }
+  for (int k : {1, 2})
+  {
+    elements.push_back({F::RT, "RT", C::hexahedron, "hexahedron", k, legendre});
+    elements.push_back(
+        {F::Regge, "Regge", C::tetrahedron, "tetrahedron", k, unset});
+  }
+
+  for (const element_args& e : elements)
+    results.push_back(
+        run("create_element", element_params(e), [&e]() { create(e); }, s));
+}
+//-----------------------------------------------------------------------------
+void bench_tabulate(std::vector<result>& results, const settings& s)
+{
+  using F = basix::element::family;
+  using C = basix::cell::type;
+  const auto gll = basix::element::lagrange_variant::gll_warped;
+  const auto legendre = basix::element::lagrange_variant::legendre;
+  for (const element_args& args : std::vector<element_args>{
+           {F::P, "P", C::tetrahedron, "tetrahedron", 3, gll},
+           {F::P, "P", C::hexahedron, "hexahedron", 3, gll},
+           {F::N1E, "N1E", C::tetrahedron, "tetrahedron", 2, legendre}})
+  {
+    basix::FiniteElement<T> e = create(args);
+    const std::size_t tdim = basix::cell::topological_dimension(args.cell);
+    for (int nd : {0, 1, 2})
+    {
+      for (std::size_t npoints : {10, 1000, 10000})
+      {
+        std::vector<T> x = random_points(args.cell, npoints);
+        std::array<std::size_t, 4> shape = e.tabulate_shape(nd, npoints);
+        std::vector<T> basis(shape[0] * shape[1] * shape[2] * shape[3]);
+        std::vector<T> work(e.tabulate_workspace_size(nd, npoints));
+        params_t params = element_params(args);
+        params.insert(params.end(), {{"nd", std::to_string(nd)},
+                                     {"npoints", std::to_string(npoints)}});
+        results.push_back(run(
+            "tabulate", params,
+            [&]()
+            {
+              e.tabulate(nd, mdspan_t<const T, 2>(x.data(), npoints, tdim),
+                         mdspan_t<T, 4>(basis.data(), shape), work);
+            },
+            s));
+      }
+    }
+  }
+}
+//-----------------------------------------------------------------------------
+void bench_dof_transformations(std::vector<result>& results, const settings& s)
+{
+  using F = basix::element::family;
+  using C = basix::cell::type;
+  const std::size_t ncells = 1000;
+  for (const element_args& args : std::vector<element_args>{
+           {F::P, "P", C::tetrahedron, "tetrahedron", 5,
+            basix::element::lagrange_variant::gll_warped},
+           {F::N1E, "N1E", C::tetrahedron, "tetrahedron", 3,
+            basix::element::lagrange_variant::legendre}})
+  {
+    basix::FiniteElement<T> e = create(args);
+    const std::size_t ndofs = e.dim();
+    const int bs = 3;
+    std::vector<std::uint32_t> cell_info = random_cell_info(args.cell, ncells);
+    std::vector<T> data(ncells * ndofs * bs, 1.0);
+
+    using fn_t = std::function<void(std::span<T>, std::uint32_t)>;
+    using batch_fn_t
+        = std::function<void(std::span<T>, std::span<const std::uint32_t>)>;
+    std::vector<std::tuple<std::string, fn_t, batch_fn_t>> fns
+        = {{"pre_apply_dof_transformation", [&](std::span<T> d, std::uint32_t c)
+            { e.pre_apply_dof_transformation(d, bs, c); },
+            [&](std::span<T> d, std::span<const std::uint32_t> c)
+            { e.pre_apply_dof_transformation(d, bs, c); }},
+           {"post_apply_transpose_dof_transformation",
+            [&](std::span<T> d, std::uint32_t c)
+            { e.post_apply_transpose_dof_transformation(d, bs, c); },
+            [&](std::span<T> d, std::span<const std::uint32_t> c)
+            { e.post_apply_transpose_dof_transformation(d, bs, c); }},
+           {"pre_apply_inverse_transpose_dof_transformation",
+            [&](std::span<T> d, std::uint32_t c)
+            { e.pre_apply_inverse_transpose_dof_transformation(d, bs, c); },
+            [&](std::span<T> d, std::span<const std::uint32_t> c)
+            { e.pre_apply_inverse_transpose_dof_transformation(d, bs, c); }}};
+
+    for (auto& [name, fn, batch_fn] : fns)
+    {
+      params_t params = element_params(args);
+      params.insert(params.end(), {{"ncells", std::to_string(ncells)},
+                                   {"block_size", std::to_string(bs)},
+                                   {"batched", "false"}});
+      results.push_back(run(
+          name, params,
+          [&, fn = fn]()
+          {
+            for (std::size_t c = 0; c < ncells; ++c)
+            {
+              fn(std::span(data.data() + c * ndofs * bs, ndofs * bs),
+                 cell_info[c]);
+            }
+          },
+          s));
+      params.back().second = "true";
+      results.push_back(run(
+          name, params,
+          [&, batch_fn = batch_fn]() { batch_fn(data, cell_info); }, s));
+    }
+  }
+}
+//-----------------------------------------------------------------------------
+void bench_maps(std::vector<result>& results, const settings& s)
+{
+  using F = basix::element::family;
+  using C = basix::cell::type;
+  const auto legendre = basix::element::lagrange_variant::legendre;
+  const std::size_t npoints = 1000;
+  for (const element_args& args : std::vector<element_args>{
+           {F::N1E, "N1E", C::tetrahedron, "tetrahedron", 2, legendre},
+           {F::RT, "RT", C::tetrahedron, "tetrahedron", 2, legendre},
+           {F::Regge, "Regge", C::tetrahedron, "tetrahedron", 1,
+            basix::element::lagrange_variant::unset}})
+  {
+    basix::FiniteElement<T> e = create(args);
+    std::vector<T> x = random_points(args.cell, npoints);
+    auto [U, Ushape]
+        = e.tabulate(0, mdspan_t<const T, 2>(x.data(), npoints, 3));
+    const std::size_t ndofs = Ushape[2];
+    const std::size_t vs = Ushape[3];
+
+    // A different Jacobian at each point
+    std::mt19937 rng(42);
+    std::uniform_real_distribution<T> dist(0, 0.3);
+    std::vector<T> J(npoints * 9), K(npoints * 9), detJ(npoints);
+    for (std::size_t p = 0; p < npoints; ++p)
+    {
+      mdspan_t<T, 2> Jp(J.data() + 9 * p, 3, 3);
+      for (std::size_t i = 0; i < 3; ++i)
+        for (std::size_t j = 0; j < 3; ++j)
+          Jp(i, j) = (i == j) + dist(rng);
+      mdspan_t<T, 2> Kp(K.data() + 9 * p, 3, 3);
+      detJ[p] = Jp(0, 0) * (Jp(1, 1) * Jp(2, 2) - Jp(1, 2) * Jp(2, 1))
+                - Jp(0, 1) * (Jp(1, 0) * Jp(2, 2) - Jp(1, 2) * Jp(2, 0))
+                + Jp(0, 2) * (Jp(1, 0) * Jp(2, 1) - Jp(1, 1) * Jp(2, 0));
+      for (std::size_t i = 0; i < 3; ++i)
+      {
+        for (std::size_t j = 0; j < 3; ++j)
+        {
+          const std::size_t i1 = (j + 1) % 3, i2 = (j + 2) % 3;
+          const std::size_t j1 = (i + 1) % 3, j2 = (i + 2) % 3;
+          Kp(i, j)
+              = (Jp(i1, j1) * Jp(i2, j2) - Jp(i1, j2) * Jp(i2, j1)) / detJ[p];
+        }
+      }
+    }
+
+    mdspan_t<const T, 3> _U(U.data(), npoints, ndofs, vs);
+    mdspan_t<const T, 3> _J(J.data(), npoints, 3, 3);
+    mdspan_t<const T, 3> _K(K.data(), npoints, 3, 3);
+    std::vector<T> u(npoints * ndofs * vs);
+    mdspan_t<T, 3> _u(u.data(), npoints, ndofs, vs);
+    std::vector<T> U1(U.size());
+    mdspan_t<T, 3> _U1(U1.data(), npoints, ndofs, vs);
+    e.push_forward(_U, _J, detJ, _K, _u);
+
+    params_t params = element_params(args);
+    params.push_back({"npoints", std::to_string(npoints)});
+    results.push_back(run(
+        "push_forward", params, [&]() { e.push_forward(_U, _J, detJ, _K, _u); },
+        s));
+    results.push_back(run(
+        "pull_back", params,
+        [&]()
+        {
+          e.pull_back(mdspan_t<const T, 3>(u.data(), npoints, ndofs, vs), _J,
+                      detJ, _K, _U1);
+        },
+        s));
+  }
+}
+//-----------------------------------------------------------------------------
+void bench_quadrature(std::vector<result>& results, const settings& s)
+{
+  using C = basix::cell::type;
+  for (auto [cell, cell_name] :
+       std::vector<std::pair<C, std::string>>{{C::triangle, "triangle"},
+                                              {C::tetrahedron, "tetrahedron"},
+                                              {C::hexahedron, "hexahedron"}})
+  {
+    for (int m : {4, 10, 20})
+    {
+      results.push_back(run(
+          "make_quadrature",
+          {{"cell", quote(cell_name)}, {"degree", std::to_string(m)}},
+          [cell, m]()
+          {
+            basix::quadrature::make_quadrature<T>(
+                basix::quadrature::type::Default, cell,
+                basix::polyset::type::standard, m);
+          },
+          s));
+    }
+  }
+}
+//-----------------------------------------------------------------------------
+void bench_interpolation(std::vector<result>& results, const settings& s)
+{
+  using F = basix::element::family;
+  using C = basix::cell::type;
+  const auto gll = basix::element::lagrange_variant::gll_warped;
+  const auto legendre = basix::element::lagrange_variant::legendre;
+  for (auto& [from, to] : std::vector<std::pair<element_args, element_args>>{
+           {{F::P, "P", C::tetrahedron, "tetrahedron", 2, gll},
+            {F::P, "P", C::tetrahedron, "tetrahedron", 4, gll}},
+           {{F::N1E, "N1E", C::tetrahedron, "tetrahedron", 1, legendre},
+            {F::N1E, "N1E", C::tetrahedron, "tetrahedron", 3, legendre}}})
+  {
+    basix::FiniteElement<T> e0 = create(from);
+    basix::FiniteElement<T> e1 = create(to);
+    results.push_back(run(
+        "compute_interpolation_operator",
+        {{"family", quote(from.family_name)},
+         {"cell", quote(from.cell_name)},
+         {"degree_from", std::to_string(from.degree)},
+         {"degree_to", std::to_string(to.degree)}},
+        [&]() { basix::compute_interpolation_operator(e0, e1); }, s));
+  }
+}
+//-----------------------------------------------------------------------------
+} // namespace
+
+int main(int argc, char* argv[])
+{
+  bool quick = false;
+  std::string output;
+  for (int i = 1; i < argc; ++i)
+  {
+    std::string arg = argv[i];
+    if (arg == "--quick")
+      quick = true;
+    else if (arg == "--output" and i + 1 < argc)
+      output = argv[++i];
+    else
+    {
+      std::cerr << "Usage: " << argv[0] << " [--quick] [--output FILE]"
+                << std::endl;
+      return 1;
+    }
+  }
+
+  const settings s = quick ? settings{0.0, 1} : settings{0.2, 5};
+  std::vector<result> results;
+  bench_create_element(results, s);
+  bench_tabulate(results, s);
+  bench_dof_transformations(results, s);
+  bench_maps(results, s);
+  bench_quadrature(results, s);
+  bench_interpolation(results, s);
+
+  const std::string json = to_json(results, quick);
+  if (output.empty())
+    std::cout << json;
+  else
+    std::ofstream(output) << json;
+
+  return 0;
+}
@@ -0,0 +1,37 @@
+# Copyright (c) 2024 Basix contributors
+# FEniCS Project
+# SPDX-License-Identifier: MIT
+
+import importlib.util
+import json
+import os
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def benchmark():
+    path = os.path.join(os.path.dirname(os.path.realpath(__file__)), "benchmark", "benchmark.py")
+    spec = importlib.util.spec_from_file_location("benchmark", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_run_benchmarks(benchmark):
+    results = json.loads(json.dumps(benchmark.run_benchmarks(quick=True)))
+    assert results["interface"] == "python"
+    names = {b["name"] for b in results["benchmarks"]}
+    assert names == {"create_element", "tabulate", "pre_apply_dof_transformation",
+                     "post_apply_transpose_dof_transformation", "pre_apply_inverse_transpose_dof_transformation",
+                     "push_forward", "pull_back", "make_quadrature", "compute_interpolation_operator"}
+    for b in results["benchmarks"]:
+        assert b["iterations"] == 1
+        assert len(b["samples"]) == 1
+        assert b["min"] == b["median"] == b["mean"] > 0
+
+    assert benchmark.compare(results, results, 0.0) == []
+    slower = json.loads(json.dumps(results))
+    slower["benchmarks"][0]["median"] *= 2
+    assert len(benchmark.compare(results, slower, 0.5)) == 1
+    assert benchmark.compare(results, slower, 1.5) == []
@@ -128,6 +128,51 @@ def test_raviart_thomas_triangle_degree1():
     assert np.allclose(rt.base_transformations(), element.base_transformations())
 
 
+@pytest.mark.parametrize("nderivs", [0, 1, 2])
+def test_dual_matrix(nderivs):
+    """Test the dual matrix of an element whose DOFs are defined using derivatives."""
+    degree, npts = 4, 20
+    rng = np.random.default_rng(7)
+    ndofs = 2 * basix.polynomials.dim(basix.PolynomialType.legendre, basix.CellType.triangle, degree)
+    nd = (nderivs + 1) * (nderivs + 2) // 2
+    wcoeffs = np.eye(ndofs)
+    pts = rng.random((npts, 2)) / 2
+    z = np.zeros((0, 2))
+    x = [[z, z, z], [z, z, z], [pts], []]
+    z = np.zeros((0, 2, 0, nd))
+    M = [[z, z, z], [z, z, z], [rng.random((ndofs, 2, npts, nd))], []]
+    element = basix.create_custom_element(basix.CellType.triangle, [2], wcoeffs, x, M, nderivs,
+                                          basix.MapType.identity, basix.SobolevSpace.L2, True, -1,
+                                          degree, basix.PolysetType.standard)
+
+    P = basix.polynomials.tabulate_polynomial_set(basix.CellType.triangle, basix.PolysetType.standard, degree,
+                                                  nderivs, pts)
+    D = np.einsum("ijkl,lmk->ijm", M[2][0], P).reshape(ndofs, -1)
+    assert np.allclose(element.dual_matrix, D.T)
+
+
+def test_orthogonalise_wcoeffs():
+    """Test that wcoeffs is orthonormalised row by row, as by the Gram-Schmidt process."""
+    degree = 6
+    rng = np.random.default_rng(3)
+    ndofs = basix.polynomials.dim(basix.PolynomialType.legendre, basix.CellType.triangle, degree)
+    wcoeffs = np.tril(rng.random((ndofs, ndofs))) + np.diag(10.0 ** rng.integers(-3, 3, ndofs))
+    pts = rng.random((ndofs, 2)) / 2
+    z = np.zeros((0, 2))
+    x = [[z, z, z], [z, z, z], [pts], []]
+    z = np.zeros((0, 1, 0, 1))
+    M = [[z, z, z], [z, z, z], [np.eye(ndofs).reshape(ndofs, 1, ndofs, 1)], []]
+    element = basix.create_custom_element(basix.CellType.triangle, [], wcoeffs, x, M, 0,
+                                          basix.MapType.identity, basix.SobolevSpace.L2, True, -1,
+                                          degree, basix.PolysetType.standard)
+
+    q, r = np.linalg.qr(wcoeffs.T)
+    q *= np.sign(np.diag(r))
+    P = basix.polynomials.tabulate_polynomial_set(basix.CellType.triangle, basix.PolysetType.standard, degree, 0,
+                                                  pts)[0]
+    assert np.allclose(element.dual_matrix, q.T @ P)
+
+
 def create_lagrange1_quad(cell_type=basix.CellType.quadrilateral, degree=1, wcoeffs=None, x=None, M=None,
                           value_shape=None, interpolation_nderivs=0, discontinuous=False):
     """Attempt to create a Lagrange 1 element on a quad."""
@@ -62,6 +62,35 @@ def test_post_apply(cell_type, element_type, degree, element_args):
         assert np.allclose(data1.transpose(), data2)
 
 
+@parametrize_over_elements(3)
+def test_batched(cell_type, element_type, degree, element_args):
+    e = basix.create_element(element_type, cell_type, degree, *element_args)
+    rng = np.random.default_rng(42)
+    ncells, block_size = 50, 2
+    cell_info = rng.integers(2**30, size=ncells, dtype=np.uint32)
+    for name, shape in [("pre_apply_dof_transformation", (e.dim, block_size)),
+                        ("post_apply_transpose_dof_transformation", (block_size, e.dim)),
+                        ("pre_apply_inverse_transpose_dof_transformation", (e.dim, block_size))]:
+        data = rng.random((ncells, ) + shape)
+        expected = data.copy()
+        for c in range(ncells):
+            d = expected[c].reshape(-1)
+            getattr(e, name)(d, block_size, cell_info[c])
+        getattr(e, name)(data, block_size, cell_info)
+        assert np.allclose(data, expected)
+        getattr(e, name)(data, block_size, list(cell_info))
+
+    with pytest.raises(RuntimeError):
+        e.pre_apply_dof_transformation(np.zeros((ncells - 1, e.dim, block_size)), block_size, cell_info)
+
+    # The data is transformed in place, so is not converted
+    with pytest.raises(TypeError):
+        e.pre_apply_dof_transformation(np.zeros((ncells, e.dim, block_size), order="F"), block_size, cell_info)
+    with pytest.raises(TypeError):
+        e.post_apply_transpose_dof_transformation(np.zeros((ncells, block_size, e.dim), dtype=np.float32),
+                                                  block_size, cell_info)
+
+
 @parametrize_over_elements(5, basix.CellType.interval)
 def test_interval_transformation_size(element_type, degree, element_args):
     e = basix.create_element(element_type, basix.CellType.interval, degree, *element_args)
@@ -465,3 +494,28 @@ def test_transformation_of_tabulated_data_pyramid(element_type, degree, element_
                 j_slice = j[:, d]
                 assert np.allclose((bt[9].dot(i_slice))[start: start + ndofs],
                                    j_slice[start: start + ndofs])
+
+
+@pytest.mark.parametrize("element_type, cell_type, element_args", [
+    (basix.ElementFamily.P, basix.CellType.tetrahedron, [basix.LagrangeVariant.gll_warped]),
+    (basix.ElementFamily.P, basix.CellType.prism, [basix.LagrangeVariant.gll_warped]),
+    (basix.ElementFamily.N1E, basix.CellType.tetrahedron, [basix.LagrangeVariant.legendre]),
+    (basix.ElementFamily.N1E, basix.CellType.hexahedron, [basix.LagrangeVariant.legendre])])
+def test_face_orientations(cell_type, element_type, element_args):
+    e = basix.create_element(element_type, cell_type, 3, *element_args)
+    topology = basix.topology(cell_type)
+    nedges = len(topology[1])
+    bt = e.base_transformations()
+    for f in range(len(topology[2])):
+        rotate, reflect = bt[nedges + 2 * f], bt[nedges + 2 * f + 1]
+        for v in range(8 if len(topology[2][f]) == 4 else 6):
+            T = np.linalg.matrix_power(rotate, v >> 1) @ np.linalg.matrix_power(reflect, v & 1)
+            data = np.eye(e.dim).reshape(-1)
+            e.pre_apply_dof_transformation(data, e.dim, v << (3 * f))
+            assert np.allclose(data.reshape(e.dim, e.dim), T)
+            data = np.eye(e.dim).reshape(-1)
+            e.post_apply_transpose_dof_transformation(data, e.dim, v << (3 * f))
+            assert np.allclose(data.reshape(e.dim, e.dim), T.T)
+            data = np.eye(e.dim).reshape(-1)
+            e.pre_apply_inverse_transpose_dof_transformation(data, e.dim, v << (3 * f))
+            assert np.allclose(data.reshape(e.dim, e.dim), np.linalg.inv(T).T)
@@ -0,0 +1,201 @@
+# Copyright (c) 2024 Basix contributors
+# FEniCS Project
+# SPDX-License-Identifier: MIT
+
+import pickle
+
+import numpy as np
+import pytest
+
+import basix
+from basix.finite_element import (ElementCachePolicy, clear_element_cache, deserialize_element, element_cache_info,
+                                  get_element_cache_directory, get_element_cache_policy, load_element, save_element,
+                                  set_element_cache_capacity, set_element_cache_directory, set_element_cache_policy)
+
+
+@pytest.fixture
+def cache():
+    info = element_cache_info()
+    policy = get_element_cache_policy()
+    directory = get_element_cache_directory()
+    clear_element_cache()
+    yield
+    clear_element_cache()
+    set_element_cache_capacity(info.maxsize)
+    set_element_cache_policy(policy)
+    set_element_cache_directory(directory)
+
+
+def check_same_element(e0, e1):
+    assert e0 == e1
+    assert e0.dtype == e1.dtype
+    assert e0.dim == e1.dim
+    pts = basix.create_lattice(e0.cell_type, 3, basix.LatticeType.equispaced, True).astype(e0.dtype)
+    assert np.array_equal(e0.tabulate(1, pts), e1.tabulate(1, pts))
+    assert np.array_equal(e0.base_transformations(), e1.base_transformations())
+    assert e0.entity_dofs == e1.entity_dofs
+    assert e0.has_tensor_product_factorisation == e1.has_tensor_product_factorisation
+    if e0.has_tensor_product_factorisation:
+        f0, f1 = e0.get_tensor_product_representation(), e1.get_tensor_product_representation()
+        assert [p for _, p in f0] == [p for _, p in f1]
+        assert [e for e, _ in f0] == [e for e, _ in f1]
+
+
+def test_hits_and_misses(cache):
+    e0 = basix.create_element(basix.ElementFamily.N1E, basix.CellType.tetrahedron, 3)
+    e1 = basix.create_element(basix.ElementFamily.N1E, basix.CellType.tetrahedron, 3)
+    assert element_cache_info()[:4] == (1, 1, 0, 1)
+    assert e0 == e1
+    assert e0._e is e1._e
+
+    # Different dtype, variant and dof ordering are different elements
+    e2 = basix.create_element(basix.ElementFamily.N1E, basix.CellType.tetrahedron, 3, dtype=np.float32)
+    assert e2.dtype == np.float32
+    basix.create_element(basix.ElementFamily.N1E, basix.CellType.tetrahedron, 3, basix.LagrangeVariant.legendre)
+    basix.create_element(basix.ElementFamily.P, basix.CellType.triangle, 2, dof_ordering=[0, 3, 5, 1, 2, 4])
+    basix.create_element(basix.ElementFamily.P, basix.CellType.triangle, 2)
+    basix.create_element(basix.ElementFamily.P, basix.CellType.triangle, 2, discontinuous=True)
+    assert element_cache_info()[:4] == (1, 6, 0, 6)
+
+    # Bypass the cache
+    e3 = basix.create_element(basix.ElementFamily.N1E, basix.CellType.tetrahedron, 3, cache=False)
+    assert e3 == e0
+    assert e3._e is not e0._e
+    assert element_cache_info()[:4] == (1, 6, 0, 6)
+
+
+@pytest.mark.parametrize("policy, evicted", [(ElementCachePolicy.lru, 1), (ElementCachePolicy.fifo, 0)])
+def test_eviction(cache, policy, evicted):
+    set_element_cache_policy(policy)
+    assert get_element_cache_policy() == policy
+    set_element_cache_capacity(2)
+    degrees = [1, 2]
+    for d in degrees:
+        basix.create_element(basix.ElementFamily.P, basix.CellType.triangle, d)
+    basix.create_element(basix.ElementFamily.P, basix.CellType.triangle, 1)
+    basix.create_element(basix.ElementFamily.N1E, basix.CellType.triangle, 1)
+    info = element_cache_info()
+    assert info == (1, 3, 1, 2, 2, 0)
+
+    # Check which element was evicted
+    basix.create_element(basix.ElementFamily.P, basix.CellType.triangle, degrees[1 - evicted])
+    assert element_cache_info().hits == 2
+
+    set_element_cache_capacity(1)
+    assert element_cache_info().currsize == 1
+    set_element_cache_capacity(0)
+    assert element_cache_info().currsize == 0
+    basix.create_element(basix.ElementFamily.P, basix.CellType.triangle, 1)
+    assert element_cache_info().currsize == 0
+
+
+def test_invalid_element(cache):
+    with pytest.raises(RuntimeError):
+        basix.create_element(basix.ElementFamily.P, basix.CellType.triangle, -1)
+    assert element_cache_info().currsize == 0
+
+
+@pytest.mark.parametrize("family, cell, degree, args", [
+    (basix.ElementFamily.P, basix.CellType.hexahedron, 2, (basix.LagrangeVariant.gll_warped, )),
+    (basix.ElementFamily.N1E, basix.CellType.tetrahedron, 2, ()),
+    (basix.ElementFamily.Regge, basix.CellType.triangle, 1, ()),
+    (basix.ElementFamily.DPC, basix.CellType.quadrilateral, 2,
+     (basix.LagrangeVariant.unset, basix.DPCVariant.diagonal_gll, True)),
+])
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_serialize(family, cell, degree, args, dtype):
+    e = basix.create_element(family, cell, degree, *args, dtype=dtype, cache=False)
+    data = e.serialize()
+    assert isinstance(data, bytes)
+    check_same_element(e, deserialize_element(data, dtype))
+    check_same_element(e, pickle.loads(pickle.dumps(e)))
+
+    with pytest.raises(RuntimeError):
+        deserialize_element(data, np.float64 if dtype == np.float32 else np.float32)
+    with pytest.raises(RuntimeError):
+        deserialize_element(data[:-1], dtype)
+    with pytest.raises(RuntimeError):
+        deserialize_element(data + b"\0", dtype)
+    with pytest.raises(RuntimeError):
+        deserialize_element(b"\0" + data[1:], dtype)
+
+    # Shapes that do not match the size of their data are rejected
+    shape = np.array(e.points.shape, dtype=np.uint64).tobytes()
+    i = data.index(e.points.tobytes() + shape) + e.points.nbytes
+    for bad in [(e.points.shape[0] + 1, e.points.shape[1]), (2**63, 2)]:
+        with pytest.raises(RuntimeError):
+            deserialize_element(data[:i] + np.array(bad, dtype=np.uint64).tobytes() + data[i + len(shape):], dtype)
+
+
+def test_save_and_load(tmp_path):
+    e = basix.create_element(basix.ElementFamily.N1E, basix.CellType.triangle, 2, cache=False)
+    save_element(tmp_path / "e.basix", e)
+    check_same_element(e, load_element(tmp_path / "e.basix"))
+    with pytest.raises(RuntimeError):
+        load_element(tmp_path / "missing.basix")
+
+
+def test_save_failure(cache, tmp_path):
+    e = basix.create_element(basix.ElementFamily.N1E, basix.CellType.triangle, 2, cache=False)
+    (tmp_path / "e.basix").mkdir()
+    with pytest.raises(RuntimeError):
+        save_element(tmp_path / "e.basix", e)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["e.basix"]
+
+    # A failure to write to the cache directory does not prevent the
+    # element from being used, and leaves no temporary files
+    directory = tmp_path / "elements"
+    set_element_cache_directory(directory)
+    e0 = basix.create_element(basix.ElementFamily.P, basix.CellType.triangle, 2)
+    [f] = directory.iterdir()
+    f.unlink()
+    f.mkdir()
+    clear_element_cache()
+    check_same_element(e0, basix.create_element(basix.ElementFamily.P, basix.CellType.triangle, 2))
+    assert list(directory.iterdir()) == [f]
+
+
+def test_disk_cache(cache, tmp_path):
+    directory = tmp_path / "elements"
+    assert get_element_cache_directory() is None
+    set_element_cache_directory(directory)
+    assert get_element_cache_directory() == directory
+    assert directory.is_dir()
+
+    e0 = basix.create_element(basix.ElementFamily.N1E, basix.CellType.tetrahedron, 2)
+    basix.create_element(basix.ElementFamily.P, basix.CellType.triangle, 2, dof_ordering=[0, 3, 5, 1, 2, 4])
+    files = sorted(directory.iterdir())
+    assert len(files) == 2
+    assert element_cache_info().disk_hits == 0
+
+    # Elements that are not in memory are loaded from disk
+    clear_element_cache()
+    e1 = basix.create_element(basix.ElementFamily.N1E, basix.CellType.tetrahedron, 2)
+    check_same_element(e0, e1)
+    assert element_cache_info()[:4] == (0, 1, 0, 1)
+    assert element_cache_info().disk_hits == 1
+
+    # Damaged files are replaced
+    clear_element_cache()
+    for f in files:
+        f.write_bytes(b"not an element")
+    e2 = basix.create_element(basix.ElementFamily.N1E, basix.CellType.tetrahedron, 2)
+    check_same_element(e0, e2)
+    assert element_cache_info().disk_hits == 0
+    clear_element_cache()
+    basix.create_element(basix.ElementFamily.N1E, basix.CellType.tetrahedron, 2)
+    assert element_cache_info().disk_hits == 1
+
+    # Files that contain a different element are replaced
+    clear_element_cache()
+    for f in files:
+        save_element(f, basix.create_element(basix.ElementFamily.P, basix.CellType.triangle, 1, cache=False))
+    e3 = basix.create_element(basix.ElementFamily.N1E, basix.CellType.tetrahedron, 2)
+    check_same_element(e0, e3)
+    assert element_cache_info().disk_hits == 0
+    clear_element_cache()
+    basix.create_element(basix.ElementFamily.N1E, basix.CellType.tetrahedron, 2)
+    assert element_cache_info().disk_hits == 1
+
+    set_element_cache_directory(None)
+    assert get_element_cache_directory() is None
@@ -86,3 +86,62 @@ def test_mappings_3d_to_3d(element_type, element_args):
     detJ = np.linalg.det(J)
     K = np.linalg.inv(J)
     run_map_test(e, J, detJ, K, e.value_size, e.value_size)
+
+
+def l2_piola_element(dtype):
+    wcoeffs = np.eye(3, dtype=dtype)
+    z = np.zeros((0, 2), dtype=dtype)
+    x = [[np.array([[0., 0.]], dtype=dtype), np.array([[1., 0.]], dtype=dtype), np.array([[0., 1.]], dtype=dtype)],
+         [z, z, z], [z], []]
+    z = np.zeros((0, 1, 0, 1), dtype=dtype)
+    M = [[np.ones((1, 1, 1, 1), dtype=dtype)] * 3, [z, z, z], [z], []]
+    return basix.create_custom_element(basix.CellType.triangle, [], wcoeffs, x, M, 0, basix.MapType.L2Piola,
+                                       basix.SobolevSpace.L2, False, 1, 1, basix.PolysetType.standard)
+
+
+@pytest.mark.parametrize("element_type, element_args", elements + [(None, None)])
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_mappings_non_affine(element_type, element_args, dtype):
+    if element_type is None:
+        e = l2_piola_element(dtype)
+    else:
+        e = basix.create_element(element_type, basix.CellType.triangle, 2, *element_args, dtype=dtype)
+    rng = np.random.default_rng(7)
+    points = basix.create_lattice(basix.CellType.triangle, 4, basix.LatticeType.equispaced, True).astype(e.dtype)
+    values = e.tabulate(0, points)[0]
+
+    # A different Jacobian at each (cell, point)
+    ncells, npoints = 3, points.shape[0]
+    J = (np.eye(2) + 0.3 * rng.random((ncells, npoints, 2, 2))).astype(e.dtype)
+    detJ = np.linalg.det(J)
+    K = np.linalg.inv(J)
+    U = np.broadcast_to(values, (ncells, ) + values.shape).copy()
+
+    mapped = e.push_forward(U, J, detJ, K)
+    assert mapped.shape[:3] == (ncells, npoints, e.dim)
+    out = np.empty_like(mapped)
+    assert e.push_forward(U, J, detJ, K, out=out) is out
+    assert np.array_equal(out, mapped)
+    for c in range(ncells):
+        for p in range(npoints):
+            expected = e.push_forward(U[c, p][None], J[c, p][None], detJ[c, p][None], K[c, p][None])[0]
+            assert np.allclose(mapped[c, p], expected)
+
+    unmapped = np.empty_like(U)
+    e.pull_back(mapped, J, detJ, K, out=unmapped)
+    assert np.allclose(unmapped, U, atol=1e-5)
+    assert np.allclose(e.pull_back(mapped, J, detJ, K), unmapped)
+
+    with pytest.raises(RuntimeError):
+        e.push_forward(U, J, detJ, K, out=np.empty_like(mapped[:, :, :-1]))
+
+    # Output arrays are not converted, as the result would be lost
+    other = np.float64 if e.dtype == np.float32 else np.float32
+    with pytest.raises(TypeError):
+        e.push_forward(U, J, detJ, K, out=np.empty_like(mapped, dtype=other))
+    with pytest.raises(TypeError):
+        e.pull_back(mapped, J, detJ, K, out=np.empty_like(U, dtype=other))
+    with pytest.raises(TypeError):
+        e.push_forward(U, J, detJ, K, out=np.empty_like(mapped, order="F"))
+    with pytest.raises(TypeError):
+        e._e.push_forward_out(U[0], J[0], detJ[0], K[0], np.empty_like(mapped[0], order="F"))
@@ -116,3 +116,89 @@ def test_dof_transformations_to_transpose(cell, element, degree, block_size, ele
         # Reshape numba output for comparison
         data2 = data2.reshape(-1)
         assert np.allclose(data1, data2)
+
+
+@pytest.mark.parametrize("cell", [basix.CellType.interval, basix.CellType.triangle, basix.CellType.tetrahedron,
+                                  basix.CellType.quadrilateral, basix.CellType.hexahedron, basix.CellType.prism])
+@pytest.mark.parametrize("element, degree, element_args", [
+    (basix.ElementFamily.P, 1, [basix.LagrangeVariant.gll_warped]),
+    (basix.ElementFamily.P, 4, [basix.LagrangeVariant.gll_warped]),
+    (basix.ElementFamily.N1E, 3, [])
+])
+@pytest.mark.parametrize("block_size", [1, 3])
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_dof_transformations_batched(cell, element, degree, element_args, block_size, dtype):
+    try:
+        import numba  # noqa: F401
+    except ImportError:
+        pytest.skip("Numba must be installed to run this test.")
+
+    from basix import numba_helpers
+
+    try:
+        e = basix.create_element(element, cell, degree, *element_args)
+    except RuntimeError:
+        pytest.skip("Element not supported on this cell.")
+    matrices, entities = numba_helpers.pack_dof_transformations(e)
+
+    rng = np.random.default_rng(1337)
+    ncells = 20
+    cell_info = rng.integers(0, 2 ** 30, ncells, dtype=np.uint32)
+    data = rng.random((ncells, e.dim * block_size))
+
+    expected = data.copy()
+    e.pre_apply_dof_transformation(expected, block_size, cell_info)
+    data1 = data.reshape(ncells, e.dim, block_size).astype(dtype)
+    numba_helpers.pre_apply_dof_transformation_batched(matrices, entities, data1, cell_info)
+    assert np.allclose(data1.reshape(ncells, -1), expected, rtol=1e-5, atol=1e-5)
+
+    expected = data.copy()
+    e.post_apply_transpose_dof_transformation(expected, block_size, cell_info)
+    data2 = data.reshape(ncells, block_size, e.dim).astype(dtype)
+    numba_helpers.post_apply_transpose_dof_transformation_batched(matrices, entities, data2, cell_info)
+    assert np.allclose(data2.reshape(ncells, -1), expected, rtol=1e-5, atol=1e-5)
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.complex128])
+def test_dof_transformations_dtypes(dtype):
+    try:
+        import numba  # noqa: F401
+    except ImportError:
+        pytest.skip("Numba must be installed to run this test.")
+
+    from numba import from_dtype
+    from numba.core import types
+    from numba.typed import Dict
+
+    from basix import numba_helpers
+
+    e = basix.create_element(basix.ElementFamily.N1E, basix.CellType.tetrahedron, 2)
+    real_dtype = np.empty(0, dtype=dtype).real.dtype
+    entity_transformations = Dict.empty(key_type=types.string, value_type=from_dtype(real_dtype)[:, :, :])
+    for i, transformation in e.entity_transformations().items():
+        entity_transformations[i] = transformation.astype(real_dtype)
+    entity_dofs = Dict.empty(key_type=types.int64, value_type=types.int32[:])
+    for i, e_dofs in enumerate(e.num_entity_dofs):
+        entity_dofs[i] = np.asarray(e_dofs, dtype=np.int32)
+
+    data = np.arange(e.dim * 2, dtype=np.float64)
+    for cell_info in [0, 5, 12345, 2 ** 20 - 1]:
+        expected = data.copy()
+        e.pre_apply_dof_transformation(expected, 2, cell_info)
+        data1 = data.astype(dtype).reshape(e.dim, 2)
+        numba_helpers.pre_apply_dof_transformation_tetrahedron(entity_transformations, entity_dofs, data1, cell_info)
+        assert np.allclose(data1.reshape(-1), expected, rtol=1e-5)
+
+
+def test_precompile():
+    try:
+        import numba  # noqa: F401
+    except ImportError:
+        pytest.skip("Numba must be installed to run this test.")
+
+    from basix import numba_helpers
+
+    numba_helpers.precompile([basix.CellType.interval], [np.float64])
+    assert len(numba_helpers.pre_apply_dof_transformation_interval.signatures) > 0
+    assert len(numba_helpers.post_apply_transpose_dof_transformation_interval.signatures) > 0
+    assert len(numba_helpers.pre_apply_dof_transformation_batched.signatures) > 0
@@ -147,3 +147,26 @@ def test_macroedge(cell_type, order):
         for j in range(ndofs):
             mat[i, j] = sum(basis[i, :] * basis[j, :] * Qwts)
     assert np.allclose(mat, np.eye(ndofs))
+
+
+@pytest.mark.parametrize("cell_type", [
+    basix.CellType.interval,
+    basix.CellType.triangle,
+    basix.CellType.quadrilateral,
+    basix.CellType.tetrahedron,
+    basix.CellType.hexahedron,
+    basix.CellType.prism,
+    basix.CellType.pyramid,
+])
+@pytest.mark.parametrize("ptype", [basix.PolysetType.standard, basix.PolysetType.macroedge])
+def test_many_points(cell_type, ptype):
+    # Many points are tabulated in tiles of points. Check that this
+    # agrees with tabulating at each point separately.
+    if ptype == basix.PolysetType.macroedge and cell_type in [basix.CellType.prism, basix.CellType.pyramid]:
+        pytest.skip()
+    tdim = len(basix.topology(cell_type)) - 1
+    pts = np.random.default_rng(3).random((2003, tdim)) / tdim
+    basis = basix.polynomials.tabulate_polynomial_set(cell_type, ptype, 1, 2, pts)
+    for i in [0, 1, 1000, 2002]:
+        basis_i = basix.polynomials.tabulate_polynomial_set(cell_type, ptype, 1, 2, pts[i:i + 1])
+        assert np.allclose(basis[:, :, i], basis_i[:, :, 0])
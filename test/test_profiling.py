@@ -0,0 +1,76 @@
+# Copyright (c) 2024 Basix contributors
+# FEniCS Project
+# SPDX-License-Identifier: MIT
+
+import numpy as np
+import pytest
+
+import basix
+
+
+@pytest.fixture
+def profiling():
+    basix.profiling.reset()
+    basix.profiling.enable()
+    yield
+    basix.profiling.disable()
+    basix.profiling.reset()
+
+
+def test_construction(profiling):
+    basix.create_element(basix.ElementFamily.N1E, basix.CellType.tetrahedron, 2, basix.LagrangeVariant.legendre,
+                         cache=False)
+    timings = basix.profiling.get_timings()
+    for name in ["create_element", "FiniteElement::FiniteElement", "compute_dual_matrix", "polyset::tabulate",
+                 "math::orthogonalise", "moments::make_integral_moments", "moments::make_tangent_integral_moments",
+                 "doftransforms::compute_entity_transformations"]:
+        count, time = timings[name]
+        assert count > 0
+        assert time >= 0.0
+
+    # Times are inclusive
+    assert timings["create_element"][0] == 1
+    assert timings["FiniteElement::FiniteElement"][1] <= timings["create_element"][1]
+
+
+def test_kernels(profiling):
+    e = basix.create_element(basix.ElementFamily.N1E, basix.CellType.tetrahedron, 2, basix.LagrangeVariant.legendre)
+    basix.profiling.reset()
+
+    x = np.random.default_rng(3).random((20, 3)) / 3
+    U = e.tabulate(1, x)[0]
+    e.tabulate(0, x)
+    J = np.broadcast_to(np.eye(3), (x.shape[0], 3, 3))
+    detJ = np.ones(x.shape[0])
+    e.pull_back(e.push_forward(U, J, detJ, J), J, detJ, J)
+    e.pre_apply_dof_transformation(np.ones((4, e.dim)), 1, np.arange(4, dtype=np.uint32))
+
+    timings = basix.profiling.get_timings()
+    assert timings["FiniteElement::tabulate"][0] == 2
+    assert timings["FiniteElement::push_forward"][0] == 1
+    assert timings["FiniteElement::pull_back"][0] == 1
+    assert timings["FiniteElement::dof_transformations"][0] == 1
+    assert "create_element" not in timings
+
+
+def test_enable_disable_reset():
+    basix.profiling.reset()
+    assert not basix.profiling.is_enabled()
+    basix.create_element(basix.ElementFamily.P, basix.CellType.triangle, 2, cache=False)
+    assert basix.profiling.get_timings() == {}
+
+    basix.profiling.enable()
+    try:
+        assert basix.profiling.is_enabled()
+        basix.create_element(basix.ElementFamily.P, basix.CellType.triangle, 2, cache=False)
+    finally:
+        basix.profiling.disable()
+    timings = basix.profiling.get_timings()
+    assert timings["create_element"][0] > 0
+
+    # Timings are kept when profiling is disabled
+    basix.create_element(basix.ElementFamily.P, basix.CellType.triangle, 2, cache=False)
+    assert basix.profiling.get_timings() == timings
+
+    basix.profiling.reset()
+    assert basix.profiling.get_timings() == {}
@@ -95,8 +95,8 @@ def test_qorder_tet(m, scheme):
 def test_quadrature_function():
     Qpts, Qwts = basix.make_quadrature(basix.CellType.interval, 3)
     # Scale to interval [0.0, 2.0]
-    Qpts *= 2.0
-    Qwts *= 2.0
+    Qpts = 2.0 * Qpts
+    Qwts = 2.0 * Qwts
 
     def f(x):
         return x * x
@@ -141,3 +141,28 @@ def test_gll():
     assert (np.allclose(wts, ref_wts3))
     assert np.isclose((pts * wts.reshape(-1, 1)).sum(), 0)
     assert np.isclose(sum(wts), 8)
+
+
+@pytest.mark.parametrize("celltype", [basix.CellType.interval, basix.CellType.triangle, basix.CellType.hexahedron])
+@pytest.mark.parametrize("m", [2, 12])
+def test_cached_quadrature(celltype, m):
+    pts0, wts0 = basix.make_quadrature(celltype, m)
+    pts1, wts1 = basix.make_quadrature(celltype, m)
+    assert np.shares_memory(pts0, pts1)
+    assert np.shares_memory(wts0, wts1)
+    assert not pts0.flags.writeable
+    assert not wts0.flags.writeable
+    with pytest.raises(ValueError):
+        pts0[0, 0] = 1.0
+
+    # The arrays remain valid after other rules are created
+    del pts1, wts1
+    basix.make_quadrature(celltype, m + 1)
+    assert np.isclose(sum(wts0), basix.cell.volume(celltype))
+
+
+def test_cached_default_quadrature():
+    # The default rule is cached as the rule it resolves to
+    pts0, _ = basix.make_quadrature(basix.CellType.quadrilateral, 4)
+    pts1, _ = basix.make_quadrature(basix.CellType.quadrilateral, 4, rule=basix.QuadratureType.gauss_jacobi)
+    assert np.shares_memory(pts0, pts1)
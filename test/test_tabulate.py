@@ -0,0 +1,146 @@
+# Copyright (c) 2024 Basix contributors
+# FEniCS Project
+# SPDX-License-Identifier: MIT
+
+import numpy as np
+import pytest
+
+import basix
+
+elements = [
+    (basix.ElementFamily.P, basix.CellType.triangle, 3, [basix.LagrangeVariant.gll_warped]),
+    (basix.ElementFamily.P, basix.CellType.hexahedron, 2, [basix.LagrangeVariant.gll_warped]),
+    (basix.ElementFamily.N1E, basix.CellType.tetrahedron, 2, [basix.LagrangeVariant.legendre]),
+    (basix.ElementFamily.RT, basix.CellType.quadrilateral, 2, [basix.LagrangeVariant.legendre]),
+    (basix.ElementFamily.Regge, basix.CellType.tetrahedron, 1, []),
+]
+
+
+@pytest.mark.parametrize("family, cell_type, degree, args", elements)
+@pytest.mark.parametrize("nd", [0, 1, 2])
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_tabulate_batch(family, cell_type, degree, args, nd, dtype):
+    e = basix.create_element(family, cell_type, degree, *args, dtype=dtype)
+    tdim = len(basix.topology(cell_type)) - 1
+
+    rng = np.random.default_rng(13)
+    ncells, npoints = 5, 7
+    x = rng.random((ncells, npoints, tdim)).astype(dtype)
+
+    tab = e.tabulate_batch(nd, x)
+    assert tab.shape == (ncells, ) + e.tabulate(nd, x[0]).shape
+    assert tab.dtype == dtype
+    for c in range(ncells):
+        assert np.allclose(tab[c], e.tabulate(nd, x[c]), atol=1e-5)
+
+    out = np.zeros_like(tab)
+    result = e.tabulate_batch(nd, x, out=out)
+    assert result is out
+    assert np.allclose(out, tab)
+
+
+def test_tabulate_batch_dof_ordering():
+    e = basix.create_element(basix.ElementFamily.P, basix.CellType.triangle, 2, dof_ordering=[0, 3, 5, 1, 2, 4])
+    x = np.random.default_rng(3).random((4, 3, 2))
+    tab = e.tabulate_batch(1, x)
+    for c in range(x.shape[0]):
+        assert np.allclose(tab[c], e.tabulate(1, x[c]))
+
+
+def test_tabulate_batch_wrong_shape():
+    e = basix.create_element(basix.ElementFamily.P, basix.CellType.triangle, 1)
+    x = np.zeros((2, 3, 2))
+    with pytest.raises(RuntimeError):
+        e.tabulate_batch(0, x, out=np.zeros((2, 1, 3, 4, 1)))
+    with pytest.raises(RuntimeError):
+        e.tabulate_batch(0, np.zeros((2, 3, 3)))
+
+
+@pytest.mark.parametrize("family, cell_type, degree, args", elements)
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_tabulate_workspace(family, cell_type, degree, args, dtype):
+    e = basix.create_element(family, cell_type, degree, *args, dtype=dtype)
+    tdim = len(basix.topology(cell_type)) - 1
+    x = np.random.default_rng(5).random((6, tdim)).astype(dtype)
+
+    work = e.tabulate_workspace(2, x.shape[0])
+    assert work.dtype == dtype
+    for nd in range(3):
+        tab = e.tabulate(nd, x)
+        out = np.zeros_like(tab)
+        result = e.tabulate(nd, x, out=out, workspace=work)
+        assert result is out
+        assert np.allclose(out, tab)
+        # Fewer points than the workspace was sized for
+        assert np.allclose(e.tabulate(nd, x[:2], workspace=work), tab[:, :2], atol=1e-5)
+
+    batch = e.tabulate_batch(1, x.reshape(2, 3, tdim), workspace=work)
+    tab = e.tabulate(1, x)
+    for c in range(2):
+        assert np.allclose(batch[c], tab[:, 3 * c:3 * c + 3], atol=1e-5)
+
+
+@pytest.mark.parametrize("family, cell_type, degree, args", elements)
+def test_tabulate_workspace_many_points(family, cell_type, degree, args):
+    e = basix.create_element(family, cell_type, degree, *args)
+    tdim = len(basix.topology(cell_type)) - 1
+    x = np.random.default_rng(7).random((3000, tdim))
+
+    # The polynomial set is tabulated in tiles of points using the
+    # workspace, which must give the same result as few points at a time
+    work = e.tabulate_workspace(2, x.shape[0])
+    for nd in range(3):
+        tab = e.tabulate(nd, x, workspace=work, num_threads=1)
+        for i in range(0, x.shape[0], 500):
+            assert np.allclose(tab[:, i:i + 5], e.tabulate(nd, x[i:i + 5]))
+
+
+def test_tabulate_workspace_too_small():
+    e = basix.create_element(basix.ElementFamily.P, basix.CellType.triangle, 2)
+    x = np.random.default_rng(5).random((4, 2))
+    with pytest.raises(RuntimeError):
+        e.tabulate(1, x, workspace=e.tabulate_workspace(1, 3))
+    with pytest.raises(RuntimeError):
+        e.tabulate(2, x, workspace=e.tabulate_workspace(1, 4))
+
+
+@pytest.fixture
+def restore_num_threads():
+    num_threads = basix.parallel.get_num_threads()
+    yield
+    basix.parallel.set_num_threads(num_threads)
+
+
+@pytest.mark.parametrize("family, cell_type, degree, args", elements)
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_tabulate_threads(family, cell_type, degree, args, dtype, restore_num_threads):
+    e = basix.create_element(family, cell_type, degree, *args, dtype=dtype)
+    tdim = len(basix.topology(cell_type)) - 1
+    rng = np.random.default_rng(11)
+
+    # Enough points for several blocks
+    x = rng.random((5000, tdim)).astype(dtype)
+    tab = e.tabulate(1, x, num_threads=1)
+    for num_threads in [2, 3, 4]:
+        assert np.array_equal(e.tabulate(1, x, num_threads=num_threads), tab)
+    assert np.allclose(e.tabulate(1, x[:100]), tab[:, :100], atol=1e-5)
+
+    # Batches of cells with few points and with many points
+    for shape in [(300, 20), (3, 2100)]:
+        xb = rng.random(shape + (tdim, )).astype(dtype)
+        tab = e.tabulate_batch(1, xb, num_threads=1)
+        out = np.empty_like(tab)
+        e.tabulate_batch(1, xb, out=out, workspace=e.tabulate_workspace(1, shape[0] * shape[1]), num_threads=4)
+        assert np.array_equal(out, tab)
+        assert np.allclose(tab[-1], e.tabulate(1, xb[-1]), atol=1e-5)
+
+    # The default number of threads
+    basix.parallel.set_num_threads(3)
+    assert basix.parallel.get_num_threads() == 3
+    assert np.array_equal(e.tabulate(1, x), e.tabulate(1, x, num_threads=1))
+    p = basix.polynomials.tabulate_polynomial_set(cell_type, basix.PolysetType.standard, 4, 2, x)
+    basix.parallel.set_num_threads(1)
+    assert np.array_equal(p, basix.polynomials.tabulate_polynomial_set(cell_type, basix.PolysetType.standard, 4, 2, x))
+
+    with pytest.raises(RuntimeError):
+        basix.parallel.set_num_threads(-1)
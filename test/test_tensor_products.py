@@ -217,3 +217,52 @@ def test_dof_ordering(cell_type, family, args, degree):
     e2 = basix.create_element(family, cell_type, degree, *args, dof_ordering=perm)
     for i, j in enumerate(e2.get_tensor_product_representation()[0][1]):
         assert i == j
+
+
+@pytest.mark.parametrize("cell_type", [basix.CellType.quadrilateral, basix.CellType.hexahedron])
+@pytest.mark.parametrize("degree", range(1, 5))
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_sum_factorisation(cell_type, degree, dtype):
+    e = basix.create_element(basix.ElementFamily.P, cell_type, degree, basix.LagrangeVariant.gll_warped,
+                             dtype=dtype)
+    tdim = len(basix.topology(cell_type)) - 1
+    perm = e.get_tensor_product_representation()[0][1]
+
+    # Tensor product of 1D Gauss-Jacobi points
+    pts1d, _ = basix.make_quadrature(basix.CellType.interval, 2 * degree + 2)
+    pts1d = pts1d[:, 0].astype(dtype)
+    npts = pts1d.shape[0]
+    x1d = np.repeat(pts1d.reshape(-1, 1), tdim, axis=1)
+    pts = np.array(list(product(pts1d, repeat=tdim)), dtype=dtype)
+
+    phi = e.tabulate_tensor_factors(1, x1d)
+    assert phi.shape == (tdim, 2, npts, degree + 1)
+    assert phi.dtype == dtype
+
+    tab = e.tabulate(1, pts)
+    u = np.random.default_rng(4).random(e.dim).astype(dtype)
+    u_tp = u[perm]
+
+    # Values and derivatives at the points
+    v = basix.sum_factorisation.evaluate([phi[k, 0] for k in range(tdim)], u_tp)
+    assert v.shape == (npts, ) * tdim
+    assert np.allclose(v.reshape(-1), tab[0, :, :, 0] @ u, atol=1e-4)
+    for d in range(tdim):
+        ds = [0] * tdim
+        ds[d] = 1
+        dv = basix.sum_factorisation.evaluate([phi[k, ds[k]] for k in range(tdim)], u_tp)
+        assert np.allclose(dv.reshape(-1), tab[basix.index(*ds), :, :, 0] @ u, atol=1e-4)
+
+    # Transpose, as used in assembly
+    w = np.random.default_rng(5).random(npts ** tdim).astype(dtype)
+    r = basix.sum_factorisation.evaluate_transpose([phi[k, 0] for k in range(tdim)], w)
+    assert r.shape == (degree + 1, ) * tdim
+    assert np.allclose(r.reshape(-1), (tab[0, :, :, 0].T @ w)[perm], atol=1e-4)
+
+
+def test_sum_factorisation_no_factors():
+    e = basix.create_element(basix.ElementFamily.P, basix.CellType.triangle, 2)
+    with pytest.raises(RuntimeError):
+        e.tabulate_tensor_factors(0, np.zeros((3, 2)))
+    with pytest.raises(RuntimeError):
+        basix.sum_factorisation.evaluate([np.zeros((3, 2)), np.zeros((3, 2))], np.zeros(5))
@@ -0,0 +1,108 @@
+# Copyright (c) 2024 Basix contributors
+# FEniCS Project
+# SPDX-License-Identifier: MIT
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+import basix
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_shared_element(dtype):
+    e = basix.create_element(basix.ElementFamily.N1E, basix.CellType.tetrahedron, 3, basix.LagrangeVariant.legendre,
+                             dtype=dtype)
+    rng = np.random.default_rng(17)
+    points = [rng.random((rng.integers(1, 3000), 3)).astype(dtype) for _ in range(64)]
+    expected = [e.tabulate(1, x) for x in points]
+
+    def tabulate(i):
+        x = points[i]
+        tab = e.tabulate(1, x, num_threads=1 + i % 3)
+        out = np.empty_like(tab)
+        e.tabulate(1, x, out=out, workspace=e.tabulate_workspace(1, x.shape[0]))
+        J = np.broadcast_to(np.eye(3, dtype=dtype), (x.shape[0], 3, 3))
+        detJ = np.ones(x.shape[0], dtype=dtype)
+        mapped = e.push_forward(tab[0], J, detJ, J)
+        return tab, out, e.pull_back(mapped, J, detJ, J)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(tabulate, range(len(points))))
+
+    for (tab, out, unmapped), ref in zip(results, expected):
+        assert np.array_equal(tab, ref)
+        assert np.array_equal(out, ref)
+        assert np.allclose(unmapped, ref[0])
+
+
+def test_concurrent_creation():
+    args = [(basix.ElementFamily.P, basix.CellType.triangle, k, basix.LagrangeVariant.gll_warped)
+            for k in range(1, 6)] + [(basix.ElementFamily.RT, basix.CellType.hexahedron, 2,
+                                      basix.LagrangeVariant.legendre)]
+    expected = [basix.create_element(*a, cache=False) for a in args]
+
+    def create(i):
+        a = args[i % len(args)]
+        e = basix.create_element(*a)
+        q = basix.make_quadrature(a[1], 2 * a[2])
+        lattice = basix.create_lattice(a[1], 4, basix.LatticeType.equispaced, True)
+        p = basix.polynomials.tabulate_polynomial_set(a[1], basix.PolysetType.standard, a[2], 1, lattice)
+        return e, q, p, basix.compute_interpolation_operator(e, e)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(create, range(4 * len(args))))
+
+    for i, (e, q, p, op) in enumerate(results):
+        a = args[i % len(args)]
+        assert e == expected[i % len(args)]
+        assert np.array_equal(q[0], basix.make_quadrature(a[1], 2 * a[2])[0])
+        lattice = basix.create_lattice(a[1], 4, basix.LatticeType.equispaced, True)
+        p_ref = basix.polynomials.tabulate_polynomial_set(a[1], basix.PolysetType.standard, a[2], 1, lattice)
+        assert np.array_equal(p, p_ref)
+        assert np.allclose(op, np.eye(e.dim))
+
+
+@pytest.mark.parametrize(
+    "family, cell, degree, variants",
+    [
+        (basix.ElementFamily.N1E, basix.CellType.tetrahedron, 3, [basix.LagrangeVariant.legendre]),
+        (basix.ElementFamily.N2E, basix.CellType.tetrahedron, 3, [basix.LagrangeVariant.legendre]),
+        (basix.ElementFamily.RT, basix.CellType.hexahedron, 2, [basix.LagrangeVariant.legendre]),
+        (basix.ElementFamily.Regge, basix.CellType.tetrahedron, 2, []),
+        (basix.ElementFamily.serendipity, basix.CellType.hexahedron, 4,
+         [basix.LagrangeVariant.legendre, basix.DPCVariant.legendre]),
+        (basix.ElementFamily.BDM, basix.CellType.hexahedron, 2,
+         [basix.LagrangeVariant.legendre, basix.DPCVariant.legendre]),
+        (basix.ElementFamily.N2E, basix.CellType.hexahedron, 4,
+         [basix.LagrangeVariant.legendre, basix.DPCVariant.legendre]),
+        (basix.ElementFamily.HHJ, basix.CellType.triangle, 2, []),
+    ],
+)
+def test_parallel_creation(family, cell, degree, variants):
+    expected = basix.create_element(family, cell, degree, *variants, cache=False)
+    basix.parallel.set_num_threads(4)
+    try:
+        e = basix.create_element(family, cell, degree, *variants, cache=False)
+    finally:
+        basix.parallel.set_num_threads(1)
+
+    assert e == expected
+    assert np.array_equal(e.wcoeffs, expected.wcoeffs)
+    assert np.array_equal(e.dual_matrix, expected.dual_matrix)
+    assert np.array_equal(e.coefficient_matrix, expected.coefficient_matrix)
+    assert np.array_equal(e.base_transformations(), expected.base_transformations())
+    for x, x_ref in zip(e.x, expected.x):
+        for a, b in zip(x, x_ref):
+            assert np.array_equal(a, b)
+    for m, m_ref in zip(e.M, expected.M):
+        for a, b in zip(m, m_ref):
+            assert np.array_equal(a, b)
+
+    rng = np.random.default_rng(3)
+    for cell_info in rng.integers(2**30, size=8):
+        d, d_ref = np.arange(e.dim * 2, dtype=np.float64), np.arange(e.dim * 2, dtype=np.float64)
+        e.pre_apply_dof_transformation(d, 2, int(cell_info))
+        expected.pre_apply_dof_transformation(d_ref, 2, int(cell_info))
+        assert np.array_equal(d, d_ref)
@@ -54,6 +54,63 @@ def test_tensor_element_hash(inputs):
     assert hash(sym) != hash(asym)
 
 
+@pytest.mark.parametrize("shape", [(2, ), (3, ), (2, 2), (2, 3), (2, 1, 3)])
+def test_blocked_element_tabulate(shape):
+    sub = basix.ufl.element("Lagrange", "tetrahedron", 2)
+    e = basix.ufl.blocked_element(sub, shape=shape)
+    points = np.array([[0.1, 0.2, 0.3], [0.4, 0.1, 0.2], [0.0, 0.5, 0.5]])
+    table = e.tabulate(1, points)
+    sub_table = sub.tabulate(1, points)
+    assert table.shape == (4, 3, *shape, e.dim)
+
+    # Basis function i * block_size + b is sub element function i in
+    # component b
+    flat = table.reshape(4, 3, e.block_size, sub.dim, e.block_size)
+    for c in range(e.block_size):
+        for b in range(e.block_size):
+            assert np.array_equal(flat[:, :, c, :, b], sub_table if b == c else np.zeros_like(sub_table))
+
+    out = np.full_like(table, 7.0)
+    assert e.tabulate(1, points, out=out) is out
+    assert np.array_equal(out, table)
+    with pytest.raises(ValueError):
+        e.tabulate(1, points, out=np.empty((4, 3, e.dim)))
+
+
+def test_symmetric_blocked_element_tabulate():
+    sub = basix.ufl.element("Lagrange", "triangle", 1)
+    e = basix.ufl.blocked_element(sub, shape=(2, 2), symmetry=True)
+    points = np.array([[0.2, 0.3]])
+    table = e.tabulate(0, points)
+    sub_table = sub.tabulate(0, points)
+    assert table.shape == (1, 1, 2, 2, e.dim)
+    for (i, j), b in [((0, 0), 0), ((0, 1), 1), ((1, 0), 1), ((1, 1), 2)]:
+        expected = np.zeros((1, 1, sub.dim, 3))
+        expected[:, :, :, b] = sub_table
+        assert np.array_equal(table[:, :, i, j].reshape(expected.shape), expected)
+
+
+def test_mixed_element_tabulate():
+    e0 = basix.ufl.element("Lagrange", "triangle", 2)
+    e1 = basix.ufl.element("Lagrange", "triangle", 1)
+    e = basix.ufl.mixed_element([e0, e1])
+    points = np.array([[0.1, 0.2], [0.4, 0.1], [0.0, 0.5]])
+    table = e.tabulate(1, points)
+    assert table.shape == (3, 3, 2 * e.dim)
+
+    # Sub element functions are written to every value_size-th column
+    expected = np.zeros_like(table)
+    expected[:, :, 0:2 * e0.dim:2] = e0.tabulate(1, points)
+    expected[:, :, 2 * e0.dim::2] = e1.tabulate(1, points)
+    assert np.array_equal(table, expected)
+
+    out = np.full_like(table, 7.0)
+    assert e.tabulate(1, points, out=out) is out
+    assert np.array_equal(out, table)
+    with pytest.raises(ValueError):
+        e.tabulate(1, points, out=np.empty((3, 3, e.dim)))
+
+
 @pytest.mark.parametrize("elements", [
     [basix.ufl.element("Lagrange", "triangle", 1), basix.ufl.element("Bubble", "triangle", 3)],
     [basix.ufl.element("Lagrange", "quadrilateral", 1), basix.ufl.element("Bubble", "quadrilateral", 2)],
@@ -159,3 +216,18 @@ def test_real_element_eq_hash(cell_type, value_shape):
     e1 = basix.ufl.real_element("triangle", ())
     e2 = basix.ufl.real_element(cell_type, value_shape)
     assert (e1 == e2) == (hash(e1) == hash(e2))
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_custom_element_signature(dtype):
+    e = basix.create_element(basix.ElementFamily.N1E, basix.CellType.triangle, 2, basix.LagrangeVariant.legendre,
+                             dtype=dtype)
+
+    def custom(M):
+        return basix.create_custom_element(e.cell_type, list(e.value_shape), e.wcoeffs, e.x, M, 0, e.map_type,
+                                           e.sobolev_space, False, e.embedded_subdegree, e.embedded_superdegree,
+                                           e.polyset_type)
+
+    s0 = basix.ufl._compute_signature(custom(e.M))
+    assert s0 == basix.ufl._compute_signature(custom([[m.copy() for m in M] for M in e.M]))
+    assert s0 != basix.ufl._compute_signature(custom([[2 * m for m in M] for M in e.M]))